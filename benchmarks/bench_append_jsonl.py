@@ -0,0 +1,29 @@
+"""Benchmark: records per second when appending and scanning"""
+import os
+
+from py_basic_commands.json_scripts.append_jsonl    import append_jsonl
+from py_basic_commands.json_scripts.json_backend    import json_backends
+from py_basic_commands.json_scripts.read_jsonl      import read_jsonl
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    record_amnt = 200_000
+    records = [{'id': i, 'event': 'click', 'user': f'user {i % 1000}', 'value': i / 7} for i in range(record_amnt)]
+
+    with TemporaryDirectory() as tmp_dir:
+        for backend in json_backends():
+            file_path = os.path.join(tmp_dir, f'{backend}.jsonl')
+            for batch_size in (1, 1000):
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                time_start = perf_counter()
+                append_jsonl(records, file_path, batch_size=batch_size, backend=backend, do_print=False)
+                append_time = perf_counter() - time_start
+                print(f'{backend:>6} append (batch {batch_size:>4}): {record_amnt / append_time:12,.0f} records/s')
+
+            time_start = perf_counter()
+            count = sum(1 for _ in read_jsonl(file_path, backend=backend, do_print=False))
+            scan_time = perf_counter() - time_start
+            print(f'{backend:>6} scan:                {count / scan_time:12,.0f} records/s')
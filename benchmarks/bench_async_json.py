@@ -0,0 +1,52 @@
+"""Benchmark: event loop latency while hundreds of files are read, blocking and async"""
+import asyncio
+import json
+import os
+
+from py_basic_commands.async_scripts.async_json import aread_many
+from py_basic_commands.json_scripts.read_json   import read_json
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+async def measure_latency(stop:asyncio.Event, interval:float=0.001) -> list[float]:
+    """Measures how late the event loop wakes a sleeping task"""
+    latencies = []
+    while not stop.is_set():
+        time_start = perf_counter()
+        await asyncio.sleep(interval)
+        latencies.append(perf_counter() - time_start - interval)
+    return latencies
+
+
+async def run(file_paths:list[str], mode:str):
+    stop = asyncio.Event()
+    latency_task = asyncio.create_task(measure_latency(stop))
+    await asyncio.sleep(0)
+
+    time_start = perf_counter()
+    if mode == 'blocking':
+        for file_path in file_paths:
+            read_json(file_path, do_print=False)
+    else:
+        await aread_many(file_paths, do_print=False)
+    read_time = perf_counter() - time_start
+
+    stop.set()
+    latencies = sorted(await latency_task)
+    max_latency = latencies[-1] if latencies else read_time
+    median_latency = latencies[len(latencies) // 2] if latencies else read_time
+    print(f'{mode:>8}: read {len(file_paths)} files in {read_time:.3f} s, loop latency median {median_latency * 1e3:6.2f} ms, max {max_latency * 1e3:8.2f} ms, ticks {len(latencies)}')
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for i in range(500):
+            file_path = os.path.join(tmp_dir, f'file_{i}.json')
+            with open(file_path, 'w') as f:
+                json.dump({'id': i, 'records': [{'value': k, 'name': f'name {k}'} for k in range(2000)]}, f)
+            file_paths.append(file_path)
+
+        for mode in ('blocking', 'async'):
+            asyncio.run(run(file_paths, mode))
@@ -0,0 +1,30 @@
+"""Benchmark: write and read speed and size of a JSON text with every codec and a few levels"""
+import json
+import os
+
+from py_basic_commands.file_dir_scripts.compression import compressed_open
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    text = json.dumps([{'id': i, 'name': f'user {i}', 'email': f'user{i}@example.com', 'score': i / 7, 'tags': ['a', 'b']} for i in range(200_000)], indent=4)
+    size_mb = len(text) / 1e6
+    print(f'{size_mb:.1f} MB of JSON text')
+
+    with TemporaryDirectory() as tmp_dir:
+        for compression, levels in ((None, (None,)), ('gzip', (1, 6, 9)), ('bz2', (1, 9)), ('xz', (0, 6))):
+            for level in levels:
+                file_path = os.path.join(tmp_dir, 'data.json')
+                time_start = perf_counter()
+                with compressed_open(file_path, 'w', compression=compression, compresslevel=level) as f:
+                    f.write(text)
+                write_time = perf_counter() - time_start
+
+                time_start = perf_counter()
+                with compressed_open(file_path, 'r', compression=compression) as f:
+                    assert f.read() == text
+                read_time = perf_counter() - time_start
+
+                ratio = os.path.getsize(file_path) / len(text)
+                print(f'{compression or "none":>5} level={level!s:<4}: write {size_mb / write_time:7.1f} MB/s, read {size_mb / read_time:7.1f} MB/s, size {ratio:6.1%}')
@@ -0,0 +1,50 @@
+"""Stress test: N processes appending to the same json file at the same time, with and without locking"""
+import os
+
+from py_basic_commands.json_scripts.json_editor import JsonEditor, JsonConflictError
+from multiprocessing    import Pool
+from tempfile           import TemporaryDirectory
+from time               import perf_counter, sleep
+
+
+def append_worker(file_path:str, worker_id:int, round_amnt:int, lock:bool, on_conflict:str, journal:bool) -> tuple[int, int]:
+    """Opens the json file `round_amnt` times, appending one item each time
+
+    Returns
+    -------
+    tuple[int, int]
+        The amount of conflicts (JsonConflictError) and merges the worker got"""
+    conflict_amnt = merge_amnt = 0
+    for i in range(round_amnt):
+        while True:
+            try:
+                with JsonEditor(file_path, lock=lock, on_conflict=on_conflict, journal=journal) as json_editor:
+                    json_editor.append('items', f'{worker_id}-{i}')
+                    # Some work between reading and writing, so the workers overlap
+                    sleep(0.001)
+                merge_amnt += json_editor.write_stats['merged']
+                break
+            except JsonConflictError:
+                # Fail fast, and try again with the new data
+                conflict_amnt += 1
+    return conflict_amnt, merge_amnt
+
+
+if __name__ == '__main__':
+    worker_amnt = 8
+    round_amnt = 50
+
+    with TemporaryDirectory() as tmp_dir:
+        for lock, on_conflict, journal in ((False, 'error', False), (True, 'error', False), (True, 'merge', False), (True, 'merge', True)):
+            file_path = os.path.join(tmp_dir, f'stress_{lock}_{on_conflict}_{journal}.json')
+            with open(file_path, 'w') as f:
+                f.write('{"items": []}')
+
+            time_start = perf_counter()
+            with Pool(worker_amnt) as pool:
+                results = pool.starmap(append_worker, [(file_path, worker_id, round_amnt, lock, on_conflict, journal) for worker_id in range(worker_amnt)])
+            stress_time = perf_counter() - time_start
+
+            items = JsonEditor(file_path, exit_write=False, journal=journal)['items']
+            print(f'lock={lock!s:<5} on_conflict={on_conflict:<5} journal={journal!s:<5}: {len(set(items)):>4}/{worker_amnt * round_amnt} appends kept, '
+                  f'{sum(result[0] for result in results):>4} conflicts, {sum(result[1] for result in results):>4} merges, {worker_amnt * round_amnt / stress_time:8,.0f} appends/s')
@@ -0,0 +1,25 @@
+"""Benchmark: serialize and parse small, medium and large documents with every installed backend"""
+from py_basic_commands.json_scripts.json_backend import get_json_backend, json_backends
+from time   import perf_counter
+
+
+def make_doc(record_amnt:int) -> dict:
+    return {'records': [{'id': i, 'name': f'user {i}', 'score': i / 3, 'active': i % 2 == 0, 'tags': ['a', 'b', 'ä']} for i in range(record_amnt)]}
+
+
+if __name__ == '__main__':
+    for size_name, record_amnt, repeat in (('small', 10, 10_000), ('medium', 1_000, 100), ('large', 100_000, 3)):
+        doc = make_doc(record_amnt)
+        for name in json_backends():
+            backend = get_json_backend(name)
+            time_start = perf_counter()
+            for _ in range(repeat):
+                text = backend.dumps(doc, indent=4)
+            dumps_time = (perf_counter() - time_start) / repeat
+
+            time_start = perf_counter()
+            for _ in range(repeat):
+                backend.loads(text)
+            loads_time = (perf_counter() - time_start) / repeat
+
+            print(f'{size_name:>6} {name:>6}: dumps {dumps_time * 1e3:9.3f} ms, loads {loads_time * 1e3:9.3f} ms')
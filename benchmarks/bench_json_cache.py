@@ -0,0 +1,33 @@
+"""Benchmark: reading the same config files over and over, with and without the cache"""
+import os
+
+from py_basic_commands.json_scripts.json_backend    import json_backends
+from py_basic_commands.json_scripts.json_cache      import json_cache, _RACY_NS
+from py_basic_commands.json_scripts.read_json       import ReadJson
+from tempfile   import TemporaryDirectory
+from time       import perf_counter, sleep
+
+
+read_json = ReadJson(do_print=False)
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for i in range(20):
+            file_path = os.path.join(tmp_dir, f'config_{i}.json')
+            with open(file_path, 'w') as f:
+                f.write(repr({'name': f'config {i}', 'options': {f'option_{k}': k for k in range(i * 50)}, 'hosts': [f'host-{k}' for k in range(100)]}).replace("'", '"'))
+            file_paths.append(file_path)
+        # Files written within the last seconds are not cached yet
+        sleep(_RACY_NS / 1e9)
+
+        for backend in json_backends():
+            for cache in (False, True, 'frozen'):
+                json_cache.clear()
+                time_start = perf_counter()
+                for _ in range(500):
+                    for file_path in file_paths:
+                        read_json(file_path, cache=cache, backend=backend)
+                read_time = perf_counter() - time_start
+                print(f'{backend:>6} cache={cache!s:<6}: {500 * len(file_paths) / read_time:10,.0f} reads/s  {json_cache.stats()}')
@@ -0,0 +1,38 @@
+"""Benchmark: sum, filter and group-by over a million records, looping in Python and on columns"""
+from py_basic_commands.json_scripts.json_columns import to_columns
+from time import perf_counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+if __name__ == '__main__':
+    record_amnt = 1_000_000
+    records = [{'id': i, 'price': (i % 1000) / 10, 'amount': i % 7, 'paid': i % 3 != 0, 'country': f'c{i % 20}'} for i in range(record_amnt)]
+
+    time_start = perf_counter()
+    total = sum(record['price'] * record['amount'] for record in records if record['paid'])
+    by_amount:dict[int, float] = {}
+    for record in records:
+        by_amount[record['amount']] = by_amount.get(record['amount'], 0) + record['price']
+    print(f'python loops:      {(perf_counter() - time_start) * 1e3:8.1f} ms')
+
+    for use_numpy in ((False, True) if np is not None else (False,)):
+        time_start = perf_counter()
+        columns = to_columns(records, ['price', 'amount', 'paid'], use_numpy=use_numpy)
+        convert_time = perf_counter() - time_start
+
+        price, amount, paid = columns['price'].values, columns['amount'].values, columns['paid'].values
+        time_start = perf_counter()
+        if use_numpy:
+            total = float((price * amount)[paid].sum())
+            by_amount = dict(enumerate(np.bincount(amount, weights=price).tolist())) # type: ignore
+        else:
+            # Without NumPy, the columns still save the dict lookups of every record
+            total = sum(p * a for p, a, is_paid in zip(price, amount, paid) if is_paid)
+            by_amount = {}
+            for a, p in zip(amount, price):
+                by_amount[a] = by_amount.get(a, 0) + p
+        print(f'{"numpy" if use_numpy else "array.array"} columns: {(perf_counter() - time_start) * 1e3:8.1f} ms (+ {convert_time * 1e3:.1f} ms to make the columns)')
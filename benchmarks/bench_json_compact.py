@@ -0,0 +1,50 @@
+"""Benchmark: memory of a large array of records, loaded as is and compact"""
+import gc
+import json
+import os
+import tracemalloc
+
+from py_basic_commands.json_scripts.json_backend    import json_backends, get_json_backend
+from py_basic_commands.json_scripts.json_compact    import COMPACT_LEVELS, compact_load
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+from typing     import Any
+
+
+def measure(load_func:Any, file_path:str) -> tuple[float, float, float]:
+    """Returns the time (without tracing), and the memory kept and the peak memory of a load, in MB"""
+    gc.collect()
+    time_start = perf_counter()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        load_func(f)
+    load_time = perf_counter() - time_start
+
+    gc.collect()
+    tracemalloc.start()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = load_func(f)
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return load_time, kept / 1e6, peak / 1e6
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'records.json')
+        statuses = ['active', 'inactive', 'banned', 'pending']
+        with open(file_path, 'w') as f:
+            json.dump([{
+                'id': i, 'name': f'user {i}', 'status': statuses[i % 4], 'country': f'country {i % 50}',
+                'score': i / 7, 'age': 20 + i % 50, 'verified': i % 3 == 0, 'group': f'group {i % 20}',
+                'history': [i + k for k in range(10)], 'created': '2024-01-01', 'updated': '2024-06-01',
+                **{f'field_{k}': k * i for k in range(9)},
+            } for i in range(100_000)], f)
+        print(f'{os.path.getsize(file_path) / 1e6:.1f} MB file, 100000 records with 20 keys')
+
+        for name in json_backends():
+            load_time, kept, peak = measure(get_json_backend(name).load, file_path)
+            print(f'{name:>14}: {load_time * 1e3:7.0f} ms, {kept:7.1f} MB kept, {peak:7.1f} MB peak')
+        for level in COMPACT_LEVELS:
+            load_time, kept, peak = measure(lambda f: compact_load(f, level), file_path)
+            print(f'{"compact=" + str(level):>14}: {load_time * 1e3:7.0f} ms, {kept:7.1f} MB kept, {peak:7.1f} MB peak')
@@ -0,0 +1,119 @@
+"""Benchmarks of `JsonEditor`: appending, searching, removing, getting, saving, diffing and opening"""
+import gc
+import os
+
+from py_basic_commands.json_scripts.json_editor import JsonEditor
+from py_basic_commands.json_scripts.write_json  import write_json
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+def bench_append(tmp_dir:str):
+    """Append throughput should stay the same as the document grows"""
+    json_editor = JsonEditor(os.path.join(tmp_dir, 'append_bench.json'), exit_write=False)
+    for i in range(5):
+        json_editor[f'filler_{i}'] = {f'key_{k}': {'value': k} for k in range(20_000)}
+        # Leave the garbage collector (which slows down with every object) out of the measurement
+        gc.disable()
+        time_start = perf_counter()
+        for j in range(10_000):
+            json_editor.append(f'list_{j % 100}', {'id': j, 'key': f'key_{i}_{j}'})
+        append_time = perf_counter() - time_start
+        gc.enable()
+        print(f'append, {len(json_editor.keypaths(False)):>6} keypaths: {10_000 / append_time:12,.0f} appends/s')
+
+
+def bench_find_value(tmp_dir:str):
+    """Searching values with and without the value index"""
+    json_editor = JsonEditor(os.path.join(tmp_dir, 'find_bench.json'), exit_write=False)
+    json_editor.new_dict({f'key_{i}': [{'id': i, 'group': f'group_{i % 100}'} for _ in range(5)] for i in range(20_000)})
+    for value_index in (True, False):
+        json_editor.value_index = value_index
+        json_editor.invalidate_indexes()
+        for search in ('first', 'repeated'):
+            time_start = perf_counter()
+            path_amnt = len(json_editor.find_value_path_all('group_7'))
+            print(f'find value, value_index={value_index!s:<5} {search:>8}: {perf_counter() - time_start:8.4f} s ({path_amnt} paths)')
+
+
+def bench_remove(tmp_dir:str):
+    """Removing the empty values of a document with a million values, and 100k duplicates at once and one by one (a part of them)"""
+    json_editor = JsonEditor(os.path.join(tmp_dir, 'prune_bench.json'), exit_write=False)
+    json_editor.new_dict({f'key_{i}': {'id': i, 'empty': {'none': None, 'list': [[], {}]}, 'values': [i, None, {}, [None]], 'name': ''} for i in range(100_000)})
+    count_values = lambda value: 1 + sum(map(count_values, value.values() if isinstance(value, dict) else value)) if isinstance(value, (dict, list)) else 1
+    node_amnt = count_values(json_editor.b_json_data.dict()) - 1
+    time_start = perf_counter()
+    removed_amnt = json_editor.remove_empty_values()
+    print(f'remove empty values, {node_amnt:,} values: {perf_counter() - time_start:8.4f} s ({removed_amnt:,} removed)')
+
+    make_doc = lambda: {f'group_{i}': {'items': ['dup', i, 'dup'], 'tag': 'dup'} for i in range(100_000 // 3 + 1)}
+    json_editor.new_dict(make_doc())
+    time_start = perf_counter()
+    removed_amnt = json_editor.remove_duplicates('dup')
+    print(f'remove duplicates, batched:    {perf_counter() - time_start:8.4f} s ({removed_amnt:,} removed)')
+    json_editor.new_dict(make_doc())
+    path_lst = json_editor.find_value_path_all('dup')[1:2_001]
+    time_start = perf_counter()
+    for path in path_lst[::-1]:
+        json_editor.remove_path(path)
+    print(f'remove duplicates, one by one: {perf_counter() - time_start:8.4f} s ({len(path_lst):,} removed)')
+
+
+def bench_get_value(tmp_dir:str):
+    """Getting values through benedict, the editor and the raw view"""
+    json_editor = JsonEditor(os.path.join(tmp_dir, 'get_bench.json'), exit_write=False)
+    json_editor.new_dict({f'key_{i}': {'items': [{'id': k} for k in range(5)]} for i in range(1_000)})
+    access_keypaths = [f'key_{i}/items[{i % 5}]/id' for i in range(1_000)]
+    for name, get_value in (('benedict', json_editor().__getitem__), ('editor', json_editor.__getitem__), ('raw', json_editor.raw.__getitem__)):
+        time_start = perf_counter()
+        for _ in range(100):
+            for keypath in access_keypaths:
+                get_value(keypath)
+        print(f'get value, {name:>8}: {(perf_counter() - time_start) / 100_000 * 1e6:8.3f} us/get')
+
+
+def bench_journal(tmp_dir:str):
+    """Saving a small edit to a big document, with and without the journal"""
+    file_path = os.path.join(tmp_dir, 'journal_bench.json')
+    write_json({f'key_{i}': {'id': i, 'tags': ['a', 'b']} for i in range(200_000)}, file_path, force=True, do_print=False)
+    for journal in (False, True):
+        json_editor = JsonEditor(file_path, exit_write=False, journal=journal, journal_compact_size=1 << 30)
+        time_start = perf_counter()
+        for i in range(20):
+            json_editor[f'key_{i}/id'] = -i
+            json_editor.save_file()
+        print(f'save small edit, journal={journal!s:<5}: {(perf_counter() - time_start) / 20 * 1e3:9.3f} ms/save')
+        json_editor.compact_journal()
+
+
+def bench_diff(tmp_dir:str):
+    """Diffing two documents with a million values and a few changes"""
+    make_doc = lambda: {f'group_{i}': {f'item_{k}': {'id': k, 'name': f'item {k}', 'score': k / 3, 'tags': ['a']} for k in range(250)} for i in range(1_000)}
+    old_editor = JsonEditor(os.path.join(tmp_dir, 'diff_old.json'), exit_write=False)
+    old_editor.new_dict(make_doc())
+    json_editor = JsonEditor(os.path.join(tmp_dir, 'diff_new.json'), exit_write=False)
+    json_editor.new_dict(make_doc())
+    time_start = perf_counter()
+    json_editor.diff(old_editor)
+    print(f'diff 1M values, hashing everything: {(perf_counter() - time_start) * 1e3:9.1f} ms')
+    for i in range(5):
+        json_editor[f'group_{i * 100}/item_{i}/score'] = -1
+    time_start = perf_counter()
+    diff = old_editor.diff(json_editor)
+    print(f'diff 1M values, 5 changes, hashed:  {(perf_counter() - time_start) * 1e3:9.1f} ms ({len(diff["changed"])} changed)')
+
+
+def bench_snapshot(tmp_dir:str):
+    """Opening a big json file, parsed and from its snapshot"""
+    file_path = os.path.join(tmp_dir, 'snapshot_bench.json')
+    write_json({'records': [{'id': i, 'name': f'user {i}', 'score': i / 3, 'tags': ['a', 'b']} for i in range(500_000)]}, file_path, force=True, do_print=False)
+    for snapshot in (False, True, True):
+        time_start = perf_counter()
+        JsonEditor(file_path, exit_write=False, snapshot=snapshot)
+        print(f'open {os.path.getsize(file_path) / 1e6:.0f} MB file, snapshot={snapshot!s:<5}: {(perf_counter() - time_start) * 1e3:9.1f} ms')
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        for bench in (bench_append, bench_find_value, bench_remove, bench_get_value, bench_journal, bench_diff, bench_snapshot):
+            bench(tmp_dir)
@@ -0,0 +1,27 @@
+"""Benchmark: a compiled query, and filtering every keypath of the document (the old way)"""
+from py_basic_commands.json_scripts.json_query import compile_query
+from benedict   import benedict
+from fnmatch    import fnmatchcase
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    data = {'users': {f'user_{i}': {'name': f'user {i}', 'email': f'user{i}@example.com', 'orders': [{'id': k, 'price': k * 5} for k in range(5)]} for i in range(5_000)}}
+
+    time_start = perf_counter()
+    query = compile_query('users/*/email')
+    emails = query.values(data)
+    print(f'query users/*/email:            {(perf_counter() - time_start) * 1e3:9.2f} ms ({len(emails)} values)')
+
+    time_start = perf_counter()
+    orders = compile_query('users/*/orders[?price>10]').paths(data)
+    print(f'query orders[?price>10], paths: {(perf_counter() - time_start) * 1e3:9.2f} ms ({len(orders)} paths)')
+
+    time_start = perf_counter()
+    emails = compile_query('**/email').values(data)
+    print(f'query **/email:                 {(perf_counter() - time_start) * 1e3:9.2f} ms ({len(emails)} values)')
+
+    b_data = benedict(data, keypath_separator='/')
+    time_start = perf_counter()
+    emails = [b_data[keypath] for keypath in b_data.keypaths() if fnmatchcase(keypath, 'users/*/email')]
+    print(f'filter keypaths():              {(perf_counter() - time_start) * 1e3:9.2f} ms ({len(emails)} values)')
@@ -0,0 +1,29 @@
+"""Benchmark: reading a large json file, parsed and from its snapshot"""
+import os
+
+from py_basic_commands.json_scripts.json_backend    import json_backends, get_json_backend
+from py_basic_commands.json_scripts.json_snapshot   import load_snapshot, snapshot_path, write_snapshot
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'config.json')
+        for record_amnt in (10_000, 100_000, 1_000_000):
+            data = {'records': [{'id': i, 'name': f'user {i}', 'score': i / 3, 'active': i % 2 == 0, 'tags': ['a', 'b']} for i in range(record_amnt)]}
+            with open(file_path, 'w') as f:
+                f.write(get_json_backend().dumps(data, indent=4))
+            write_snapshot(file_path, data)
+            del data
+            print(f'{os.path.getsize(file_path) / 1e6:8.1f} MB json, {os.path.getsize(snapshot_path(file_path)) / 1e6:8.1f} MB snapshot')
+
+            for backend in json_backends():
+                time_start = perf_counter()
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    get_json_backend(backend).load(f)
+                print(f'    parse {backend:>6}: {(perf_counter() - time_start) * 1e3:9.1f} ms')
+
+            time_start = perf_counter()
+            assert load_snapshot(file_path)[0]
+            print(f'    snapshot       : {(perf_counter() - time_start) * 1e3:9.1f} ms')
@@ -0,0 +1,36 @@
+"""Benchmark: the peak memory of streaming should not grow with the file size,
+and getting a few keypaths from the start of the file should not depend on it at all"""
+import json
+import os
+import tracemalloc
+
+from py_basic_commands.json_scripts.read_json import ReadJson
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+read_json = ReadJson(do_print=False)
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'bench.json')
+        for record_amnt in (10_000, 100_000, 1_000_000):
+            with open(file_path, 'w') as f:
+                f.write('{"meta": {"version": 3}, "records": [')
+                f.write(','.join(json.dumps({'id': i, 'name': f'user {i}', 'tags': ['a', 'b']}) for i in range(record_amnt)))
+                f.write(']}')
+
+            for mode in ('load', 'iter', 'keypaths'):
+                tracemalloc.start()
+                time_start = perf_counter()
+                if mode == 'load':
+                    count = len(read_json(file_path)['records'])
+                elif mode == 'keypaths':
+                    count = len(read_json(file_path, keypaths=['meta/version', 'records[0]/id']))
+                else:
+                    count = sum(1 for _ in read_json.iter(file_path, keypath='records'))
+                read_time = perf_counter() - time_start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f'{os.path.getsize(file_path) / 1e6:8.1f} MB  {mode:>8}: {count:>9} values, {read_time * 1e3:10.2f} ms (traced), peak {peak / 1e6:8.2f} MB')
@@ -0,0 +1,35 @@
+"""Benchmark: parsing a big array of records in this process, and with more workers"""
+import json
+import os
+
+from py_basic_commands.json_scripts.json_backend    import get_json_backend
+from py_basic_commands.json_scripts.parallel_json   import iter_json_array, read_json_array
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'records.json')
+        with open(file_path, 'w') as f:
+            json.dump([{
+                'id': i, 'name': f'user {i}', 'email': f'user{i}@example.com', 'score': i / 7,
+                'tags': ['a', 'b', 'c'], 'address': {'city': f'city {i % 100}', 'zip': f'{i % 99999:05d}'},
+            } for i in range(500_000)], f)
+        print(f'{os.path.getsize(file_path) / 1e6:.1f} MB file, {os.cpu_count()} CPUs')
+
+        time_start = perf_counter()
+        with open(file_path, 'rb') as f:
+            get_json_backend().loads(f.read())
+        base_time = perf_counter() - time_start
+        print(f'one process:           {base_time * 1e3:7.0f} ms')
+
+        for workers in sorted({1, 2, 4, 8, 16, os.cpu_count() or 1}):
+            time_start = perf_counter()
+            read_json_array(file_path, workers, chunk_bytes=4 << 20)
+            list_time = perf_counter() - time_start
+            # len() stands for any work on the chunks that returns a small result
+            time_start = perf_counter()
+            sum(iter_json_array(file_path, workers, chunk_bytes=4 << 20, func=len))
+            func_time = perf_counter() - time_start
+            print(f'workers={workers:<3} list: {list_time * 1e3:7.0f} ms ({base_time / list_time:4.1f}x), func: {func_time * 1e3:7.0f} ms ({base_time / func_time:4.1f}x)')
@@ -0,0 +1,57 @@
+"""Benchmark: prettifying a big file by loading it and by streaming, and a directory of files with more workers"""
+import json
+import os
+import tracemalloc
+
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.json_scripts.json_backend    import get_json_backend
+from py_basic_commands.json_scripts.prettify_json   import prettify_json, prettify_json_tree
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    backend = get_json_backend()
+
+    with TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'big.json')
+        data = {'records': [{'id': i, 'name': f'user {i}', 'score': i / 3, 'tags': ['a', 'b'], 'extra': {}} for i in range(200_000)]}
+        with open(file_path, 'w') as f:
+            f.write(backend.dumps(data))
+
+        # The result has to match the layout of json.dumps
+        prettify_json(file_path, do_print=False, stream=True)
+        with open(file_path) as f:
+            assert f.read() == json.dumps(data, indent=4, ensure_ascii=False)
+        del data
+
+        def prettify_loaded():
+            with open(file_path) as f:
+                text = backend.dumps(backend.load(f), indent=2)
+            with atomic_open(file_path) as f:
+                f.write(text)
+
+        def prettify_streamed():
+            prettify_json(file_path, indent=2, do_print=False, stream=True)
+
+        for mode, prettify in (('load', prettify_loaded), ('stream', prettify_streamed)):
+            time_start = perf_counter()
+            prettify()
+            prettify_time = perf_counter() - time_start
+            # Measured separately, as tracing every allocation slows everything down
+            tracemalloc.start()
+            prettify()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f'{os.path.getsize(file_path) / 1e6:.1f} MB file, {mode:>6}: {prettify_time:7.3f} s, peak memory {peak / 1e6:8.2f} MB')
+
+        tree_dir = os.path.join(tmp_dir, 'tree')
+        for i in range(2_000):
+            dir_path = os.path.join(tree_dir, f'dir_{i % 20}')
+            os.makedirs(dir_path, exist_ok=True)
+            with open(os.path.join(dir_path, f'file_{i}.json'), 'w') as f:
+                f.write(backend.dumps({'id': i, 'items': [{'value': k} for k in range(200)]}))
+
+        for workers in (1, 2, 4):
+            stats = prettify_json_tree(tree_dir, workers=workers, do_print=False)
+            print(f'tree, workers={workers}: {stats["prettified"]}/{stats["files"]} files, {stats["files_per_s"]:8,.0f} files/s')
@@ -0,0 +1,32 @@
+"""Benchmark: opening a store and reading one key, as one json file and as shards"""
+import json
+import os
+
+from py_basic_commands.json_scripts.json_editor         import JsonEditor
+from py_basic_commands.json_scripts.sharded_json_editor import ShardedJsonEditor
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+if __name__ == '__main__':
+    data = {f'user_{i}': {'name': f'user {i}', 'scores': list(range(200))} for i in range(5_000)}
+
+    with TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'store.json')
+        with open(file_path, 'w') as f:
+            json.dump(data, f)
+        for shards in (None, 64):
+            with ShardedJsonEditor(os.path.join(tmp_dir, f'store_{shards}'), shards=shards) as store:
+                for key, value in data.items():
+                    store[key] = value
+
+        time_start = perf_counter()
+        with JsonEditor(file_path) as json_editor:
+            json_editor['user_123/name'] = 'changed'
+        print(f'one json file:          {(perf_counter() - time_start) * 1e3:8.1f} ms')
+
+        for shards in (None, 64):
+            time_start = perf_counter()
+            with ShardedJsonEditor(os.path.join(tmp_dir, f'store_{shards}')) as store:
+                store['user_123/name'] = 'changed'
+            print(f'shards={shards!s:<4} ({store.loaded_shards} read): {(perf_counter() - time_start) * 1e3:8.1f} ms')
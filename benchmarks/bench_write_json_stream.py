@@ -0,0 +1,35 @@
+"""Benchmark: memory of writing a big array from a list, and streamed from a generator"""
+import os
+import tracemalloc
+
+from py_basic_commands.json_scripts.write_json          import write_json
+from py_basic_commands.json_scripts.write_json_stream   import write_json_stream
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+
+
+def make_records(record_amnt:int):
+    for i in range(record_amnt):
+        yield {'id': i, 'name': f'user {i}', 'email': f'user{i}@example.com', 'score': i / 7, 'tags': ['a', 'b']}
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as tmp_dir:
+        for record_amnt in (100_000, 1_000_000):
+            file_path = os.path.join(tmp_dir, 'records.json')
+
+            tracemalloc.start()
+            time_start = perf_counter()
+            write_json(list(make_records(record_amnt)), file_path, force=True, do_print=False)
+            list_time = perf_counter() - time_start
+            list_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            time_start = perf_counter()
+            write_json_stream(make_records(record_amnt), file_path, force=True, do_print=False)
+            stream_time = perf_counter() - time_start
+            stream_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f'{record_amnt:>9} records: write_json {list_time * 1e3:6.0f} ms, {list_peak / 1e6:7.1f} MB peak; write_json_stream {stream_time * 1e3:6.0f} ms, {stream_peak / 1e6:5.1f} MB peak')
@@ -1,18 +1,38 @@
-# From file_dir_scripts
-from py_basic_commands.file_dir_scripts import create_dirs, create_file, get_src_path, join_path, read_file, remove_file_dir, write_file
-from py_basic_commands.file_dir_scripts import CreateDirs, CreateFile, GetSourcePath, JoinPath, ReadFile, RemoveFileDir, WriteFile
-from py_basic_commands.file_dir_scripts import FileEditor
-
-# From fscripts
-from py_basic_commands.fscripts import finput, fprint_array, fprint
-from py_basic_commands.fscripts import Finput, FprintArray, Fprint
-
-# From json_scripts
-from py_basic_commands.json_scripts import create_json, read_json, write_json
-from py_basic_commands.json_scripts import CreateJson, ReadJson, WriteJson
-from py_basic_commands.json_scripts import JsonEditor
-from py_basic_commands.json_scripts import prettify_json
-
-# From other
-from py_basic_commands.other import choose_from_list, chunker, enter_to_continue, flatten_list, func_timer, _func_timer, try_traceback, timer, try_listdir, try_moving, SCROLL_LOCK_STATE, SCROLL_LOCK_RAISE
-from py_basic_commands.other import ChooseFromList, FunctionTimer, Timer
+# From file_dir_scripts
+from py_basic_commands.file_dir_scripts import create_dirs, create_file, get_src_path, join_path, read_file, remove_file_dir, write_file
+from py_basic_commands.file_dir_scripts import CreateDirs, CreateFile, GetSourcePath, JoinPath, ReadFile, RemoveFileDir, WriteFile
+from py_basic_commands.file_dir_scripts import FileEditor
+from py_basic_commands.file_dir_scripts import atomic_open, file_lock, compressed_open, detect_compression
+
+# From fscripts
+from py_basic_commands.fscripts import finput, fprint_array, fprint
+from py_basic_commands.fscripts import Finput, FprintArray, Fprint
+
+# From json_scripts
+from py_basic_commands.json_scripts import create_json, read_json, write_json
+from py_basic_commands.json_scripts import CreateJson, ReadJson, WriteJson
+from py_basic_commands.json_scripts import write_json_stream, WriteJsonStream
+from py_basic_commands.json_scripts import append_jsonl, read_jsonl, write_jsonl
+from py_basic_commands.json_scripts import AppendJsonl, ReadJsonl, WriteJsonl
+from py_basic_commands.json_scripts import JsonEditor, JsonConflictError
+from py_basic_commands.json_scripts import ShardedJsonEditor
+from py_basic_commands.json_scripts import json_cache, JsonCache
+from py_basic_commands.json_scripts import compile_query, JsonQuery
+from py_basic_commands.json_scripts import compact_load, Row
+from py_basic_commands.json_scripts import to_columns, from_columns, Column
+from py_basic_commands.json_scripts import read_json_array, iter_json_array, split_json_array
+from py_basic_commands.json_scripts import prettify_json, prettify_json_tree
+
+# From other
+from py_basic_commands.other import choose_from_list, chunker, enter_to_continue, flatten_list, func_timer, _func_timer, try_traceback, timer, try_listdir, try_moving, SCROLL_LOCK_STATE, SCROLL_LOCK_RAISE
+from py_basic_commands.other import ChooseFromList, FunctionTimer, Timer
+
+# From async_scripts, imported on first use, so importing the package doesn't import asyncio
+_ASYNC_NAMES = ('aread_file', 'awrite_file', 'aread_json', 'awrite_json', 'aread_many', 'run_io', 'set_io_workers', 'AsyncJsonEditor')
+
+
+def __getattr__(name:str):
+    if name in _ASYNC_NAMES:
+        from py_basic_commands import async_scripts
+        return getattr(async_scripts, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,4 @@
+from py_basic_commands.async_scripts.io_executor        import run_io, set_io_workers
+from py_basic_commands.async_scripts.async_file         import aread_file, awrite_file
+from py_basic_commands.async_scripts.async_json         import aread_json, awrite_json, aread_many
+from py_basic_commands.async_scripts.async_json_editor  import AsyncJsonEditor
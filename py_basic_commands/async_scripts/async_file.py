@@ -0,0 +1,35 @@
+from py_basic_commands.async_scripts.io_executor    import run_io
+from py_basic_commands.file_dir_scripts import read_file, write_file
+from typing     import Any
+
+
+async def aread_file(file_path:str, **kwargs) -> Any:
+    """Read the contents of a file without blocking the event loop. Takes the same options as `read_file()`
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the file to read
+
+    Returns
+    -------
+    Any
+        The file contents"""
+    return await run_io(read_file, file_path, **kwargs)
+
+
+async def awrite_file(text:Any, file_path:str, **kwargs) -> bool:
+    """Write text to a file without blocking the event loop. Takes the same options as `write_file()`
+
+    Parameters
+    ----------
+    text : Any
+        The text to write to the file
+    file_path : str
+        The path to write the text to
+
+    Returns
+    -------
+    bool
+        Whether the text was written to the file"""
+    return await run_io(write_file, text, file_path, **kwargs)
@@ -0,0 +1,64 @@
+import asyncio
+
+from py_basic_commands.async_scripts.io_executor    import run_io
+from py_basic_commands.json_scripts import read_json, write_json
+from typing     import Any, Awaitable, Callable, Iterable
+
+
+async def aread_json(file_path:str, **kwargs) -> Any:
+    """Read data from a JSON file without blocking the event loop. Takes the same options as `read_json()`
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the JSON file to read from
+
+    Returns
+    -------
+    Any
+        The data from the JSON file"""
+    return await run_io(read_json, file_path, **kwargs)
+
+
+async def awrite_json(data:Any, file_path:str, **kwargs) -> bool:
+    """Write data to a JSON file without blocking the event loop. Takes the same options as `write_json()`
+
+    Parameters
+    ----------
+    data : Any
+        The data to write to the JSON file
+    file_path : str
+        The path of the JSON file to write to
+
+    Returns
+    -------
+    bool
+        Whether the data was written"""
+    return await run_io(write_json, data, file_path, **kwargs)
+
+
+async def aread_many(file_paths:Iterable[str], max_concurrency:int=32, read_func:Callable[..., Awaitable[Any]]=aread_json, **kwargs) -> list[Any]:
+    """Read many files concurrently, with at most `max_concurrency` reads running at once
+
+    Parameters
+    ----------
+    file_paths : Iterable[str]
+        The paths of the files to read
+    max_concurrency : int, optional
+        The maximum amount of files read at once. Default is 32
+    read_func : Callable[..., Awaitable[Any]], optional
+        The async function to read a file with, like `aread_file`. Default is `aread_json`
+    **kwargs : Any
+        The options to read every file with
+
+    Returns
+    -------
+    list[Any]
+        The contents of the files, in the same order as `file_paths`"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read_one(file_path:str) -> Any:
+        async with semaphore:
+            return await read_func(file_path, **kwargs)
+
+    return await asyncio.gather(*(read_one(file_path) for file_path in file_paths))
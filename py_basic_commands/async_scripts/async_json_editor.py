@@ -0,0 +1,61 @@
+from py_basic_commands.async_scripts.io_executor    import run_io
+from py_basic_commands.json_scripts import JsonEditor
+from typing     import Any, Optional
+
+
+class AsyncJsonEditor:
+    """Open a `JsonEditor` without blocking the event loop, and save it on exit.
+
+    Reading and writing the file run in the shared I/O executor, the editing itself happens in memory:
+
+        async with AsyncJsonEditor('data.json') as json_editor:
+            json_editor['a/b'] = 1"""
+    def __init__(self, file_path:str, exit_write:bool=True, **kwargs) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the json file
+        exit_write : bool, optional
+            If True, the json file is saved (if it was changed) when the context is exited, by default True
+        **kwargs : Any
+            The other options of `JsonEditor`, like `backend`, `journal` or `lock`"""
+        self.file_path = file_path
+        self.exit_write = exit_write
+        self.kwargs = kwargs
+        self.json_editor:Optional[JsonEditor] = None
+
+
+    async def __aenter__(self) -> JsonEditor:
+        """Read the json file
+
+        Returns
+        -------
+        JsonEditor
+            The editor, with the file read"""
+        self.json_editor = await run_io(JsonEditor, self.file_path, exit_write=False, **self.kwargs)
+        return self.json_editor
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Save the json file, if the data was changed"""
+        if self.exit_write:
+            await self.save_file(only_if_dirty=True)
+
+
+    async def save_file(self, only_if_dirty:bool=False) -> bool:
+        """Write the json file without blocking the event loop, see `JsonEditor.save_file()`
+
+        Parameters
+        ----------
+        only_if_dirty : bool, optional
+            If True, the file is only written if the data was changed, by default False
+
+        Returns
+        -------
+        bool
+            True if the file was written"""
+        if self.json_editor is None:
+            raise RuntimeError('The json file is not read yet, use "async with AsyncJsonEditor(...)"')
+        return await run_io(self.json_editor.save_file, only_if_dirty)
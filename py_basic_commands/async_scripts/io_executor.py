@@ -0,0 +1,57 @@
+import asyncio
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from functools  import partial
+from threading  import Lock
+from typing     import Any, Callable, Optional
+
+
+_executor:Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+_max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+
+def set_io_workers(max_workers:int):
+    """Set the maximum amount of threads the async functions run blocking I/O in.
+
+    The current executor (if any) finishes its work in the background, and a new one is made on next use.
+
+    Parameters
+    ----------
+    max_workers : int
+        The maximum amount of threads"""
+    global _executor, _max_workers
+    with _executor_lock:
+        _max_workers = max_workers
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the shared executor, made on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix='py_basic_commands_io')
+        return _executor
+
+
+async def run_io(func:Callable[..., Any], *args:Any, **kwargs:Any) -> Any:
+    """Run a blocking function in the shared, bounded I/O executor, without blocking the event loop
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The function to run
+    *args : Any
+        The positional arguments to call the function with
+    **kwargs : Any
+        The keyword arguments to call the function with
+
+    Returns
+    -------
+    Any
+        The return value of the function"""
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), partial(func, *args, **kwargs))
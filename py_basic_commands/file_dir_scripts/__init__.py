@@ -1,3 +1,6 @@
+from py_basic_commands.file_dir_scripts.atomic_write      import atomic_open
+from py_basic_commands.file_dir_scripts.file_lock         import file_lock
+from py_basic_commands.file_dir_scripts.compression       import compressed_open, detect_compression
 from py_basic_commands.file_dir_scripts.create_dirs       import create_dirs, CreateDirs
 from py_basic_commands.file_dir_scripts.create_file       import create_file, CreateFile
 from py_basic_commands.file_dir_scripts.get_src_path      import get_src_path, GetSourcePath
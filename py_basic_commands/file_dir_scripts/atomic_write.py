@@ -0,0 +1,115 @@
+import os
+
+from py_basic_commands.file_dir_scripts.compression import detect_compression, wrap_compressed
+from contextlib import contextmanager
+from secrets    import token_hex
+from typing     import Iterator, IO, Optional
+
+
+# Durability levels, from fastest to safest
+#   'none': rely on the OS to write the data to disk eventually
+#   'file': fsync the data before the file is replaced
+#   'dir':  also fsync the directory, so the replace itself survives a power loss
+DURABILITY_LEVELS = ('none', 'file', 'dir')
+
+# Flags for a new temporary file; O_EXCL fails if the (random) name is taken
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOINHERIT', 0)
+
+
+def _create_tmp_file(file_path:str, dir_path:str) -> tuple[int, str]:
+    """Create a new temporary file next to `file_path`, and return its file descriptor and path.
+
+    Unlike `mkstemp()`, which only gives the owner access, the file gets the same permissions
+    as one made with `open()` (0o666 minus the umask, applied by the OS)"""
+    while True:
+        tmp_path = os.path.join(dir_path, f'.{os.path.basename(file_path)}.{token_hex(4)}.tmp')
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _fsync_dir(dir_path:str):
+    """Fsync a directory, so the entries in it are on disk. Not possible on all platforms"""
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_open(file_path:str, mode:str='w', encoding:Optional[str]='utf-8', durability:str='none', compression:Optional[str]=None, compresslevel:Optional[int]=None) -> Iterator[IO]:
+    """Open a temporary file next to `file_path`, which replaces `file_path` once everything is written.
+
+    Readers see either the old or the new file, never a half written one.
+    If an exception is raised while writing, the original file is left untouched.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to write
+    mode : str, optional
+        The mode to open the temporary file with ('w' or 'wb'). Default is 'w'
+    encoding : Optional[str], optional
+        The encoding to use in text mode. Default is 'utf-8'
+    durability : str, optional
+        One of `DURABILITY_LEVELS`: 'none', 'file' or 'dir'. Default is 'none'
+    compression : Optional[str], optional
+        Compress what is written: 'infer' (from the extension of `file_path`), 'gzip', 'bz2' or 'xz', see `compressed_open()`. Default is None
+    compresslevel : Optional[int], optional
+        The compression level (the preset for xz). Default is None (the codec's default, see `compressed_open()`)
+
+    Yields
+    ------
+    IO
+        The opened temporary file
+
+    Raises
+    ------
+    ValueError
+        If the durability level or compression is not known"""
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f'Unknown durability level {durability!r}, use one of {DURABILITY_LEVELS}')
+    compression = detect_compression(file_path, compression)
+
+    dir_path = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = _create_tmp_file(file_path, dir_path)
+
+    try:
+        if compression is None:
+            with open(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+                yield f
+                if durability != 'none':
+                    f.flush()
+                    os.fsync(f.fileno())
+        else:
+            with open(fd, 'wb') as raw:
+                # Closing the compressing stream writes its end, but leaves the file open for the fsync
+                with wrap_compressed(raw, compression, mode, encoding, compresslevel) as f:
+                    yield f
+                if durability != 'none':
+                    raw.flush()
+                    os.fsync(raw.fileno())
+
+        try:
+            os.chmod(tmp_path, os.stat(file_path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+
+        os.replace(tmp_path, file_path)
+
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if durability == 'dir':
+        _fsync_dir(dir_path)
@@ -51,11 +51,16 @@ class FileEditor(EditorBase):
         remove_duplicates : bool, optional
             Whether to remove duplicate lines from the text. Default is False
         encoding : str, optional
-            The encoding to use when writing to the file. Default is 'utf-8'           
+            The encoding to use when writing to the file. Default is 'utf-8'
+        compression : Optional[str], optional
+            The compression of the file, for both reading and writing: 'infer' (from the extension, like `.txt.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'
+        compresslevel : Optional[int], optional
+            The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2)
         """
         super().__init__(file_path, do_print)
 
         self.exit_write = exit_write
+        self.write_stats = {'written': 0, 'skipped': 0}
         
         fprint.config(do_print=do_print)
         read_file.config(do_print=do_print, **kwargs)
@@ -65,9 +70,15 @@ class FileEditor(EditorBase):
     
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        """Write the file"""
-        if self.exit_write:
-            write_file(self.text, self.file_path)
+        """Write the file, if the text was changed"""
+        if not self.exit_write:
+            return
+
+        if self.is_dirty:
+            self.update_write()
+        else:
+            self.write_stats['skipped'] += 1
+            fprint(f'No changes, not writing: {self.file_path}')
 
 
     def __str__(self):
@@ -133,6 +144,13 @@ class FileEditor(EditorBase):
         """Read the file contents"""
         self.text_lst = read_file(self.file_path)
         self.text = '\n'.join(self.text_lst)
+        self._saved_text = self.text
+
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if the text differs from the text last read from or written to the file"""
+        return self.text != self._saved_text
 
     
     def get_text(self, splitlines:bool=True):
@@ -152,6 +170,8 @@ class FileEditor(EditorBase):
     def update_write(self):
         """Writes self.text to the file"""
         write_file(self.text, self.file_path)
+        self.write_stats['written'] += 1
+        self._saved_text = self.text
 
 
     def overwrite(self, text:str|list):
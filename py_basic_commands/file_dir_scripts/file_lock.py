@@ -0,0 +1,102 @@
+import os
+
+from contextlib import contextmanager
+from time       import monotonic, sleep
+from typing     import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+def _try_lock(fd:int) -> bool:
+    """Try to lock an opened lock file without waiting
+
+    Returns
+    -------
+    bool
+        Whether the lock was acquired"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1) # type: ignore
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd:int):
+    """Unlock an opened lock file"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1) # type: ignore
+
+
+@contextmanager
+def file_lock(file_path:str, timeout:Optional[float]=None, poll_interval:float=0.005) -> Iterator[str]:
+    """Lock a file for other processes (and threads) using `file_lock()` on the same path.
+
+    The lock is taken on a separate `<file_path>.lock` file, so the file itself can be replaced
+    (like `atomic_open()` does) while it's locked. Uses `fcntl` or `msvcrt` advisory locks,
+    which are released by the OS if the process dies. Where neither exists, the lock file itself is the lock,
+    which is left behind if the process dies while holding it.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to lock
+    timeout : Optional[float], optional
+        The maximum time to wait for the lock, in seconds. Default is None (wait forever)
+    poll_interval : float, optional
+        The time to wait between tries at the start, in seconds. Doubles with every try, up to 0.1 s. Default is 0.005
+
+    Yields
+    ------
+    str
+        The path of the lock file
+
+    Raises
+    ------
+    TimeoutError
+        If the lock wasn't acquired within `timeout` seconds"""
+    lock_path = f'{file_path}.lock'
+    deadline = None if timeout is None else monotonic() + timeout
+    use_lock_file = fcntl is None and msvcrt is None
+
+    while True:
+        if use_lock_file:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                pass
+        else:
+            fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+            if _try_lock(fd):
+                break
+            os.close(fd)
+
+        if deadline is not None and monotonic() >= deadline:
+            raise TimeoutError(f'Could not lock {file_path!r} within {timeout} seconds')
+        sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, 0.1)
+
+    try:
+        yield lock_path
+    finally:
+        if use_lock_file:
+            os.close(fd)
+            os.remove(lock_path)
+        else:
+            # The lock file is not removed, as another process may already be waiting on it
+            _unlock(fd)
+            os.close(fd)
@@ -1,10 +1,9 @@
 from py_basic_commands.file_dir_scripts   import create_file
+from py_basic_commands.file_dir_scripts.compression  import compressed_open
 from py_basic_commands.fscripts.fprint   import Fprint
 from py_basic_commands.base   import Base
 from dataclasses    import dataclass
-from typing     import Any
-
-fprint = Fprint()
+from typing     import Any, Optional
 
 
 @dataclass
@@ -18,6 +17,7 @@ class ReadFile(Base):
     do_lower:bool       = False
     encoding:str        = 'utf-8'
     do_print:bool       = True
+    compression:Optional[str] = 'infer'
 
     def __post_init__(self):
         super().__init__(self.do_print)
@@ -46,6 +46,8 @@ class ReadFile(Base):
             The encoding to use when reading the file. Default is 'utf-8'
         do_print : bool, optional
             Whether to print information about the file creation process. Default is True
+        compression : Optional[str], optional
+            The compression of the file: 'infer' (from the extension, like `.gz`, `.bz2` or `.xz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'
         
         Returns
         -------
@@ -69,7 +71,7 @@ class ReadFile(Base):
             lines: list[str] | str = []
 
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
+                with compressed_open(file_path, 'r', encoding=encoding, compression=compression) as f:
                     lines = f.read()
                 if splitlines:
                     lines = lines.splitlines()
@@ -104,8 +106,9 @@ class ReadFile(Base):
         do_lower        = kwargs.get('do_lower', self.do_lower)
         encoding        = kwargs.get('encoding', self.encoding)
         do_print        = kwargs.get('do_print', self.do_print)
+        compression     = kwargs.get('compression', self.compression)
 
-        fprint.config(do_print=do_print)
+        fprint = Fprint(do_print=do_print)
 
         lines, did_create = try_reading()
 
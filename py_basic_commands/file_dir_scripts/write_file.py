@@ -1,11 +1,10 @@
 from py_basic_commands.file_dir_scripts   import read_file
+from py_basic_commands.file_dir_scripts.compression  import compressed_open
 from py_basic_commands.fscripts   import Fprint
 from py_basic_commands.base   import Base
 from dataclasses    import dataclass
 from traceback  import format_exc
-from typing     import Any
-
-fprint = Fprint()
+from typing     import Any, Optional
 
 
 @dataclass
@@ -24,12 +23,18 @@ class WriteFile(Base):
         The encoding to use when writing to the file. Default is 'utf-8'
     do_print : bool, optional
         Whether to print information about the file creation process. Default is True
+    compression : Optional[str], optional
+        The compression of the file: 'infer' (from the extension, like `.gz`, `.bz2` or `.xz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'
+    compresslevel : Optional[int], optional
+        The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2)
     """
     append:bool    = False
     force_create:bool  = True
     remove_duplicates:bool = False
     encoding:str   = 'utf-8'
     do_print:bool  = True
+    compression:Optional[str] = 'infer'
+    compresslevel:Optional[int] = None
 
     def __post_init__(self):
         super().__init__(self.do_print)
@@ -54,6 +59,10 @@ class WriteFile(Base):
             The encoding to use when writing to the file. Default is 'utf-8'
         do_print : bool, optional
             Whether to print information about the file creation process. Default is True
+        compression : Optional[str], optional
+            The compression of the file: 'infer' (from the extension, like `.gz`, `.bz2` or `.xz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'
+        compresslevel : Optional[int], optional
+            The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2)
         
         Returns
         -------
@@ -67,8 +76,10 @@ class WriteFile(Base):
         remove_duplicates = kwargs.get('remove_duplicates', self.remove_duplicates)
         encoding = kwargs.get('encoding', self.encoding)
         do_print = kwargs.get('do_print', self.do_print)
+        compression = kwargs.get('compression', self.compression)
+        compresslevel = kwargs.get('compresslevel', self.compresslevel)
 
-        fprint.config(do_print=do_print)
+        fprint = Fprint(do_print=do_print)
         
         if text.__class__.__name__ == 'ndarray':
             text = text.tolist()
@@ -78,7 +89,7 @@ class WriteFile(Base):
                 text = list(dict.fromkeys(text))
             text = '\n'.join(text)
 
-        lines, did_create = read_file(file_path, create=force_create, ret_did_create=True, remove_empty=False, splitlines=False, do_print=do_print)
+        lines, did_create = read_file(file_path, create=force_create, ret_did_create=True, remove_empty=False, splitlines=False, do_print=do_print, compression=compression)
 
         if len(lines.strip()) > 0 and not force_create and not append:
             fprint('Not writing to file. File has content; and foce_create is set to False')
@@ -101,7 +112,7 @@ class WriteFile(Base):
         else:
             mode = 'w'
 
-        with open(file_path, mode=mode, encoding=encoding) as f:
+        with compressed_open(file_path, mode, encoding=encoding, compression=compression, compresslevel=compresslevel) as f:
             f.write(text + '\n')
             fprint(f'Content written to file: {file_path}')
 
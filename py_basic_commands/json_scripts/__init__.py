@@ -1,5 +1,15 @@
 from py_basic_commands.json_scripts.create_json   import create_json, CreateJson
 from py_basic_commands.json_scripts.read_json     import read_json, ReadJson
 from py_basic_commands.json_scripts.write_json    import write_json, WriteJson
-from py_basic_commands.json_scripts.json_editor   import JsonEditor
-from py_basic_commands.json_scripts.prettify_json      import prettify_json
\ No newline at end of file
+from py_basic_commands.json_scripts.write_json_stream   import write_json_stream, WriteJsonStream
+from py_basic_commands.json_scripts.read_jsonl    import read_jsonl, ReadJsonl
+from py_basic_commands.json_scripts.write_jsonl   import write_jsonl, WriteJsonl
+from py_basic_commands.json_scripts.append_jsonl  import append_jsonl, AppendJsonl
+from py_basic_commands.json_scripts.json_editor   import JsonEditor, JsonConflictError
+from py_basic_commands.json_scripts.sharded_json_editor import ShardedJsonEditor
+from py_basic_commands.json_scripts.json_cache    import json_cache, JsonCache
+from py_basic_commands.json_scripts.json_query    import compile_query, JsonQuery
+from py_basic_commands.json_scripts.json_compact  import compact_load, Row
+from py_basic_commands.json_scripts.json_columns  import to_columns, from_columns, Column
+from py_basic_commands.json_scripts.parallel_json import read_json_array, iter_json_array, split_json_array
+from py_basic_commands.json_scripts.prettify_json      import prettify_json, prettify_json_tree
\ No newline at end of file
@@ -0,0 +1,119 @@
+from py_basic_commands.json_scripts.json_backend    import JsonBackend, get_json_backend, needs_ascii
+from py_basic_commands.fscripts                     import Fprint
+from py_basic_commands.base                         import Base
+
+from traceback      import format_exc
+from typing         import Any, Iterable, Optional, Union
+from os             import fsync, SEEK_END
+
+fprint = Fprint()
+
+
+class AppendJsonl(Base):
+    """Append records to a JSON Lines (NDJSON) file"""
+    def __init__(self, batch_size:int=1000, do_print:bool=True, encoding:str='utf-8', backend:Optional[Union[str, JsonBackend]]=None, durability:str='none'):
+        """Initialize the class
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The amount of records to write to the file at once. Default is 1000.
+        do_print : bool, optional
+            Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the file, one that writes a newline as the byte `b'\n'` (like UTF-8, not UTF-16). Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            'none' or 'file' (fsync the file after appending). Default is 'none'.
+        """
+        super().__init__(do_print)
+
+        self.batch_size = batch_size
+        self.encoding = encoding
+        self.backend = backend
+        self.durability = durability
+
+
+    def __call__(self, records:Any, file_path:str, **kwargs) -> int:
+        """Append records to the end of a JSON Lines file, without reading the file.
+
+        The file is created if it doesn't exist.
+        
+        Parameters
+        ----------
+        records : Any
+            The records to append; any iterable of records, or a single dict.
+        file_path : str
+            The path of the JSON Lines file to append to.
+        batch_size : int, optional
+            The amount of records to write to the file at once. Default is 1000.
+        do_print : bool, optional
+            Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the file, one that writes a newline as the byte `b'\n'` (like UTF-8, not UTF-16). Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            'none' or 'file' (fsync the file after appending). Default is 'none'.
+        
+        Returns
+        -------
+        int
+            The amount of records appended.
+        """
+
+        # Check input values
+        batch_size = kwargs.get('batch_size', self.batch_size)
+        do_print = kwargs.get('do_print', self.do_print)
+        encoding = kwargs.get('encoding', self.encoding)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
+        durability = kwargs.get('durability', self.durability)
+
+        fprint.config(do_print=do_print)
+
+        if isinstance(records, dict):
+            records = [records]
+
+        ensure_ascii = needs_ascii(encoding)
+        record_amnt = 0
+
+        try:
+            with open(file_path, 'a+b') as f:
+                # Only the last byte is read, to not glue the first record to an unfinished last line
+                if f.seek(0, SEEK_END) > 0:
+                    f.seek(-1, SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+
+                batch = []
+                for record in records:
+                    batch.append(backend.dumps(record, None, ensure_ascii))
+                    if len(batch) >= batch_size:
+                        f.write(('\n'.join(batch) + '\n').encode(encoding))
+                        record_amnt += len(batch)
+                        batch.clear()
+
+                if batch:
+                    f.write(('\n'.join(batch) + '\n').encode(encoding))
+                    record_amnt += len(batch)
+
+                if durability != 'none':
+                    f.flush()
+                    fsync(f.fileno())
+
+            fprint(f'Appended {record_amnt} records to JSON Lines file: {file_path}')
+
+        except TypeError:
+            fprint(f'A record can\'t be written to JSON, stopped appending after {record_amnt} records: {file_path}')
+
+        except FileNotFoundError:
+            fprint(f'Directory not found: {file_path}')
+
+        except Exception:
+            fprint(format_exc())
+
+        return record_amnt
+
+
+append_jsonl = AppendJsonl()
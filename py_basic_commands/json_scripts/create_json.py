@@ -1,16 +1,17 @@
-import json
-
 from py_basic_commands.file_dir_scripts   import create_file, read_file
+from py_basic_commands.file_dir_scripts.compression  import compressed_open
+from py_basic_commands.json_scripts.json_backend   import JsonBackend, get_json_backend
 from py_basic_commands.json_scripts.read_json  import read_json
 from py_basic_commands.fscripts   import Fprint
 from py_basic_commands.base   import Base
+from typing     import Optional, Union
 
 fprint = Fprint()
 
 
 class CreateJson(Base):
     """Create a new empty JSON file."""
-    def __init__(self, force:bool=True, do_print:bool=True):
+    def __init__(self, force:bool=True, do_print:bool=True, backend:Optional[Union[str, JsonBackend]]=None):
         """Initialize the class
         
         Parameters
@@ -18,10 +19,13 @@ class CreateJson(Base):
         force : bool, optional
             Whether to overwrite any existing file with the same name. Default is True
         do_print : bool, optional
-            Whether to print information about the file creation process. Default is True"""
+            Whether to print information about the file creation process. Default is True
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to use ('orjson', 'ujson', 'json'). Default is None, the fastest installed one"""
         super().__init__(do_print)
 
         self.force = force
+        self.backend = backend
 
 
     def __call__(self, file_path:str, **kwargs) -> bool:
@@ -33,6 +37,8 @@ class CreateJson(Base):
             The path for the new JSON file
         force : bool, optional
             Whether to overwrite any existing file with the same name. Default is True
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to use ('orjson', 'ujson', 'json'). Default is None, the fastest installed one
         
         Returns
         -------
@@ -43,16 +49,20 @@ class CreateJson(Base):
         # Check input values
         force = kwargs.get('force', self.force)
         do_print = kwargs.get('do_print', self.do_print)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
 
         fprint.config(do_print=do_print)
 
-        write_empty_json = lambda: open(file_path, 'w').write(json.dumps({}, indent=4))
+        def write_empty_json():
+            # Compressed by the file extension, like `.json.gz`
+            with compressed_open(file_path, 'w') as f:
+                f.write(backend.dumps({}, indent=4))
 
         did_create = create_file(file_path, force=force, do_print=do_print)
         if did_create:
             write_empty_json()
             fprint(f'New JSON created: {file_path}')
-        elif read_json(file_path) == None:
+        elif read_json(file_path, backend=backend) == None:
             text = read_file(file_path, splitlines=False, do_print=do_print)
             if text and not force:
                 fprint(f'Cannot create new JSON file. Text found in file; and force set as False: {file_path}')
@@ -0,0 +1,306 @@
+import codecs
+import json
+import math
+
+from py_basic_commands.json_scripts.json_compact import json_default
+from typing import Any, Mapping, Optional, TextIO, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _reindent(text:str, indent:int) -> str:
+    """Change a 2 space indented JSON text to use `indent` spaces
+
+    Strings can't contain raw newlines or control characters, so every space after a newline
+    is indentation, and '\\x01' can be used as a temporary marker for each indentation level."""
+    text = text.replace('\n  ', '\n\x01')
+    while '\x01  ' in text:
+        text = text.replace('\x01  ', '\x01\x01')
+    return text.replace('\x01', ' ' * indent)
+
+
+def _orjson_default(obj:Any) -> Any:
+    """Convert dict and list subclasses (and the compact containers, see `json_default()`) for orjson.
+
+    orjson reads the storage of a dict subclass directly, which is wrong for
+    subclasses that keep their data elsewhere (like benedict)"""
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, list):
+        return list(obj)
+    return json_default(obj)
+
+
+def _has_non_finite(data:Any) -> bool:
+    """Check if the data contains NaN or an infinite float, which orjson would write as null
+
+    Parameters
+    ----------
+    data : Any
+        The data to check
+
+    Returns
+    -------
+    bool
+        True if a float in the data is not finite"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)) or hasattr(value, 'typecode'):
+            # Lists, tuples and array.arrays
+            stack.extend(value)
+    return False
+
+
+def needs_ascii(encoding:str) -> bool:
+    """Check if non-ASCII characters have to be escaped for the given encoding
+
+    Parameters
+    ----------
+    encoding : str
+        The encoding the JSON text will be written with
+
+    Returns
+    -------
+    bool
+        True if the encoding can't represent every unicode character"""
+    return not codecs.lookup(encoding).name.startswith('utf')
+
+
+class JsonBackend:
+    """Base class for JSON backends.
+
+    Every backend produces the same data and whitespace: `indent=None` gives compact output (no spaces),
+    an indent gives the same layout as `json.dumps(data, indent=indent)`.
+    Numbers may be spelled differently (orjson writes `1e16` where json writes `1e+16`), but parse to the same values.
+    NaN and infinite floats are written as `NaN` and `Infinity`, like json does.
+    Non-ASCII characters are written as is, unless `ensure_ascii` is set.
+    Other mappings (like `Row`) and `array.array`s are written as objects and arrays."""
+    name = ''
+
+    def loads(self, text:Union[str, bytes]) -> Any:
+        """Parse a JSON text
+
+        Parameters
+        ----------
+        text : str | bytes
+            The JSON text
+
+        Returns
+        -------
+        Any
+            The parsed data
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the text is not valid JSON"""
+        raise NotImplementedError
+
+
+    def dumps(self, data:Any, indent:Optional[int]=None, ensure_ascii:bool=False) -> str:
+        """Serialize data to a JSON text
+
+        Parameters
+        ----------
+        data : Any
+            The data to serialize
+        indent : Optional[int], optional
+            The number of spaces to indent with. Default is None (compact)
+        ensure_ascii : bool, optional
+            Whether to escape all non-ASCII characters. Default is False
+
+        Returns
+        -------
+        str
+            The JSON text
+
+        Raises
+        ------
+        TypeError
+            If the data can't be serialized"""
+        raise NotImplementedError
+
+
+    def load(self, f:TextIO) -> Any:
+        """Parse a JSON file
+
+        Parameters
+        ----------
+        f : TextIO
+            The opened file to read
+
+        Returns
+        -------
+        Any
+            The parsed data"""
+        return self.loads(f.read())
+
+
+    def dump(self, data:Any, f:TextIO, indent:Optional[int]=None, ensure_ascii:bool=False):
+        """Serialize data to a JSON file
+
+        Parameters
+        ----------
+        data : Any
+            The data to serialize
+        f : TextIO
+            The opened file to write to
+        indent : Optional[int], optional
+            The number of spaces to indent with. Default is None (compact)
+        ensure_ascii : bool, optional
+            Whether to escape all non-ASCII characters. Default is False"""
+        f.write(self.dumps(data, indent, ensure_ascii))
+
+
+class StdlibBackend(JsonBackend):
+    """The standard library `json` module. Always available"""
+    name = 'json'
+
+    def loads(self, text:Union[str, bytes]) -> Any:
+        return json.loads(text)
+
+
+    def dumps(self, data:Any, indent:Optional[int]=None, ensure_ascii:bool=False) -> str:
+        separators = (',', ':') if indent is None else (',', ': ')
+        return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, separators=separators, default=json_default)
+
+
+class OrjsonBackend(JsonBackend):
+    """The `orjson` package. Falls back to the standard library for things orjson doesn't support,
+    like integers over 64 bits and NaN or infinite floats (which orjson writes as null)"""
+    name = 'orjson'
+
+    def loads(self, text:Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(text) # type: ignore
+        except orjson.JSONDecodeError: # type: ignore
+            # Integers over 64 bits, or a real error that gets a proper message from json
+            return json.loads(text)
+
+
+    def dumps(self, data:Any, indent:Optional[int]=None, ensure_ascii:bool=False) -> str:
+        if ensure_ascii or not (indent is None or isinstance(indent, int)):
+            return stdlib_backend.dumps(data, indent, ensure_ascii)
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS # type: ignore
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2 # type: ignore
+
+        try:
+            text = orjson.dumps(data, default=_orjson_default, option=option).decode() # type: ignore
+        except TypeError:
+            # Integers over 64 bits, or a real error that gets a proper message from json
+            return stdlib_backend.dumps(data, indent, ensure_ascii)
+
+        # Only data with a null in it can have had a NaN or infinite float
+        if 'null' in text and _has_non_finite(data):
+            return stdlib_backend.dumps(data, indent, ensure_ascii)
+
+        if indent is None or indent == 2:
+            return text
+        if indent > 0:
+            return _reindent(text, indent)
+        return stdlib_backend.dumps(data, indent, ensure_ascii)
+
+
+class UjsonBackend(JsonBackend):
+    """The `ujson` package. Falls back to the standard library for things ujson doesn't support"""
+    name = 'ujson'
+
+    def loads(self, text:Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(text) # type: ignore
+        except ValueError:
+            return json.loads(text)
+
+
+    def dumps(self, data:Any, indent:Optional[int]=None, ensure_ascii:bool=False) -> str:
+        # ujson treats indent=0 as compact
+        if indent == 0 or not (indent is None or isinstance(indent, int)):
+            return stdlib_backend.dumps(data, indent, ensure_ascii)
+
+        try:
+            return ujson.dumps(data, indent=indent or 0, ensure_ascii=ensure_ascii, escape_forward_slashes=False, default=json_default) # type: ignore
+        except (OverflowError, TypeError):
+            return stdlib_backend.dumps(data, indent, ensure_ascii)
+
+
+stdlib_backend = StdlibBackend()
+
+# Registered backends, in order of preference
+_backends:dict[str, JsonBackend] = {}
+
+
+def register_json_backend(backend:JsonBackend, name:str='', prefer:bool=False):
+    """Register a JSON backend, so it can be selected with `backend=name`
+
+    Parameters
+    ----------
+    backend : JsonBackend
+        The backend to register
+    name : str, optional
+        The name to register the backend with. Default is `backend.name`
+    prefer : bool, optional
+        Whether the backend should be selected automatically before the others. Default is False"""
+    name = name or backend.name
+    if prefer:
+        backends = {name: backend}
+        backends.update((key, val) for key, val in _backends.items() if key != name)
+        _backends.clear()
+        _backends.update(backends)
+    else:
+        _backends[name] = backend
+
+
+def get_json_backend(backend:Optional[Union[str, JsonBackend]]=None) -> JsonBackend:
+    """Get a JSON backend
+
+    Parameters
+    ----------
+    backend : Optional[str | JsonBackend], optional
+        The name of the backend ('orjson', 'ujson', 'json', ...) or a backend itself.
+        Default is None, which selects the fastest installed backend.
+
+    Returns
+    -------
+    JsonBackend
+        The selected backend
+
+    Raises
+    ------
+    ValueError
+        If no backend with the given name is registered"""
+    if isinstance(backend, JsonBackend):
+        return backend
+    if not backend:
+        return next(iter(_backends.values()))
+    try:
+        return _backends[backend]
+    except KeyError:
+        raise ValueError(f'Unknown JSON backend {backend!r}, available: {list(_backends)}') from None
+
+
+def json_backends() -> list[str]:
+    """Returns the names of the registered JSON backends, in order of preference"""
+    return list(_backends)
+
+
+if orjson is not None:
+    register_json_backend(OrjsonBackend())
+if ujson is not None:
+    register_json_backend(UjsonBackend())
+register_json_backend(stdlib_backend)
@@ -0,0 +1,200 @@
+import marshal
+import os
+
+from py_basic_commands.file_dir_scripts.compression import compressed_open, detect_compression
+from collections    import OrderedDict
+from threading      import Lock
+from time           import time_ns
+from typing         import Any, Callable, NoReturn, Optional, TextIO
+
+
+# A file changed within this time of its last change could have the same modification time,
+# so it is not cached until it's older (like "racy git")
+_RACY_NS = 2_000_000_000
+
+
+class FrozenDict(dict):
+    """A dict that can't be changed. Still a dict, so it can be written as JSON like one"""
+    def _read_only(self, *args, **kwargs) -> NoReturn:
+        raise TypeError('Cached JSON data is read-only, read it with cache=True to get a copy')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only # type: ignore
+    clear = pop = popitem = setdefault = update = _read_only # type: ignore
+
+    def __hash__(self) -> int: # type: ignore
+        return id(self)
+
+
+def freeze(data:Any) -> Any:
+    """Returns a read-only version of JSON data: dicts become `FrozenDict`s and lists become tuples
+
+    Parameters
+    ----------
+    data : Any
+        The JSON data
+
+    Returns
+    -------
+    Any
+        The read-only data"""
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def _file_stamp(stat:os.stat_result) -> tuple:
+    """Returns the parts of a file's stat that change when the file is written"""
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class JsonCache:
+    """A process-wide cache of parsed JSON files.
+
+    Entries are validated on every read with the inode, modification time and size of the file,
+    so a changed file is always read again. The cached data can't be changed by the callers:
+    reads return either a new copy (made from the data stored with `marshal`), or a shared read-only
+    version (see `freeze()`), which costs nothing to return.
+    The least recently used files are evicted once the cache is over `max_bytes`."""
+    def __init__(self, max_bytes:int=64 << 20, max_entries:int=1024) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            The maximum size of the cached (serialized) data, in bytes. Default is 64 MB
+        max_entries : int, optional
+            The maximum amount of cached files. Default is 1024"""
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        # (path, encoding, compression, load function): [stamp, marshal data, frozen data or None]
+        self._entries:OrderedDict[tuple, list] = OrderedDict()
+        self._lock = Lock()
+
+
+    def __len__(self) -> int:
+        """Returns the amount of cached files"""
+        return len(self._entries)
+
+
+    def stats(self) -> dict[str, int]:
+        """Returns the hit, miss and eviction counters, and the amount and size of the cached files
+
+        Returns
+        -------
+        dict[str, int]
+            The counters and sizes"""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': len(self._entries), 'bytes': self._size}
+
+
+    def clear(self):
+        """Removes all files from the cache and resets the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+
+    def invalidate(self, file_path:str):
+        """Removes a file from the cache
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file to remove"""
+        path = os.path.abspath(file_path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self._size -= len(self._entries.pop(key)[1])
+
+
+    def _store(self, key:tuple, stamp:tuple, data:Any, frozen_data:Any):
+        """Stores the data of a file, evicting the least recently used files if needed"""
+        try:
+            blob = marshal.dumps(data)
+        except ValueError:
+            # Not plain JSON data (a custom backend), so it can't be copied with marshal
+            return
+        if len(blob) > self.max_bytes:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._size -= len(old_entry[1])
+
+            self._entries[key] = [stamp, blob, frozen_data]
+            self._size += len(blob)
+            while self._size > self.max_bytes or len(self._entries) > self.max_entries:
+                self._size -= len(self._entries.popitem(last=False)[1][1])
+                self.evictions += 1
+
+
+    def load(self, file_path:str, load_func:Callable[[TextIO], Any], encoding:str='utf-8', frozen:bool=False, compression:Optional[str]='infer') -> Any:
+        """Returns the data of a JSON file, from the cache if the file hasn't changed
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the JSON file
+        load_func : Callable[[TextIO], Any]
+            The function to parse the opened file with, on a cache miss.
+            Part of the cache key, so files read with different functions (like `backend.load` of different backends) are cached apart
+        encoding : str, optional
+            The encoding of the JSON file. Default is 'utf-8'
+        frozen : bool, optional
+            Whether to return the shared read-only data instead of a copy. Default is False
+        compression : Optional[str], optional
+            The compression of the JSON file, see `compressed_open()`. Default is 'infer'
+
+        Returns
+        -------
+        Any
+            A copy of the data of the JSON file, or the read-only data
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file doesn't exist"""
+        compression = detect_compression(file_path, compression)
+        key = (os.path.abspath(file_path), encoding, compression, load_func)
+        stamp = _file_stamp(os.stat(file_path))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and entry[0] == stamp
+            if hit:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if hit:
+            if not frozen:
+                return marshal.loads(entry[1]) # type: ignore
+            if entry[2] is None: # type: ignore
+                # Two threads may both freeze the data, which is harmless
+                entry[2] = freeze(marshal.loads(entry[1])) # type: ignore
+            return entry[2] # type: ignore
+
+        with compressed_open(file_path, 'r', encoding, compression) as f:
+            data = load_func(f)
+            stat = os.fstat(f.fileno())
+
+        frozen_data = freeze(data) if frozen else None
+
+        # Only cache what was read from an unchanged, not too recently written file
+        if _file_stamp(stat) == stamp and time_ns() - stat.st_mtime_ns > _RACY_NS:
+            self._store(key, stamp, data, frozen_data)
+        elif entry is not None:
+            self.invalidate(file_path)
+
+        return frozen_data if frozen else data
+
+
+json_cache = JsonCache()
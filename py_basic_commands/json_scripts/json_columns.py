@@ -0,0 +1,198 @@
+from array      import array
+from typing     import Any, Iterable, Mapping, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+class Column:
+    """The values of one field of a list of records.
+
+    Numbers and bools are in a buffer (`array.array`, or a NumPy array), strings and other values in a list.
+    Records without the field, or with null, are set in `mask` and have a 0 (or None) as value.
+    The records without the field are also set in `missing`, so `from_columns()` leaves the field out of them again"""
+    def __init__(self, values:Any, mask:Any, kind:str, missing:Any=None) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        values : Any
+            The values: an `array.array` or NumPy array for numbers and bools, otherwise a list
+        mask : Any
+            Whether each value is null or missing: an `array.array('b')` or a NumPy bool array
+        kind : str
+            The type of the values: 'int', 'float', 'bool', 'str' or 'object' (mixed or nested values)
+        missing : Any, optional
+            Whether each record is without the field, like `mask`. Default is None, every record has the field"""
+        self.values = values
+        self.mask = mask
+        self.kind = kind
+        self.missing = missing
+
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+    def __repr__(self) -> str:
+        return f'Column(kind={self.kind!r}, len={len(self.values)}, nulls={sum(self.mask)})'
+
+
+    def tolist(self) -> list[Any]:
+        """Returns the values as a list, with None for the nulls
+
+        Returns
+        -------
+        list[Any]
+            The values"""
+        values = self.values.tolist() if hasattr(self.values, 'tolist') else list(self.values)
+        if self.kind == 'bool':
+            values = [bool(value) for value in values]
+        if any(self.mask):
+            values = [None if is_null else value for value, is_null in zip(values, self.mask)]
+        return values
+
+
+def _column_kind(values:list[Any], types:set[type]) -> str:
+    """Returns the kind of a column from the types of its not null values"""
+    if not types or types == {str}:
+        return 'str'
+    if types == {bool}:
+        return 'bool'
+    if types == {int}:
+        if _INT64_MIN <= min(value for value in values if value is not None) and max(value for value in values if value is not None) <= _INT64_MAX:
+            return 'int'
+        return 'object'
+    if types <= {int, float}:
+        return 'float'
+    return 'object'
+
+
+def to_columns(records:Sequence[Mapping], fields:Optional[Iterable[str]]=None, use_numpy:Optional[bool]=None) -> dict[str, Column]:
+    """Turn a list of records (dicts) into a column per field, for vectorized aggregations.
+
+    Int, float and bool fields go in `array.array`s or NumPy arrays, which can be summed,
+    compared and grouped without a Python loop per record. Use `from_columns()` to turn the columns back into records;
+    the records are the same, except that ints in a field with floats become floats (`1` comes back as `1.0`).
+    Ints that don't fit in 64 bits, and fields with other mixed types, are kept as they are in a list
+
+    Parameters
+    ----------
+    records : Sequence[Mapping]
+        The records
+    fields : Optional[Iterable[str]], optional
+        The fields to make columns of. Default is None, every field of every record (in the order they're first seen)
+    use_numpy : Optional[bool], optional
+        Whether to make NumPy arrays instead of `array.array`s. Default is None, if NumPy is installed
+
+    Returns
+    -------
+    dict[str, Column]
+        The columns by field
+
+    Raises
+    ------
+    TypeError
+        If a record is not a dict (or other mapping)
+    ImportError
+        If `use_numpy` is True but NumPy is not installed"""
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError('NumPy is not installed, use use_numpy=False for array.array columns')
+
+    # Checked once per type, an isinstance() of every record would take longer than making the columns
+    for record_type in set(map(type, records)):
+        if not issubclass(record_type, Mapping):
+            raise TypeError(f'Not a list of records, found a {record_type.__name__}')
+
+    if fields is None:
+        fields = list(dict.fromkeys(key for record in records for key in record))
+
+    columns = {}
+    for field in fields:
+        values = [record.get(field) for record in records]
+        types = set(map(type, values))
+        has_nulls = type(None) in types
+        types.discard(type(None))
+        kind = _column_kind(values, types)
+
+        missing = None
+        if has_nulls:
+            is_null = [value is None for value in values]
+            mask = np.array(is_null, dtype=np.bool_) if use_numpy else array('b', is_null) # type: ignore
+            # A missing field reads as None too, told apart from null only where there are nulls
+            is_missing = [null and field not in record for record, null in zip(records, is_null)]
+            if any(is_missing):
+                missing = np.array(is_missing, dtype=np.bool_) if use_numpy else array('b', is_missing) # type: ignore
+        else:
+            mask = np.zeros(len(values), dtype=np.bool_) if use_numpy else array('b', bytes(len(values))) # type: ignore
+
+        if kind in ('int', 'float', 'bool'):
+            if has_nulls:
+                values = [0 if value is None else value for value in values]
+            if use_numpy:
+                values = np.array(values, dtype={'int': np.int64, 'float': np.float64, 'bool': np.bool_}[kind]) # type: ignore
+            else:
+                values = array({'int': 'q', 'float': 'd', 'bool': 'b'}[kind], values)
+
+        columns[field] = Column(values, mask, kind, missing)
+
+    return columns
+
+
+def from_columns(columns:Mapping[str, Union[Column, Sequence]], drop_nulls:bool=False) -> list[dict[str, Any]]:
+    """Turn columns back into a list of records, see `to_columns()`.
+
+    The fields set in a `Column`'s `missing` are left out of the records, so records without a field don't get it as null
+
+    Parameters
+    ----------
+    columns : Mapping[str, Column | Sequence]
+        The columns by field: `Column`s, or any sequences of values (lists, `array.array`s, NumPy arrays)
+    drop_nulls : bool, optional
+        Whether to leave all null values out of the records, instead of writing them as null. Default is False
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The records
+
+    Raises
+    ------
+    ValueError
+        If the columns are not all of the same length"""
+    fields = list(columns)
+    value_lists = []
+    missing_masks = []
+    for field in fields:
+        column = columns[field]
+        if isinstance(column, Column):
+            value_lists.append(column.tolist())
+            if column.missing is not None:
+                missing_masks.append((field, column.missing))
+        else:
+            # NumPy and array.array values are turned into Python numbers with tolist()
+            value_lists.append(column.tolist() if hasattr(column, 'tolist') else list(column))
+
+    lengths = {len(values) for values in value_lists}
+    if len(lengths) > 1:
+        raise ValueError(f'Columns of different lengths: {dict(zip(fields, map(len, value_lists)))}')
+
+    if drop_nulls:
+        return [{field: value for field, value in zip(fields, row) if value is not None} for row in zip(*value_lists)]
+
+    records = [dict(zip(fields, row)) for row in zip(*value_lists)]
+    for field, missing in missing_masks:
+        if len(missing) != len(records):
+            raise ValueError(f'Missing mask of {field!r} is {len(missing)} long, not {len(records)}')
+        for record, is_missing in zip(records, missing):
+            if is_missing:
+                del record[field]
+    return records
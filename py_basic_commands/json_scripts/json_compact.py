@@ -0,0 +1,192 @@
+import json
+import sys
+
+from array      import array
+from typing     import Any, Iterator, Mapping, TextIO, Union
+
+
+# Only strings up to this length are shared, longer ones are rarely repeated
+_MAX_SHARED_LEN = 64
+# Shorter lists gain less from an array than the array itself costs
+_MIN_ARRAY_LEN = 8
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+COMPACT_LEVELS = (True, 'arrays', 'rows')
+
+
+class Row(Mapping):
+    """A read-only JSON object, stored as a tuple of its values.
+
+    Rows with the same keys (in the same order) share one key index, so an array of
+    records costs about a third of what it costs as dicts. Works like a read-only dict,
+    and is written as a JSON object; `dict(row)` gives a dict that can be changed"""
+    __slots__ = ('_index', '_values')
+
+    def __init__(self, index:dict[str, int], values:tuple) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        index : dict[str, int]
+            The position of each key in `values`, shared by the rows with the same keys
+        values : tuple
+            The values"""
+        self._index = index
+        self._values = values
+
+
+    def __getitem__(self, key:str) -> Any:
+        return self._values[self._index[key]]
+
+
+    def __contains__(self, key:object) -> bool:
+        return key in self._index
+
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+    def __repr__(self) -> str:
+        return f'Row({dict(self)!r})'
+
+
+    def __reduce__(self) -> tuple:
+        # Pickled (like for a process pool) as a dict, the shared index is only shared within a load
+        return (dict, (dict(zip(self._index, self._values)),))
+
+
+class _CompactLoader:
+    """Builds the compact data of one JSON document, from the hooks of the `json` parser"""
+    def __init__(self, level:Union[bool, str]) -> None:
+        if level not in COMPACT_LEVELS:
+            raise ValueError(f'Unknown compact level {level!r}, use one of {COMPACT_LEVELS}')
+        self.arrays = level in ('arrays', 'rows')
+        self.rows = level == 'rows'
+        # Equal short strings of this document, so each is stored once
+        self._strings:dict[str, str] = {}
+        # Key tuple: key index, for the rows
+        self._indexes:dict[tuple, dict[str, int]] = {}
+
+
+    def _share(self, value:str) -> str:
+        if len(value) > _MAX_SHARED_LEN:
+            return value
+        return self._strings.setdefault(value, value)
+
+
+    def _compact_list(self, lst:list) -> Union[list, array]:
+        """Shares the strings of a list (objects in it are done already), or turns a list of numbers into an array"""
+        first = lst[0] if lst else None
+        if self.arrays and len(lst) >= _MIN_ARRAY_LEN and type(first) in (int, float):
+            # `type() is`, as bools are ints too, and ints and floats are not mixed so they are written back the same
+            item_type = type(first)
+            if all(type(item) is item_type for item in lst):
+                if item_type is float:
+                    return array('d', lst)
+                if _INT64_MIN <= min(lst) and max(lst) <= _INT64_MAX:
+                    return array('q', lst)
+
+        for i, item in enumerate(lst):
+            if type(item) is str:
+                lst[i] = self._share(item)
+            elif type(item) is list:
+                lst[i] = self._compact_list(item)
+        return lst
+
+
+    def object_pairs_hook(self, pairs:list[tuple[str, Any]]) -> Union[dict, Row]:
+        """Called by the parser with the keys and values of each JSON object, innermost first"""
+        keys = []
+        values = []
+        for key, value in pairs:
+            keys.append(sys.intern(key))
+            if type(value) is str:
+                value = self._share(value)
+            elif type(value) is list:
+                value = self._compact_list(value)
+            values.append(value)
+
+        if not self.rows:
+            return dict(zip(keys, values))
+
+        key_tuple = tuple(keys)
+        index = self._indexes.get(key_tuple)
+        if index is None:
+            index = {key: i for i, key in enumerate(key_tuple)}
+            if len(index) < len(key_tuple):
+                # Duplicate keys, the last value counts like in a dict
+                return dict(zip(keys, values))
+            index = self._indexes.setdefault(key_tuple, index)
+        return Row(index, tuple(values))
+
+
+    def load(self, f:TextIO) -> Any:
+        """Parses an opened JSON file"""
+        data = json.load(f, object_pairs_hook=self.object_pairs_hook)
+        if type(data) is list:
+            data = self._compact_list(data)
+        return data
+
+
+def compact_load(f:TextIO, level:Union[bool, str]=True) -> Any:
+    """Parse a JSON file into data that takes less memory, for large files of records.
+
+    Every level interns the keys (shared with every other compact load in the process)
+    and stores equal short strings once. The levels add:
+
+    - True: nothing more, the data is plain dicts and lists
+    - `'arrays'`: lists of 8 or more ints (or floats) become `array.array`s
+    - `'rows'`: also, objects become read-only `Row`s, where objects with the same keys share one key index
+
+    The data is built with the hooks of the `json` parser, so the memory is saved while
+    parsing, not after: the full size data is never built
+
+    Parameters
+    ----------
+    f : TextIO
+        The opened JSON file
+    level : bool | str, optional
+        True, 'arrays' or 'rows'. Default is True
+
+    Returns
+    -------
+    Any
+        The parsed data
+
+    Raises
+    ------
+    ValueError
+        If the level is not one of `COMPACT_LEVELS`
+    json.JSONDecodeError
+        If the file is not valid JSON"""
+    return _CompactLoader(level).load(f)
+
+
+def json_default(obj:Any) -> Any:
+    """Convert the compact containers (and other mappings and arrays) to what the JSON backends can write
+
+    Parameters
+    ----------
+    obj : Any
+        The object the backend can't write
+
+    Returns
+    -------
+    Any
+        A dict or a list
+
+    Raises
+    ------
+    TypeError
+        If the object is not a mapping or an array"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
@@ -1,20 +1,191 @@
-from py_basic_commands.json_scripts import ReadJson, WriteJson
+from py_basic_commands.json_scripts import ReadJson, WriteJson, ReadJsonl
+from py_basic_commands.json_scripts.json_backend import JsonBackend, get_json_backend
+from py_basic_commands.json_scripts.json_columns import Column, from_columns, to_columns
+from py_basic_commands.json_scripts.json_query import compile_query
+from py_basic_commands.json_scripts.json_snapshot import load_snapshot, write_snapshot, snapshot_path
+from py_basic_commands.json_scripts.keypath import compile_keypath, get_keypath_value, join_keypath, split_keypath
+from py_basic_commands.file_dir_scripts.atomic_write import atomic_open
+from py_basic_commands.file_dir_scripts.create_dirs import create_dirs
+from py_basic_commands.file_dir_scripts.file_lock import file_lock
 from py_basic_commands.base import EditorBase
 from py_basic_commands.fscripts import Fprint
 
 from send2trash import send2trash
 from benedict import benedict
-from typing import Any, Optional, Sequence
+from hashlib import blake2b
+from operator import itemgetter
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+import marshal
+import os
 
 
 read_json = ReadJson(do_print=False)
 write_json = WriteJson(do_print=False)
+read_jsonl = ReadJsonl(do_print=False)
+
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
 fprint = Fprint(do_print=False)
 
 
+def _check_keys(data:Any, separator:str='/'):
+    """Raises the same error as benedict if a key contains the keypath separator,
+    without benedict's own check, which gets every value through its casting `get()`
+
+    Raises
+    ------
+    ValueError
+        If a key contains the separator"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key in value:
+                if key and isinstance(key, str) and separator in key:
+                    raise ValueError(f'Key should not contain keypath separator {separator!r}, found: {key!r}.')
+            stack.extend(child for child in value.values() if isinstance(child, (dict, list)))
+        elif isinstance(value, list):
+            stack.extend(child for child in value if isinstance(child, (dict, list)))
+
+
+def _subtree_hash(value:Any, node:list) -> bytes:
+    """Returns a hash of a dict or list, which is the same for equal values (the order of dict keys doesn't matter).
+
+    Built from the hashes of the dicts and lists in it, which are cached in a tree of nodes
+    mirroring the data: `[hash or None, {key or index: node}]`
+
+    Parameters
+    ----------
+    value : Any
+        The dict or list
+    node : list
+        The node of the value, its hash is stored in it
+
+    Returns
+    -------
+    bytes
+        The hash"""
+    if node[0] is not None:
+        return node[0]
+
+    child_nodes = node[1]
+    items:list[Any] = []
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if isinstance(child, (dict, list)):
+                child_node = child_nodes.get(key)
+                if child_node is None:
+                    child_node = child_nodes[key] = [None, {}]
+                # JSON data has no bytes, so a hash can't be mistaken for a value
+                child = _subtree_hash(child, child_node)
+            items.append((key, child))
+        try:
+            items.sort(key=itemgetter(0))
+        except TypeError:
+            items.sort(key=lambda item: repr(item[0]))
+        prefix = b'{'
+    else:
+        for index, child in enumerate(value):
+            if isinstance(child, (dict, list)):
+                child_node = child_nodes.get(index)
+                if child_node is None:
+                    child_node = child_nodes[index] = [None, {}]
+                child = _subtree_hash(child, child_node)
+            items.append(child)
+        prefix = b'['
+
+    try:
+        blob = marshal.dumps(items)
+    except ValueError:
+        # Not plain JSON data
+        blob = repr(items).encode()
+    node[0] = blake2b(prefix + blob, digest_size=16).digest()
+    return node[0]
+
+
+def _diff_values(old:Any, new:Any, old_node:list, new_node:list, parts:tuple, diff:dict[str, list]):
+    """Adds the keypath parts of the differences between two dicts or lists to `diff`,
+    going only into the dicts and lists whose hashes differ, see `JsonEditor.diff()`"""
+    if _subtree_hash(old, old_node) == _subtree_hash(new, new_node):
+        return
+
+    if isinstance(old, dict):
+        common_keys = []
+        for key in old:
+            if key in new:
+                common_keys.append(key)
+            else:
+                diff['removed'].append(parts + (key,))
+        diff['added'].extend(parts + (key,) for key in new if key not in old)
+    else:
+        common_keys = range(min(len(old), len(new)))
+        diff['removed'].extend(parts + (index,) for index in range(len(new), len(old)))
+        diff['added'].extend(parts + (index,) for index in range(len(old), len(new)))
+
+    for key in common_keys:
+        old_child, new_child = old[key], new[key]
+        if isinstance(old_child, dict) and isinstance(new_child, dict) or isinstance(old_child, list) and isinstance(new_child, list):
+            old_child_node = old_node[1].get(key) or old_node[1].setdefault(key, [None, {}])
+            new_child_node = new_node[1].get(key) or new_node[1].setdefault(key, [None, {}])
+            _diff_values(old_child, new_child, old_child_node, new_child_node, parts + (key,), diff)
+        # 1, 1.0 and True are equal in Python, but not in JSON
+        elif type(old_child) is not type(new_child) or old_child != new_child:
+            diff['changed'].append(parts + (key,))
+
+
+class JsonConflictError(Exception):
+    """Raised when a json file was changed by another process since a `JsonEditor` read it, and the changes can't be merged"""
+    pass
+
+
+class RawView:
+    """Reads the plain json data of a `JsonEditor` with keypaths, without going through benedict.
+
+    Keypaths are parsed like benedict does, and the parsed keypaths are cached (see `compile_keypath()`).
+    Dicts and lists are returned as is, so changing them changes the json data; the editor's indexes are forgotten
+    when they are returned, see `JsonEditor.invalidate_indexes()`"""
+    def __init__(self, json_editor:'JsonEditor') -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        json_editor : JsonEditor
+            The editor to read the data of"""
+        self._json_editor = json_editor
+
+
+    def __getitem__(self, keypath:str) -> Any:
+        """Returns the plain data at the keypath
+
+        Raises
+        ------
+        KeyError
+            If the keypath doesn't exist"""
+        parts = compile_keypath(keypath)
+        return self._json_editor._hand_out(get_keypath_value(self._json_editor.b_json_data.dict(), parts), parts)
+
+
+    def __contains__(self, keypath:str) -> bool:
+        """Checks if the keypath exists"""
+        try:
+            get_keypath_value(self._json_editor.b_json_data.dict(), compile_keypath(keypath))
+            return True
+        except KeyError:
+            return False
+
+
+    def get(self, keypath:str, default:Any=None) -> Any:
+        """Returns the plain data at the keypath, or `default` if it doesn't exist"""
+        parts = compile_keypath(keypath)
+        try:
+            return self._json_editor._hand_out(get_keypath_value(self._json_editor.b_json_data.dict(), parts), parts)
+        except KeyError:
+            return default
+
+
 class JsonEditor(EditorBase):
     """A class to read, edit and write json files"""
-    def __init__(self, file_path:str, exit_write:bool=True, do_print:bool=False) -> None:
+    def __init__(self, file_path:str, exit_write:bool=True, do_print:bool=False, backend:Optional[Union[str, JsonBackend]]=None, value_index:bool=True, journal:bool=False, journal_compact_size:Optional[int]=None, cache:bool=False, lock:bool=False, lock_timeout:Optional[float]=None, on_conflict:str='error', snapshot:bool=False, compact:bool=False, compression:Optional[str]='infer', compresslevel:Optional[int]=None) -> None:
         """Initialize the class
         
         Parameters
@@ -24,9 +195,71 @@ class JsonEditor(EditorBase):
         exit_write : bool, optional
             If True, the json file will be written to when the class is exited, by default True
         do_print : bool, optional
-            If True, print statements will be printed, by default False"""
+            If True, print statements will be printed, by default False
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to read and write with ('orjson', 'ujson', 'json'), by default None (the fastest installed one)
+        value_index : bool, optional
+            If True, an index of the values is used to find values, by default True.
+            The index is built on the first search, and rebuilt on the first search after a change (see `invalidate_indexes()`)
+        journal : bool, optional
+            If True, saving only appends the changes to a journal file next to the json file (`<file_path>.journal`), by default False.
+            The journal is replayed when the file is read, and folded back into the json file once it grows past `journal_compact_size`.
+            Only changes made through the methods of this class are journaled: once a dict or list of the data is handed out
+            (like `json_editor['a']`), the next save writes the whole json file, see `compact_journal()`
+        journal_compact_size : Optional[int], optional
+            The journal size (in bytes) after which it is folded into the json file, by default None (the size of the json file)
+        cache : bool, optional
+            If True, the json file is read through the process-wide `json_cache` (as a copy of the cached data), by default False
+        lock : bool, optional
+            If True, the json file is locked (see `file_lock()`) while it's read and written, by default False.
+            Before writing, the file is checked for changes made by other processes since it was read
+        lock_timeout : Optional[float], optional
+            The maximum time to wait for the lock, in seconds, by default None (wait forever)
+        on_conflict : str, optional
+            What to do when the file was changed by another process, in locking mode, by default 'error'.
+            'error' raises a `JsonConflictError`, 'merge' reads the file again and applies the changes made
+            through the methods of this class on top of it. Once a dict or list of the data was handed out
+            (like `json_editor['a']`), it may have been changed directly, which can't be merged, so that raises a `JsonConflictError` too
+        snapshot : bool, optional
+            If True, the parsed data is also stored in a binary snapshot file next to the json file (`<file_path>.snapshot`), by default False.
+            The snapshot is read instead of parsing the json file, as long as the json file is unchanged, and written again when the json file is.
+            The json file stays the one that counts: a snapshot that doesn't match it is ignored
+        compact : bool, optional
+            If True, the json file is loaded so it takes less memory, by default False.
+            The keys are interned and equal strings are stored once (see `compact_load()`); the data stays plain dicts and lists
+        compression : Optional[str], optional
+            The compression of the json file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz', by default 'infer'.
+            The journal and snapshot files are not compressed
+        compresslevel : Optional[int], optional
+            The compression level (the preset for xz), by default None (6 for gzip and xz, 9 for bz2)
+
+        Raises
+        ------
+        ValueError
+            If `on_conflict` is not 'error' or 'merge', or `cache` or `compact` is not a bool (frozen data, arrays and rows can't be edited)"""
+        if on_conflict not in ('error', 'merge'):
+            raise ValueError(f"Unknown on_conflict value {on_conflict!r}, use 'error' or 'merge'")
+        if cache not in (False, True):
+            raise ValueError(f'Unknown cache value {cache!r}, use True or False (the editor needs data it can change)')
+        if compact not in (False, True):
+            raise ValueError(f'Unknown compact value {compact!r}, use True or False (the editor needs plain dicts and lists)')
+
         super().__init__(file_path, do_print)
         self.exit_write = exit_write
+        self.backend = backend
+        self.value_index = value_index
+        self.journal = journal
+        self.journal_compact_size = journal_compact_size
+        self.cache = cache
+        self.lock = lock
+        self.lock_timeout = lock_timeout
+        self.on_conflict = on_conflict
+        self.snapshot = snapshot
+        self.compact = compact
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.write_stats = {'written': 0, 'skipped': 0, 'journaled': 0, 'merged': 0}
+        self._hash_tree:Optional[list] = None
         self.new_file(file_path)
 
         read_json.config(do_print=do_print)
@@ -35,13 +268,14 @@ class JsonEditor(EditorBase):
 
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Write the json file"""
+        """Write the json file, if the data was changed"""
         if self.exit_write:
-            write_json(self.b_json_data, self.file_path, force=True)
+            self.save_file(only_if_dirty=True)
 
 
     def __call__(self) -> benedict:
-        """Returns the json data"""
+        """Returns the json data. It can be changed directly, so the indexes are forgotten, see `invalidate_indexes()`"""
+        self.invalidate_indexes()
         return self.b_json_data
 
 
@@ -54,7 +288,18 @@ class JsonEditor(EditorBase):
             The key to add the data to
         data : Any
             The data to add"""
-        self.b_json_data[keypath] = data
+        parts = compile_keypath(keypath)
+        # benedict updates an existing dict in place, so its keys are unindexed before setting
+        self._update_key_index(parts, self._get_raw(parts), add=False)
+        try:
+            self.b_json_data[keypath] = data
+        except Exception:
+            self.rebuild_key_index()
+            raise
+        finally:
+            self._mark_changed(parts)
+        self._update_key_index(parts, self._get_raw(parts), add=True)
+        self._journal_op('set', keypath, data)
 
 
     def __getitem__(self, keypath:Any) -> Any:
@@ -70,8 +315,18 @@ class JsonEditor(EditorBase):
         Any
             The data from the json file
         """
+        # Plain values are found without benedict, dicts and lists are returned as benedict returns them
+        parts = self._plain_parts(keypath)
+        if parts is not None:
+            try:
+                value = get_keypath_value(self.b_json_data.dict(), parts)
+            except KeyError:
+                return None
+            if not isinstance(value, (dict, list)):
+                return value
+
         try:
-            return self.b_json_data[keypath]
+            return self._hand_out(self.b_json_data[keypath], parts)
         except KeyError:
             return None
 
@@ -83,7 +338,24 @@ class JsonEditor(EditorBase):
         ----------
         keys : str
             The key to delete"""
+        parts = compile_keypath(keys)
+        old_value = self._get_raw(parts)
         del self.b_json_data[keys]
+        self._mark_changed(parts)
+        self._update_key_index(parts, old_value, add=False)
+        self._journal_op('del', keys)
+
+
+    @staticmethod
+    def _plain_parts(keypath:Any) -> Optional[tuple]:
+        """Returns the parts of a keypath that can be looked up without benedict, see `compile_keypath()`.
+
+        Only keypaths written the way `join_keypath()` writes them are, as benedict reads some others differently
+        (`''` is the key `''`, and `'a/[0]'` doesn't exist). None for any other keypath"""
+        if not isinstance(keypath, str) or not keypath:
+            return None
+        parts = compile_keypath(keypath)
+        return parts if join_keypath(parts) == keypath else None
 
 
     def __contains__(self, keys:str) -> bool:
@@ -98,6 +370,14 @@ class JsonEditor(EditorBase):
         -------
         bool
             True if the key is in the json file, False if not"""
+        parts = self._plain_parts(keys)
+        if parts is not None:
+            try:
+                get_keypath_value(self.b_json_data.dict(), parts)
+                return True
+            except KeyError:
+                return False
+
         try:
             self.b_json_data[keys]
             return True
@@ -118,6 +398,7 @@ class JsonEditor(EditorBase):
 
     def __iter__(self):
         """Returns an iterator for the json file with the key and value"""
+        self.invalidate_indexes()
         for key, value in self.b_json_data.items():
             yield key, value
 
@@ -139,6 +420,7 @@ class JsonEditor(EditorBase):
         -------
         list[Any]
             All the values in the json file"""
+        self.invalidate_indexes()
         return self.b_json_data.values()
     
 
@@ -149,38 +431,781 @@ class JsonEditor(EditorBase):
         -------
         list[tuple[str, Any]]
             All the items in the json file"""
+        self.invalidate_indexes()
         return self.b_json_data.items()
 
     
-    def new_dict(self, new_dict:dict[Any, Any]):
+    def new_dict(self, new_dict:dict[Any, Any], check_keys:bool=True):
         """Updates the json file with a new dict
         
         Parameters
         ----------
         new_dict : dict
-            The new dict to update the json file with"""
-        self.b_json_data = benedict(new_dict, keypath_separator="/")
+            The new dict to update the json file with
+        check_keys : bool, optional
+            If True, a ValueError is raised if a key contains the keypath separator '/', by default True.
+            Only turn off for data that was checked before"""
+        if check_keys:
+            _check_keys(new_dict)
+        self.b_json_data = benedict(new_dict, keypath_separator="/", check_keys=False)
+        self._key_index:Optional[dict[str, set[str]]] = None
+        self._mark_changed()
+        # Replacing everything can't be journaled, so the next save writes the whole file
+        self._needs_compact = True
+
+
+    @property
+    def raw(self) -> RawView:
+        """Fast access to the plain json data, like `json_editor.raw['a/b[0]']`, see `RawView`"""
+        return RawView(self)
+
+
+    def _mark_changed(self, *parts_lst:tuple, keep_children:bool=False):
+        """Called after every change made through the class
+
+        Parameters
+        ----------
+        *parts_lst : tuple
+            The keypath parts of the changed (set or removed) values. If none are given, everything may have changed
+        keep_children : bool, optional
+            If True, the values in the changed values are unchanged (like after appending to a list), by default False"""
+        self._value_index:Optional[dict[Any, list[str]]] = None
+        self._touched = True
+
+        if self._hash_tree is None:
+            return
+        if not parts_lst:
+            self._hash_tree = None
+            return
+        for parts in parts_lst:
+            self._forget_hashes(parts, keep_children)
+
+
+    def _forget_hashes(self, parts:tuple, keep_children:bool):
+        """Forgets the cached subtree hashes of a changed value and the dicts and lists it's in
+
+        Parameters
+        ----------
+        parts : tuple
+            The keypath parts of the changed value
+        keep_children : bool
+            If True, the hashes of the values in the changed value are kept"""
+        if parts and isinstance(parts[-1], int) and not keep_children:
+            # The items after a set or removed list item may have moved, so the list is forgotten as a whole
+            parts = parts[:-1]
+        if not parts and not keep_children:
+            self._hash_tree = None
+            return
+
+        node = self._hash_tree
+        value = self.b_json_data.dict()
+        node[0] = None # type: ignore
+        for i, part in enumerate(parts):
+            if isinstance(part, int) and isinstance(value, list) and part < 0:
+                part += len(value)
+            if i == len(parts) - 1 and not keep_children:
+                node[1].pop(part, None) # type: ignore
+                return
+
+            node = node[1].get(part) # type: ignore
+            if node is None:
+                return
+            node[0] = None
+            try:
+                value = value[part]
+            except (KeyError, IndexError, TypeError):
+                value = None
+
+
+    def subtree_hash(self, keypath:str='') -> Optional[bytes]:
+        """Returns a hash of the dict or list at a keypath, which is the same for equal values.
+
+        The hashes of all dicts and lists are cached, and only the ones of changed values (and the dicts and lists they are in)
+        are computed again. Handing out a dict or list (like `json_editor['a']`) forgets the hashes of it and the dicts and lists it's in,
+        so `json_editor['a']['b'] = 1` is noticed; call `invalidate_indexes()` after changing a dict or list that was gotten before
+
+        Parameters
+        ----------
+        keypath : str, optional
+            The keypath of the dict or list, by default '' (the whole json file)
+
+        Returns
+        -------
+        Optional[bytes]
+            The hash, or None if there's no dict or list at the keypath"""
+        node = self._hash_root()
+        value = self.b_json_data.dict()
+        for part in compile_keypath(keypath) if keypath else ():
+            if isinstance(part, int) and isinstance(value, list) and part < 0:
+                part += len(value)
+            try:
+                value = value[part]
+            except (KeyError, IndexError, TypeError):
+                return None
+            if not isinstance(value, (dict, list)):
+                return None
+            node = node[1].get(part) or node[1].setdefault(part, [None, {}])
+        return _subtree_hash(value, node)
+
+
+    def _hash_root(self) -> list:
+        """Returns the root node of the cached subtree hashes, see `_subtree_hash()`"""
+        if self._hash_tree is None:
+            self._hash_tree = [None, {}]
+        return self._hash_tree
+
+
+    def diff(self, other:Any) -> dict[str, list[str]]:
+        """Compares the json data with another `JsonEditor` (or plain json data).
+
+        Only the dicts and lists whose hashes differ are gone through (see `subtree_hash()`), so finding
+        a few changes in a big document is fast once the hashes are cached. Lists are compared index by index
+
+        Parameters
+        ----------
+        other : JsonEditor | dict | list
+            The data to compare with
+
+        Returns
+        -------
+        dict[str, list[str]]
+            The keypaths that are only in `other` ('added'), only in this data ('removed'), or have a different value ('changed')"""
+        data = self.b_json_data.dict()
+        if isinstance(other, JsonEditor):
+            other_data, other_node = other.b_json_data.dict(), other._hash_root()
+        else:
+            other_data, other_node = other, [None, {}]
+
+        diff:dict[str, list] = {'added': [], 'removed': [], 'changed': []}
+        if isinstance(data, dict) and isinstance(other_data, dict) or isinstance(data, list) and isinstance(other_data, list):
+            _diff_values(data, other_data, self._hash_root(), other_node, (), diff)
+        elif type(data) is not type(other_data) or data != other_data:
+            diff['changed'].append(())
+        return {kind: [join_keypath(parts) for parts in parts_lst] for kind, parts_lst in diff.items()}
+
+
+    def _dumps(self) -> Optional[str]:
+        """Returns the json data as it's written to the json file
+
+        Returns
+        -------
+        Optional[str]
+            The JSON text, or None if the data can't be written as JSON"""
+        try:
+            return get_json_backend(self.backend).dumps(self.b_json_data.dict(), write_json.indent)
+        except TypeError:
+            return None
+
+
+    def _content_hash(self, text:Optional[str]=None) -> Optional[bytes]:
+        """Returns a hash of the json data, to find out if it was changed
+
+        Parameters
+        ----------
+        text : Optional[str], optional
+            The json data from `_dumps()`, if it was already serialized, by default None
+
+        Returns
+        -------
+        Optional[bytes]
+            The hash, or None if the data can't be written as JSON"""
+        if text is None:
+            text = self._dumps()
+            if text is None:
+                return None
+        return blake2b(text.encode(), digest_size=16).digest()
+
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if the json data differs from the data last read from or written to the file.
+
+        Compares a hash of the data, so changes made directly to the data (like `json_editor['a']['b'] = 1`) are noticed too.
+        With `exit_write=False`, the loaded data is not hashed, so this is True once anything was changed or handed out
+        (until the file is written). In journal mode, this is True once a dict or list was handed out, as it may have been changed directly"""
+        if self.journal:
+            return self._needs_compact or self._handed_out or bool(self._journal_lines)
+
+        if self._saved_hash_pending and not self._touched:
+            return False
+        current_hash = self._content_hash()
+        return current_hash is None or current_hash != self._saved_hash
+
+
+    def _build_value_index(self) -> dict[Any, list[str]]:
+        """Builds an index of the (hashable) leaf values and the keypaths they are in
+
+        Returns
+        -------
+        dict[Any, list[str]]
+            The values and their keypaths, sorted lexically like `keypaths()`"""
+        value_index:dict[Any, list[str]] = {}
+
+        def add_keypaths(value:Any, keypath:str):
+            if isinstance(value, dict):
+                for key, sub_value in value.items():
+                    add_keypaths(sub_value, f'{keypath}/{key}' if keypath else f'{key}')
+            elif isinstance(value, (list, tuple)):
+                for i, sub_value in enumerate(value):
+                    add_keypaths(sub_value, f'{keypath}[{i}]')
+            else:
+                try:
+                    value_index.setdefault(value, []).append(keypath)
+                except TypeError:
+                    # Not hashable, found by the slow search only
+                    pass
+
+        add_keypaths(self.b_json_data.dict(), '')
+        for keypaths in value_index.values():
+            keypaths.sort()
+
+        return value_index
+
+
+    def _find_indexed_keypaths(self, value:Any) -> Optional[list[str]]:
+        """Finds the keypaths of a value with the value index, with the same matching as `_yield_keypaths()`
+
+        Parameters
+        ----------
+        value : Any
+            The value to search for
+
+        Returns
+        -------
+        Optional[list[str]]
+            The keypaths, sorted lexically like `keypaths()`. None if the value can't be searched with the index"""
+        if not self.value_index or isinstance(value, dict):
+            return None
+
+        # A sequence matches every keypath whose value is one of its items
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            values = value
+        else:
+            values = [value]
+
+        try:
+            values = set(values)
+        except TypeError:
+            # Containers in the values, which are not in the index
+            return None
+
+        if self._value_index is None:
+            self._value_index = self._build_value_index()
+
+        if len(values) == 1:
+            return self._value_index.get(next(iter(values)), [])
+
+        # Values like 1 and True share the same keypaths, so they are combined with a set
+        keypaths = set()
+        for sub_value in values:
+            keypaths.update(self._value_index.get(sub_value, []))
+        return sorted(keypaths)
+
+
+    def _get_raw(self, parts:tuple, default:Any=None) -> Any:
+        """Returns the plain (not benedict) data at the given keypath parts
+
+        Parameters
+        ----------
+        parts : tuple
+            The keys and list indexes of the keypath, see `compile_keypath()`
+        default : Any, optional
+            The value to return if the keypath doesn't exist, by default None
+
+        Returns
+        -------
+        Any
+            The data, or `default`"""
+        value = self.b_json_data.dict()
+        try:
+            for part in parts:
+                value = value[part]
+        except (KeyError, IndexError, TypeError):
+            return default
+        return value
+
+
+    def _index_keys(self, keys:list, value:Any, add:bool):
+        """Adds or removes a keypath, and the keypaths of the dicts in its value, to/from the key index
+
+        Parameters
+        ----------
+        keys : list
+            The keys of the keypath
+        value : Any
+            The value at the keypath
+        add : bool
+            If True the keypaths are added, if False removed"""
+        keypath = '/'.join(str(key) for key in keys)
+        leaf_key = keypath.rsplit('/', 1)[-1]
+
+        if add:
+            self._key_index.setdefault(leaf_key, set()).add(keypath)
+        else:
+            keypaths = self._key_index.get(leaf_key, set())
+            keypaths.discard(keypath)
+            if not keypaths:
+                self._key_index.pop(leaf_key, None)
+
+        # Like keypaths(False), keys inside lists are not indexed
+        if isinstance(value, dict):
+            for key, sub_value in value.items():
+                self._index_keys(keys + [key], sub_value, add)
+
+
+    def _update_key_index(self, parts:tuple, value:Any, add:bool):
+        """Updates the key index for a changed keypath.
+        Called with the old data when the keypath is removed or overwritten, and with the new data after it is set
+
+        Parameters
+        ----------
+        parts : tuple
+            The keys and list indexes of the changed keypath
+        value : Any
+            The data at the keypath
+        add : bool
+            If True the keypath was set, if False it is being removed or overwritten"""
+        if self._key_index is None:
+            # Built again when it's needed
+            return
+
+        # Only the keys reached through dicts are indexed, like in keypaths(False)
+        keys = []
+        container = self.b_json_data.dict()
+        for part in parts:
+            if not isinstance(container, dict):
+                break
+            keys.append(part)
+            container = container.get(part)
+
+        if not keys:
+            return
+
+        # Changes inside lists don't change the indexed keypaths
+        in_list = len(keys) < len(parts)
+        if not add:
+            if not in_list:
+                self._index_keys(keys, value, add=False)
+            return
+
+        # Parents are created automatically when setting a keypath
+        for i in range(1, len(keys) + in_list):
+            self._index_keys(keys[:i], None, add=True)
+        if not in_list:
+            self._index_keys(keys, value, add=True)
+
+
+    def rebuild_key_index(self):
+        """Rebuilds the index used by `does_key_exists()` and `append()`.
+
+        The index is kept up to date by the methods of this class (or built again on its next use,
+        after bigger changes), see `invalidate_indexes()` for changes made directly to the data"""
+        key_index:dict[str, set[str]] = {}
+
+        # The same as calling `_index_keys()` for every key, without building the key lists
+        def index_keys(value:dict, parent_keypath:str):
+            for key, sub_value in value.items():
+                keypath = f'{parent_keypath}/{key}' if parent_keypath else f'{key}'
+                leaf_key = f'{key}'
+                if '/' in leaf_key:
+                    leaf_key = leaf_key.rsplit('/', 1)[-1]
+
+                keypaths = key_index.get(leaf_key)
+                if keypaths is None:
+                    key_index[leaf_key] = {keypath}
+                else:
+                    keypaths.add(keypath)
+
+                if isinstance(sub_value, dict):
+                    index_keys(sub_value, keypath)
+
+        index_keys(self.b_json_data.dict(), '')
+        self._key_index = key_index
+
+
+    def invalidate_indexes(self):
+        """Forgets the key index, the value index and the cached subtree hashes, so they are built again on their next use.
+
+        The editor's methods keep the indexes up to date, but changes made directly to the data are not known.
+        So the indexes are forgotten whenever a dict or list of the data is handed out (like `json_editor['a']`,
+        `json_editor.raw['a']`, `json_editor()`, `items()` or `values()`), and `json_editor['a']['b'] = 1` is noticed.
+        Call this after changing a dict or list that was gotten before an index was last used, or `b_json_data` itself"""
+        self._key_index = None
+        self._value_index = None
+        self._hash_tree = None
+        self._touched = True
+        self._handed_out = True
+
+
+    def _hand_out(self, value:Any, parts:Optional[tuple]=None) -> Any:
+        """Returns a value of the data, forgetting the indexes if it's a dict or list that can be changed directly
+
+        Parameters
+        ----------
+        value : Any
+            The value to hand out
+        parts : Optional[tuple], optional
+            The keypath parts of the value. If given, only the subtree hashes of the value and the dicts and lists
+            it's in are forgotten, as nothing else can be changed through it. By default None (all of them)"""
+        if isinstance(value, (dict, list)):
+            hash_tree = self._hash_tree
+            self.invalidate_indexes()
+            if parts and hash_tree is not None:
+                self._hash_tree = hash_tree
+                self._forget_hashes(parts, keep_children=False)
+        return value
+
+
+    @property
+    def journal_path(self) -> str:
+        """The path to the journal file"""
+        return f'{self.file_path}.journal'
+
+
+    def _file_stat(self) -> dict[str, Optional[int]]:
+        """Returns the inode, size and modification time of the json file.
+
+        Written at the start of the journal, so a journal is only replayed on the json file it was made for"""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return {'ino': None, 'size': None, 'mtime_ns': None}
+        return {'ino': stat.st_ino, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+    def _disk_version_now(self) -> tuple:
+        """Returns the version of the json file (and journal) on disk, which changes with every write"""
+        journal_stat = None
+        if self.journal:
+            try:
+                stat = os.stat(self.journal_path)
+                journal_stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                pass
+        return (tuple(self._file_stat().values()), journal_stat)
+
+
+    def _with_lock(self, func:Any, *args:Any) -> Any:
+        """Runs `func(*args)` while holding the file lock, in locking mode.
+        If the file was changed by another process since it was read, the conflict is resolved first
+
+        Parameters
+        ----------
+        func : Any
+            The function that writes the file
+        args : Any
+            The arguments to call `func` with
+
+        Returns
+        -------
+        Any
+            The return value of `func`"""
+        if not self.lock:
+            return func(*args)
+
+        with file_lock(self.file_path, self.lock_timeout):
+            if self._disk_version_now() != self._disk_version:
+                self._resolve_conflict()
+            result = func(*args)
+            self._disk_version = self._disk_version_now()
+        return result
+
+
+    def _resolve_conflict(self):
+        """Reads the file again after another process changed it, and applies the changes made through
+        the methods of this class on top of it. Called while holding the file lock
+
+        Raises
+        ------
+        JsonConflictError
+            If there are changes, and `on_conflict` is 'error' or the changes can't be merged"""
+        pending_lines = self._journal_lines
+        # A handed out dict or list may hold direct changes, which aren't in the pending lines and can't be merged
+        if self.is_dirty and (self.on_conflict != 'merge' or self._needs_compact or not pending_lines or self._handed_out):
+            raise JsonConflictError(f'The json file was changed by another process since it was read: {self.file_path}')
+
+        self._load()
+        if not pending_lines:
+            return
+
+        backend = get_json_backend(self.backend)
+        for line in pending_lines:
+            self._apply_record(backend.loads(line))
+        self._key_index = None
+        self._mark_changed()
+        self._journal_lines = pending_lines
+        self.write_stats['merged'] += 1
+        fprint(f'Merged {len(pending_lines)} changes into the changed json file: {self.file_path}')
+
+
+    def _journal_op(self, op:str, keypath:str, *value:Any):
+        """Adds a change to the lines waiting to be saved, in journal mode (or to merge them, in locking mode)
+
+        Parameters
+        ----------
+        op : str
+            'set', 'del', 'append', 'remove' or 'prune'
+        keypath : str
+            The changed keypath
+        value : Any
+            The new (set) or appended value, the removed paths (remove) or the removed empty values (prune), if any"""
+        if not (self.journal or self.lock) or self._needs_compact:
+            return
+
+        record = {'op': op, 'path': keypath}
+        if value:
+            record['value'] = value[0]
+
+        # Serialized right away, as the value may be changed in place later on
+        try:
+            self._journal_lines.append(get_json_backend(self.backend).dumps(record))
+        except TypeError:
+            self._needs_compact = True
+
+
+    def _apply_record(self, record:dict[str, Any]):
+        """Applies a change from the journal to the json data, without updating the indexes
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            The change, see `_journal_op()`"""
+        if record['op'] == 'set':
+            self.b_json_data[record['path']] = record['value']
+        elif record['op'] == 'del':
+            self.b_json_data.remove(record['path'])
+        elif record['op'] == 'append':
+            self._get_raw(compile_keypath(record['path'])).append(record['value'])
+        elif record['op'] == 'remove':
+            self._remove_parts([compile_keypath(path) for path in record['value']])
+        elif record['op'] == 'prune':
+            self._prune_empty(self._get_raw(split_keypath(record['path'])), record['value'])
+
+
+    def _replay_journal(self) -> int:
+        """Applies the changes in the journal file to the json data
+
+        Returns
+        -------
+        int
+            The amount of changes applied"""
+        if not os.path.exists(self.journal_path):
+            return 0
+
+        records = read_jsonl(self.journal_path, backend=self.backend)
+        if next(records, None) != {'op': 'base', **self._file_stat()}:
+            # The json file was written after the journal was started, so the changes are already in it (or outdated)
+            fprint(f'Journal does not match the json file, removing it: {self.journal_path}')
+            records.close()
+            os.remove(self.journal_path)
+            return 0
+
+        op_amnt = 0
+        for record in records:
+            self._apply_record(record)
+            op_amnt += 1
+
+        self._key_index = None
+        self._mark_changed()
+        fprint(f'Replayed {op_amnt} changes from journal: {self.journal_path}')
+        return op_amnt
+
+
+    def compact_journal(self) -> bool:
+        """Writes the whole json file and removes the journal.
+
+        Saving does this on its own after a dict or list of the data was handed out (like `json_editor['a']['b'] = 1`),
+        as changes made directly to the data are not journaled. Call this (or `invalidate_indexes()`) after changing
+        a dict or list that was gotten before the last save
+
+        Returns
+        -------
+        bool
+            True if the file was written"""
+        return self._with_lock(self._compact)
+
+
+    def _compact(self) -> bool:
+        """Writes the whole json file and removes the journal, see `compact_journal()`"""
+        if not self._write_file():
+            return False
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_base = self._file_stat()
+        return True
+
+
+    def _save_journal(self) -> bool:
+        """Appends the waiting changes to the journal file, and compacts it if it got too big.
+        If a dict or list of the data was handed out, it may have been changed directly, which can't be journaled,
+        so the whole json file is written instead
+
+        Returns
+        -------
+        bool
+            True if anything was written"""
+        if self._needs_compact or self._handed_out:
+            return self._compact()
+
+        if not self._journal_lines:
+            self.write_stats['skipped'] += 1
+            fprint(f'No changes, not writing: {self.file_path}')
+            return False
+
+        with open(self.journal_path, 'ab') as f:
+            if f.tell() == 0:
+                f.write((get_json_backend(self.backend).dumps({'op': 'base', **self._journal_base}) + '\n').encode())
+            f.write(('\n'.join(self._journal_lines) + '\n').encode())
+            journal_size = f.tell()
+
+        self.write_stats['journaled'] += 1
+        fprint(f'Journaled {len(self._journal_lines)} changes: {self.journal_path}')
+        self._journal_lines = []
+
+        compact_size = self.journal_compact_size
+        if compact_size is None:
+            compact_size = self._journal_base['size'] or 0
+        if journal_size > compact_size:
+            self._compact()
+        return True
 
 
     def new_file(self, file_path:str):
-        """Updates the json file path and reads the json file
+        """Updates the json file path and reads the json file.
+        In journal mode, the changes in the journal are applied
         
         Parameters
         ----------
         file_path : str
             The path to the json file"""
         self.file_path = file_path
-        self.new_dict(read_json(self.file_path))
+        if self.lock:
+            with file_lock(self.file_path, self.lock_timeout):
+                self._load()
+        else:
+            self._load()
+
+
+    def _load(self):
+        """Reads the json file (and applies the journal), see `new_file()`"""
+        found, snapshot_data = load_snapshot(self.file_path) if self.snapshot else (False, None)
+        if found:
+            # The keys were checked before the snapshot was written
+            saved_hash, data = snapshot_data
+            self.new_dict(data, check_keys=False)
+        else:
+            self.new_dict(read_json(self.file_path, backend=self.backend, cache=self.cache, compact=self.compact, compression=self.compression))
+            # Only hashed if it's needed right away, see below
+            saved_hash = self._content_hash() if self.exit_write and not self.journal else None
+            if self.snapshot:
+                self._write_snapshot(saved_hash)
+        self._journal_lines:list[str] = []
+        self._needs_compact = False
+
+        if self.journal:
+            self._journal_base = self._file_stat()
+            self._replay_journal()
+            # Hashing needs the whole data serialized, which the journal avoids
+            saved_hash = None
+        elif saved_hash is None and self.exit_write:
+            saved_hash = self._content_hash()
+        self._saved_hash = saved_hash
+        # Without writing on exit, the loaded data isn't hashed: until something is changed or handed out,
+        # the data is known to be unchanged, and after that `is_dirty` is True until the file is written
+        self._saved_hash_pending = saved_hash is None and not self.journal
+        self._touched = False
+        self._handed_out = False
+        self._disk_version = self._disk_version_now()
+
+
+    def _write_snapshot(self, content_hash:Optional[bytes]):
+        """Writes the snapshot of the json file, right after it was read or written.
+        The hash of the data is stored with it, so it doesn't have to be computed when the snapshot is read"""
+        write_snapshot(self.file_path, (content_hash, self.b_json_data.dict()))
+
+
+    def save_file(self, only_if_dirty:bool=False) -> bool:
+        """Writes the json file.
+        In journal mode, only the changes made since the last save are appended to the journal
+
+        Parameters
+        ----------
+        only_if_dirty : bool, optional
+            If True, the file is only written if the data was changed (see `is_dirty`), by default False.
+            Always the case in journal mode
+
+        Returns
+        -------
+        bool
+            True if the file (or journal) was written
+
+        Raises
+        ------
+        JsonConflictError
+            In locking mode, if the file was changed by another process and the changes can't be merged (see `on_conflict`)"""
+        # Unchanged data doesn't need the lock
+        if self.lock and only_if_dirty and not self.is_dirty:
+            self.write_stats['skipped'] += 1
+            fprint(f'No changes, not writing: {self.file_path}')
+            return False
+
+        return self._with_lock(self._save, only_if_dirty)
+
+
+    def _save(self, only_if_dirty:bool) -> bool:
+        """Writes the json file or the journal, see `save_file()`"""
+        if self.journal:
+            return self._save_journal()
+
+        if only_if_dirty and not self.is_dirty:
+            self.write_stats['skipped'] += 1
+            fprint(f'No changes, not writing: {self.file_path}')
+            return False
+        return self._write_file()
+
+
+    def _write_file(self) -> bool:
+        """Writes the whole json file (and snapshot), serializing the data once for both the file and its hash
 
+        Returns
+        -------
+        bool
+            True if the file was written"""
+        text = self._dumps()
+        if text is None:
+            fprint(f'Data can\'t be written to JSON, not writing: {self.file_path}')
+            return False
 
-    def save_file(self):
-        """Writes the json file"""
-        write_json(self.b_json_data, self.file_path, force=True)
+        try:
+            with atomic_open(self.file_path, 'w', compression=self.compression, compresslevel=self.compresslevel) as f:
+                f.write(text)
+        except FileNotFoundError:
+            if not create_dirs(self.file_path, do_print=False):
+                return False
+            with atomic_open(self.file_path, 'w', compression=self.compression, compresslevel=self.compresslevel) as f:
+                f.write(text)
+        fprint(f'Wrote data to JSON file: {self.file_path}')
+
+        content_hash = self._content_hash(text)
+        self.write_stats['written'] += 1
+        if self.snapshot:
+            self._write_snapshot(content_hash)
+        self._saved_hash = content_hash
+        self._saved_hash_pending = False
+        self._touched = False
+        self._handed_out = False
+        self._journal_lines = []
+        self._needs_compact = False
+        return True
 
 
     def remove_file(self):
-        """Removes the json file"""
+        """Removes the json file, and its journal and snapshot"""
         send2trash(self.file_path)
+        for file_path in (self.journal_path, snapshot_path(self.file_path)):
+            if os.path.exists(file_path):
+                send2trash(file_path)
 
 
     def append(self, keypath:str, data) -> str:
@@ -200,10 +1225,15 @@ class JsonEditor(EditorBase):
         """
         if not self.does_key_exists(keypath):
             self[keypath] = [data]
-        else:
-            self[keypath].append(data)
+            return f'{keypath}[0]'
+
+        # The plain list is used, as getting a list through benedict goes through all of its items
+        data_list = self._get_raw(compile_keypath(keypath))
+        data_list.append(data)
+        self._mark_changed(compile_keypath(keypath), keep_children=True)
+        self._journal_op('append', keypath, data)
 
-        return f'{keypath}[{len(self[keypath])-1}]'
+        return f'{keypath}[{len(data_list)-1}]'
 
 
     def keypaths(self, with_indexes:bool=True) -> list[str]:
@@ -240,6 +1270,9 @@ class JsonEditor(EditorBase):
     def does_key_exists(self, key:str) -> bool:
         """Checks if a key or keypath is in the json file
 
+        Uses an index of the keys, so this takes the same time no matter how big the json file is.
+        A found key is checked to still be in the data, so keys removed directly are not found
+
         Parameters
         ----------
         key : str
@@ -249,10 +1282,23 @@ class JsonEditor(EditorBase):
         -------
         bool
             True if the key is in the json file, False if not"""
-        for keypath in self.keypaths(False):
-            if keypath.split('/')[-1] == key:
+        if self._key_index is None:
+            self.rebuild_key_index()
+        keypaths = self._key_index.get(key) # type: ignore
+        if not keypaths:
+            return False
+
+        data = self.b_json_data.dict()
+        for keypath in keypaths:
+            try:
+                get_keypath_value(data, compile_keypath(keypath))
                 return True
-        return False
+            except KeyError:
+                pass
+
+        # The index is out of date
+        self.rebuild_key_index()
+        return key in self._key_index # type: ignore
         
 
     def _yield_keypaths(self, value, search_key:Optional[str]=None, remove_last_key:bool=False):
@@ -316,8 +1362,12 @@ class JsonEditor(EditorBase):
             return ''
 
 
-        for keypath in self.keypaths():
-            if not check_keypath_value(self[keypath]) or (search_key and search_key not in keypath):
+        keypaths = self._find_indexed_keypaths(value)
+        if keypaths is None:
+            keypaths = [keypath for keypath in self.keypaths() if check_keypath_value(self._get_raw(compile_keypath(keypath)))]
+
+        for keypath in keypaths:
+            if search_key and search_key not in keypath:
                 continue
 
             if remove_last_key:
@@ -369,6 +1419,101 @@ class JsonEditor(EditorBase):
         return [keypath for keypath in self._yield_keypaths(value, key, remove_last_key)]
             
 
+
+    def query(self, query:str) -> list[Any]:
+        """Finds the values matching a query, like `users/*/email`, `**/email`, `items[?price>10]` or `users/*/{name,email}`.
+        The query is compiled once and cached, see `compile_query()` for the syntax
+
+        Parameters
+        ----------
+        query : str
+            The query
+
+        Returns
+        -------
+        list[Any]
+            The matching values (plain dicts and lists, not copies), in document order.
+            They can be changed directly, so the indexes are forgotten if any is a dict or list, see `invalidate_indexes()`"""
+        values = compile_query(query).values(self.b_json_data.dict())
+        if any(isinstance(value, (dict, list)) for value in values):
+            self.invalidate_indexes()
+        return values
+
+
+    def query_paths(self, query:str) -> list[str]:
+        """Finds the keypaths of the values matching a query, see `query()`
+
+        Parameters
+        ----------
+        query : str
+            The query
+
+        Returns
+        -------
+        list[str]
+            The keypaths, like `'users/a/email'`, which can be given to `remove_paths()` and so on"""
+        return compile_query(query).paths(self.b_json_data.dict())
+
+
+    def to_columns(self, keypath:str, fields:Optional[Iterable[str]]=None, use_numpy:Optional[bool]=None) -> dict[str, Column]:
+        """Turns the list of records (dicts) at a keypath into a column per field, for vectorized aggregations.
+        Numbers and bools go in `array.array`s, or NumPy arrays if NumPy is installed; see `to_columns()`
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath of the list of records
+        fields : Optional[Iterable[str]], optional
+            The fields to make columns of, by default None (every field)
+        use_numpy : Optional[bool], optional
+            Whether to make NumPy arrays instead of `array.array`s, by default None (if NumPy is installed)
+
+        Returns
+        -------
+        dict[str, Column]
+            The columns by field, with the values and a mask of the null (or missing) values
+
+        Raises
+        ------
+        KeyError
+            If the keypath doesn't exist
+        TypeError
+            If the value is not a list of records"""
+        records = get_keypath_value(self.b_json_data.dict(), compile_keypath(keypath))
+        if not isinstance(records, list):
+            raise TypeError(f'Value at {keypath!r} is not a list, but a {type(records).__name__}')
+        return to_columns(records, fields, use_numpy)
+
+
+    def from_columns(self, keypath:str, columns:Mapping[str, Union[Column, Sequence]], update:bool=False, drop_nulls:bool=False):
+        """Writes columns (from `to_columns()`, or any sequences of values) to the keypath as a list of records
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath to write the records to
+        columns : Mapping[str, Column | Sequence]
+            The columns by field
+        update : bool, optional
+            If True, the fields of the columns are set in the records already at the keypath
+            (which have to be as many as the values), instead of replacing the list, by default False
+        drop_nulls : bool, optional
+            If True, all null values are left out of the records instead of written as null, by default False.
+            Fields the records were without (see `Column.missing`) are always left out
+
+        Raises
+        ------
+        ValueError
+            If the columns are not of the same length, or not as long as the records to update"""
+        records = from_columns(columns, drop_nulls)
+        if update:
+            old_records = get_keypath_value(self.b_json_data.dict(), compile_keypath(keypath))
+            if not isinstance(old_records, list) or len(old_records) != len(records):
+                raise ValueError(f'Can only update a list of {len(records)} records at {keypath!r}')
+            records = [{**old_record, **record} for old_record, record in zip(old_records, records)]
+        self[keypath] = records
+
+
     def count_occurance(self, value:Any, key:Optional[Any]=None) -> int:
         """Count the number of times a value occurs in the json file
 
@@ -390,6 +1535,82 @@ class JsonEditor(EditorBase):
             return len([values[1] for values in self.b_json_data.search(value) if values[1] == key])
         
 
+    def _remove_parts(self, parts_lst:list[tuple]) -> tuple[int, list[tuple[tuple, Any]]]:
+        """Removes many keypaths at once, grouped by the dict or list they are in
+
+        Parameters
+        ----------
+        parts_lst : list[tuple]
+            The keys and list indexes of the keypaths to remove, see `compile_keypath()`.
+            All of them refer to the data before anything is removed
+
+        Returns
+        -------
+        tuple[int, list[tuple[tuple, Any]]]
+            The amount of removed values, and the parts and old values of the keypaths removed from dicts"""
+        removals:dict[tuple, set] = {}
+        for parts in parts_lst:
+            if parts:
+                removals.setdefault(parts[:-1], set()).add(parts[-1])
+
+        # Every container is found before anything is removed, as removing list items shifts the later ones
+        containers = []
+        for parent_parts, keys in removals.items():
+            # Nothing has to be removed inside a value that is removed itself
+            if any(parent_parts[i-1] in removals.get(parent_parts[:i-1], ()) for i in range(1, len(parent_parts) + 1)):
+                continue
+            container = self._get_raw(parent_parts)
+            if isinstance(container, (dict, list)):
+                containers.append((parent_parts, container, keys))
+
+        removed_amnt = 0
+        removed_from_dicts = []
+        for parent_parts, container, keys in containers:
+            if isinstance(container, dict):
+                for key in keys:
+                    if key in container:
+                        removed_from_dicts.append((parent_parts + (key,), container.pop(key)))
+                        removed_amnt += 1
+            else:
+                # The list is built again once, instead of deleting the items one by one
+                keys = {key + len(container) if isinstance(key, int) and key < 0 else key for key in keys}
+                kept_values = [value for i, value in enumerate(container) if i not in keys]
+                removed_amnt += len(container) - len(kept_values)
+                container[:] = kept_values
+
+        return removed_amnt, removed_from_dicts
+
+
+    def remove_paths(self, paths:Iterable[str]) -> int:
+        """Removes many paths from the json file at once.
+
+        The paths are grouped by the dict or list they are in, and every list is built again only once,
+        so list indexes don't have to be removed in reverse order. Paths that don't exist are skipped.
+
+        WARNING: This will remove all data after the paths as well
+        
+        Parameters
+        ----------
+        paths : Iterable[str]
+            The paths to remove. All of them refer to the json data before anything is removed
+
+        Returns
+        -------
+        int
+            The amount of removed paths"""
+        paths = list(paths)
+        parts_lst = [compile_keypath(path) for path in paths]
+        removed_amnt, removed_from_dicts = self._remove_parts(parts_lst)
+        if not removed_amnt:
+            return 0
+
+        self._mark_changed(*parts_lst)
+        for parts, old_value in removed_from_dicts:
+            self._update_key_index(parts, old_value, add=False)
+        self._journal_op('remove', '', paths)
+        return removed_amnt
+
+
     def remove_path(self, path:str):
         """Removes a path from the json file
 
@@ -399,7 +1620,12 @@ class JsonEditor(EditorBase):
         ----------
         path : str
             The path to remove"""
+        parts = compile_keypath(path)
+        old_value = self._get_raw(parts)
         self.b_json_data.remove(path)
+        self._mark_changed(parts)
+        self._update_key_index(parts, old_value, add=False)
+        self._journal_op('del', path)
 
     
     def remove_all_occurance(self, value:Any, keypath:Optional[str]=None) -> int:
@@ -417,33 +1643,130 @@ class JsonEditor(EditorBase):
         int
             The number of times the value was removed
         """
+        return self.remove_paths(self.find_value_path_all(value, keypath))
+
+
+    def _prune_empty(self, container:Any, empty_values:list[Any]) -> int:
+        """Removes the empty values in a (plain) dict or list and everything in it, bottom-up,
+        so containers that become empty are removed as well
+
+        Parameters
+        ----------
+        container : Any
+            The dict or list to remove the empty values in
+        empty_values : list[Any]
+            The values to remove
+
+        Returns
+        -------
+        int
+            The amount of removed values"""
+        # Hashable values are looked up in a set, the others (like {} and []) compared one by one
+        hashable_empty = set()
+        unhashable_empty = []
+        for empty_value in empty_values:
+            try:
+                hashable_empty.add(empty_value)
+            except TypeError:
+                unhashable_empty.append(empty_value)
+
+        remove_empty_dict = {} in unhashable_empty
+        remove_empty_list = [] in unhashable_empty
+        nonempty_unhashable = [empty_value for empty_value in unhashable_empty if empty_value]
         removed_amnt = 0
-        for path in self.find_value_path_all(value, keypath):
-            self.remove_path(path)
-            removed_amnt += 1
 
+        def is_empty(value:Any) -> bool:
+            """Prunes the value if it's a dict or a list, and checks if it should be removed"""
+            if isinstance(value, (dict, list)):
+                if value:
+                    prune(value)
+                elif isinstance(value, dict):
+                    return remove_empty_dict
+                else:
+                    return remove_empty_list
+            try:
+                return value in hashable_empty
+            except TypeError:
+                return value in unhashable_empty
+
+        # This runs for every value in the json file, so `is_empty()` is inlined for plain dicts, lists and values
+        def prune(value:Any):
+            nonlocal removed_amnt
+            if isinstance(value, dict):
+                empty_keys = []
+                for key, sub_value in value.items():
+                    sub_type = type(sub_value)
+                    if sub_type is dict or sub_type is list:
+                        if sub_value:
+                            prune(sub_value)
+                        if not sub_value:
+                            if remove_empty_dict if sub_type is dict else remove_empty_list:
+                                empty_keys.append(key)
+                        elif nonempty_unhashable and sub_value in nonempty_unhashable:
+                            empty_keys.append(key)
+                    elif sub_type in _JSON_SCALARS:
+                        if sub_value in hashable_empty:
+                            empty_keys.append(key)
+                    elif is_empty(sub_value):
+                        empty_keys.append(key)
+
+                for key in empty_keys:
+                    del value[key]
+                removed_amnt += len(empty_keys)
+                return
+
+            kept_values = []
+            for sub_value in value:
+                sub_type = type(sub_value)
+                if sub_type is dict or sub_type is list:
+                    if sub_value:
+                        prune(sub_value)
+                    if not sub_value:
+                        if not (remove_empty_dict if sub_type is dict else remove_empty_list):
+                            kept_values.append(sub_value)
+                    elif not (nonempty_unhashable and sub_value in nonempty_unhashable):
+                        kept_values.append(sub_value)
+                elif sub_type in _JSON_SCALARS:
+                    if sub_value not in hashable_empty:
+                        kept_values.append(sub_value)
+                elif not is_empty(sub_value):
+                    kept_values.append(sub_value)
+
+            if len(kept_values) < len(value):
+                removed_amnt += len(value) - len(kept_values)
+                value[:] = kept_values
+
+        if isinstance(container, (dict, list)):
+            prune(container)
         return removed_amnt
 
 
-    def remove_empty_values(self, master_keypath:str='', empty_values:list[Any]=[None, {}, []]):
+    def remove_empty_values(self, master_keypath:str='', empty_values:list[Any]=[None, {}, []]) -> int:
         """Removes all empty values from the json file.
-         Also removes the keys that contain the empty values.
+         Also removes the keys that contain the empty values,
+         and the dicts and lists that become empty when their empty values are removed.
 
         Parameters
         ----------
         master_keypath : str, optional
-            The keypath to the value that should be removed in, by default ''
+            The keypath to remove the empty values in, by default '' (the whole json file).
+            The value at the keypath itself is not removed
         empty_values : list[Any], optional
-            The values to remove, by default None, {}, []]
-        """
-        for keypath in self.keypaths():
-            keypath_value = self[keypath]
+            The values to remove, by default [None, {}, []]
 
-            if master_keypath != '' and master_keypath not in keypath:
-                continue
-
-            if keypath_value in empty_values:
-                self.remove_path(keypath)
+        Returns
+        -------
+        int
+            The amount of removed values
+        """
+        # split_keypath() gives no parts (the whole json file) for ''
+        master_parts = split_keypath(master_keypath)
+        removed_amnt = self._prune_empty(self._get_raw(master_parts), empty_values)
+        if removed_amnt:
+            self._key_index = None
+            self._mark_changed(master_parts)
+            self._journal_op('prune', master_keypath, empty_values)
+        return removed_amnt
 
 
     def remove_duplicates(self, value:Any, master_keypath:str='', only_in_key:str='') -> int:
@@ -485,19 +1808,11 @@ class JsonEditor(EditorBase):
 
         # If no master keypath is given, keep the first item
         if not master_keypath:
-            for path in path_lst[1:][::-1]:
-                self.remove_path(path)
-                removed_amnt += 1
-            return removed_amnt
+            return self.remove_paths(path_lst[1:])
         
         # If master keypath is given, but not in path list, raise error
         if master_keypath not in path_lst:
             raise Exception(f'Master keypath {master_keypath} not in path list')
 
         # Remove all duplicates
-        for path in path_lst[::-1]:
-            if path != master_keypath:
-                self.remove_path(path)
-                removed_amnt += 1
-
-        return removed_amnt
\ No newline at end of file
+        return self.remove_paths(path for path in path_lst if path != master_keypath)
@@ -0,0 +1,355 @@
+import json
+import operator
+import re
+
+from py_basic_commands.json_scripts.keypath import compile_keypath, get_keypath_value, join_keypath
+from functools  import lru_cache
+from typing     import Any, Callable, Optional
+
+
+# A step maps the matched (keypath parts, value) pairs to the next ones.
+# The parts are None when only the values are wanted, so no keypaths are built at all
+_Nodes = list[tuple[Optional[tuple], Any]]
+_Step = Callable[[_Nodes], _Nodes]
+
+_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+_PREDICATE_RE = re.compile(r'\s*(.*?)\s*(==|!=|>=|<=|>|<)\s*(.*?)\s*')
+_INDEX_RE = re.compile(r'[\'"]*(-?\d+)[\'"]*')
+
+
+def _split_outside(text:str, separator:str) -> list[str]:
+    """Split a text on a character, except inside brackets, braces and quotes"""
+    parts = []
+    depth = 0
+    quote = ''
+    start = 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = ''
+        elif ch in '\'"':
+            quote = ch
+        elif ch in '[{':
+            depth += 1
+        elif ch in ']}':
+            depth -= 1
+        elif ch == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    if quote or depth:
+        raise ValueError(f'Unclosed quote or bracket in query: {text!r}')
+    parts.append(text[start:])
+    return parts
+
+
+def _closing_bracket(text:str) -> int:
+    """Returns the index of the bracket that closes the one `text` starts with, outside quotes. -1 if it isn't closed"""
+    depth = 0
+    quote = ''
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = ''
+        elif ch in '\'"':
+            quote = ch
+        elif ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _parse_literal(text:str) -> Any:
+    """Parse the value a predicate compares with: a JSON value, or a string in single quotes"""
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1]
+    try:
+        return json.loads(text)
+    except ValueError:
+        raise ValueError(f'Invalid value in query predicate: {text!r}') from None
+
+
+def _compile_predicate(expr:str) -> Callable[[Any], bool]:
+    """Compile a predicate like `price>10`, `user/name=='x'` or `tags` (exists). `@` is the item itself"""
+    def field_parts(field:str) -> tuple:
+        if not field:
+            raise ValueError(f'Missing field in query predicate: {expr!r}')
+        return () if field == '@' else compile_keypath(field)
+
+    match = _PREDICATE_RE.fullmatch(expr)
+    if match is None:
+        parts = field_parts(expr.strip())
+
+        def exists(value:Any) -> bool:
+            try:
+                get_keypath_value(value, parts)
+            except KeyError:
+                return False
+            return True
+        return exists
+
+    parts = field_parts(match.group(1))
+    compare = _COMPARISONS[match.group(2)]
+    literal = _parse_literal(match.group(3))
+
+    def predicate(value:Any) -> bool:
+        try:
+            return compare(get_keypath_value(value, parts), literal)
+        except (KeyError, TypeError):
+            # Missing fields and values that can't be compared (like a string with a number) don't match
+            return False
+    return predicate
+
+
+def _key_step(key:str) -> _Step:
+    def step(nodes:_Nodes) -> _Nodes:
+        out = []
+        for parts, value in nodes:
+            if isinstance(value, dict) and key in value:
+                out.append((None if parts is None else parts + (key,), value[key]))
+        return out
+    return step
+
+
+def _index_step(index:int) -> _Step:
+    def step(nodes:_Nodes) -> _Nodes:
+        out = []
+        for parts, value in nodes:
+            if isinstance(value, list) and -len(value) <= index < len(value):
+                out.append((None if parts is None else parts + (index % len(value),), value[index]))
+        return out
+    return step
+
+
+def _wildcard_step(nodes:_Nodes) -> _Nodes:
+    out:_Nodes = []
+    for parts, value in nodes:
+        if isinstance(value, dict):
+            if parts is None:
+                out.extend((None, child) for child in value.values())
+            else:
+                out.extend((parts + (key,), child) for key, child in value.items())
+        elif isinstance(value, list):
+            if parts is None:
+                out.extend((None, child) for child in value)
+            else:
+                out.extend((parts + (index,), child) for index, child in enumerate(value))
+    return out
+
+
+def _descend_step(nodes:_Nodes) -> _Nodes:
+    out:_Nodes = []
+
+    def walk(parts:Optional[tuple], value:Any):
+        out.append((parts, value))
+        if isinstance(value, dict):
+            for key, child in value.items():
+                walk(None if parts is None else parts + (key,), child)
+        elif isinstance(value, list):
+            for index, child in enumerate(value):
+                walk(None if parts is None else parts + (index,), child)
+
+    for parts, value in nodes:
+        walk(parts, value)
+    return out
+
+
+def _filter_step(predicate:Callable[[Any], bool]) -> _Step:
+    def step(nodes:_Nodes) -> _Nodes:
+        out = []
+        for parts, value in nodes:
+            if isinstance(value, dict):
+                children = value.items()
+            elif isinstance(value, list):
+                children = enumerate(value) # type: ignore
+            else:
+                continue
+            for key, child in children:
+                if predicate(child):
+                    out.append((None if parts is None else parts + (key,), child))
+        return out
+    return step
+
+
+def _project_step(fields:list[tuple[str, tuple]]) -> _Step:
+    def step(nodes:_Nodes) -> _Nodes:
+        out = []
+        for parts, value in nodes:
+            if not isinstance(value, dict):
+                continue
+            projected = {}
+            for name, field_parts in fields:
+                try:
+                    projected[name] = get_keypath_value(value, field_parts)
+                except KeyError:
+                    pass
+            out.append((parts, projected))
+        return out
+    return step
+
+
+def _compile_segment(segment:str) -> list[_Step]:
+    """Compile a part of a query between slashes, like `items[?price>10]` or `{name,email}`"""
+    steps:list[_Step] = []
+    if segment.startswith('{'):
+        if not segment.endswith('}'):
+            raise ValueError(f'Invalid projection in query: {segment!r}')
+        fields = [field.strip() for field in _split_outside(segment[1:-1], ',')]
+        if not all(fields):
+            raise ValueError(f'Empty field in query projection: {segment!r}')
+        steps.append(_project_step([(field, compile_keypath(field)) for field in fields]))
+        return steps
+
+    # The name, then any amount of [index], [*] and [?predicate]
+    bracket = len(segment)
+    for i, ch in enumerate(segment):
+        if ch == '[':
+            bracket = i
+            break
+    name, suffixes = segment[:bracket], segment[bracket:]
+
+    if name == '**':
+        steps.append(_descend_step)
+    elif name == '*':
+        steps.append(_wildcard_step)
+    elif name:
+        steps.append(_key_step(name))
+    elif not suffixes:
+        raise ValueError('Empty key in query')
+
+    while suffixes:
+        end = _closing_bracket(suffixes)
+        if not suffixes.startswith('[') or end == -1:
+            raise ValueError(f'Invalid brackets in query: {segment!r}')
+        content = suffixes[1:end]
+        suffixes = suffixes[end + 1:]
+
+        if content == '*':
+            steps.append(_wildcard_step)
+        elif content.startswith('?'):
+            steps.append(_filter_step(_compile_predicate(content[1:])))
+        elif _INDEX_RE.fullmatch(content):
+            steps.append(_index_step(int(_INDEX_RE.fullmatch(content).group(1)))) # type: ignore
+        else:
+            raise ValueError(f'Invalid brackets in query: [{content}]')
+
+    return steps
+
+
+class JsonQuery:
+    """A compiled query, see `compile_query()`"""
+    def __init__(self, query:str, steps:list[_Step]) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        query : str
+            The query text
+        steps : list[_Step]
+            The compiled steps of the query"""
+        self.query = query
+        self.steps = steps
+
+
+    def __repr__(self) -> str:
+        return f'JsonQuery({self.query!r})'
+
+
+    def _run(self, data:Any, with_parts:bool) -> _Nodes:
+        """Runs the steps on the data, starting from the root"""
+        nodes:_Nodes = [(() if with_parts else None, data)]
+        for step in self.steps:
+            if not nodes:
+                break
+            nodes = step(nodes)
+        return nodes
+
+
+    def values(self, data:Any) -> list[Any]:
+        """Returns the matching values
+
+        Parameters
+        ----------
+        data : Any
+            The json data (plain dicts and lists)
+
+        Returns
+        -------
+        list[Any]
+            The matching values, in document order"""
+        return [value for _, value in self._run(data, False)]
+
+
+    def paths(self, data:Any) -> list[str]:
+        """Returns the keypaths of the matching values
+
+        Parameters
+        ----------
+        data : Any
+            The json data (plain dicts and lists)
+
+        Returns
+        -------
+        list[str]
+            The keypaths, like `'users[0]/email'`"""
+        return [join_keypath(parts) for parts, _ in self._run(data, True)]
+
+
+    def items(self, data:Any) -> list[tuple[str, Any]]:
+        """Returns the keypaths and the matching values
+
+        Parameters
+        ----------
+        data : Any
+            The json data (plain dicts and lists)
+
+        Returns
+        -------
+        list[tuple[str, Any]]
+            `(keypath, value)` pairs"""
+        return [(join_keypath(parts), value) for parts, value in self._run(data, True)] # type: ignore
+
+
+@lru_cache(maxsize=1024)
+def compile_query(query:str) -> JsonQuery:
+    """Compile a query into a plan that can be run on json data many times.
+
+    Queries use the keypath syntax of `JsonEditor` (`users[0]/email`), with:
+
+    - `*`: every value of a dict, or item of a list (`users/*/email`, `items[*]`)
+    - `**`: the value and everything in it, at any depth (`**/email`)
+    - `[?predicate]`: the values (or items) that match, like `items[?price>10]`, `users[?name=='x']`
+      or `users[?email]` (has an email). Fields are keypaths in the value, `@` is the value itself.
+      Comparisons: `==`, `!=`, `>`, `>=`, `<`, `<=`; values are JSON (`10`, `"x"`, `true`, `null`) or 'quoted'
+    - `{a,b/c}`: a dict of only these fields of each value (a projection), like `users/*/{name,email}`
+
+    The last 1024 queries are cached, see `compile_query.cache_info()`
+
+    Parameters
+    ----------
+    query : str
+        The query
+
+    Returns
+    -------
+    JsonQuery
+        The compiled query
+
+    Raises
+    ------
+    ValueError
+        If the query is not valid"""
+    steps:list[_Step] = []
+    if query:
+        for segment in _split_outside(query, '/'):
+            steps.extend(_compile_segment(segment))
+    return JsonQuery(query, steps)
@@ -0,0 +1,134 @@
+import gc
+import marshal
+import os
+import sys
+
+from py_basic_commands.file_dir_scripts.atomic_write import atomic_open
+from hashlib    import blake2b
+from typing     import Any, Optional
+
+
+_MAGIC = b'PBCSNAP1'
+# Size of the parts of the json file that are hashed: the start, the middle and the end
+_SAMPLE_SIZE = 1 << 16
+
+
+def snapshot_path(file_path:str) -> str:
+    """Returns the path of the snapshot file of a json file
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file
+
+    Returns
+    -------
+    str
+        The path of the snapshot file"""
+    return f'{file_path}.snapshot'
+
+
+def _source_key(file_path:str) -> Optional[tuple]:
+    """Returns what a snapshot is valid for: the Python version (marshal's format changes with it),
+    and the size, modification time and a hash of the start, middle and end of the json file.
+
+    Hashing the whole file would take as long as parsing it, the sampled hash catches
+    files that were replaced with ones of the same size and modification time"""
+    try:
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            file_hash = blake2b(digest_size=16)
+            for offset in sorted({0, max(0, stat.st_size // 2 - _SAMPLE_SIZE // 2), max(0, stat.st_size - _SAMPLE_SIZE)}):
+                f.seek(offset)
+                file_hash.update(f.read(_SAMPLE_SIZE))
+    except OSError:
+        return None
+    return (sys.version_info[:2], stat.st_size, stat.st_mtime_ns, file_hash.digest())
+
+
+def load_snapshot(file_path:str) -> tuple[bool, Any]:
+    """Reads the parsed data of a json file from its snapshot, if the snapshot was made from the current json file
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file (not the snapshot)
+
+    Returns
+    -------
+    tuple[bool, Any]
+        Whether the snapshot was valid, and the data (None if it wasn't)"""
+    try:
+        with open(snapshot_path(file_path), 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return False, None
+
+    if not blob.startswith(_MAGIC):
+        return False, None
+
+    key_end = len(_MAGIC) + 4 + int.from_bytes(blob[len(_MAGIC):len(_MAGIC) + 4], 'little')
+    try:
+        key = marshal.loads(blob[len(_MAGIC) + 4:key_end])
+        if key != _source_key(file_path):
+            return False, None
+    except (EOFError, ValueError, TypeError):
+        return False, None
+
+    # The garbage collector would go through the whole tree again and again while it's built,
+    # which takes longer than building it
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return True, marshal.loads(memoryview(blob)[key_end:])
+    except (EOFError, ValueError, TypeError):
+        # Cut or corrupted snapshot
+        return False, None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def write_snapshot(file_path:str, data:Any) -> bool:
+    """Writes the parsed data of a json file to its snapshot. Call right after the json file was read or written
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file (not the snapshot)
+    data : Any
+        The data of the json file
+
+    Returns
+    -------
+    bool
+        Whether the snapshot was written. Not the case for data with other than plain JSON types"""
+    key = _source_key(file_path)
+    if key is None:
+        return False
+
+    try:
+        data_blob = marshal.dumps(data)
+    except ValueError:
+        return False
+
+    key_blob = marshal.dumps(key)
+    with atomic_open(snapshot_path(file_path), 'wb') as f:
+        f.write(_MAGIC)
+        f.write(len(key_blob).to_bytes(4, 'little'))
+        f.write(key_blob)
+        f.write(data_blob)
+    return True
+
+
+def remove_snapshot(file_path:str):
+    """Removes the snapshot file of a json file, if there is one
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file (not the snapshot)"""
+    try:
+        os.remove(snapshot_path(file_path))
+    except FileNotFoundError:
+        pass
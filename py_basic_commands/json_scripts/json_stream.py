@@ -0,0 +1,353 @@
+import json
+import re
+
+from typing import Any, Iterator, TextIO
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+# Skipping goes through everything up to the next bracket at once, along with whole strings and containers
+# nested at most two deep (most items of big arrays), so only deeper or cut brackets are handled one by one.
+# Each part starts with a different character, so a failed match can't backtrack through all ways to split the text
+_SKIP_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_SKIP_OTHER = r'[^"\[\]{}]*'
+
+def _skip_container_re(inner:str) -> str:
+    return rf'\[{_SKIP_OTHER}(?:(?:{inner}){_SKIP_OTHER})*\]|\{{{_SKIP_OTHER}(?:(?:{inner}){_SKIP_OTHER})*\}}'
+
+_SKIP_RUN = re.compile(rf'{_SKIP_OTHER}(?:(?:{_SKIP_STRING}|{_skip_container_re(_SKIP_STRING + "|" + _skip_container_re(_SKIP_STRING))}){_SKIP_OTHER})*')
+# A whole array item and the comma after it, for skipping to a list index (cut items don't match)
+_SKIP_ITEM = re.compile(rf'[ \t\n\r]*(?:{_SKIP_STRING}|{_skip_container_re(_SKIP_STRING + "|" + _skip_container_re(_SKIP_STRING))}|[^ \t\n\r,\[\]{{}}":]+)[ \t\n\r]*,')
+_SCALAR = re.compile(r'[^ \t\n\r,\]}:]*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+_decoder = json.JSONDecoder()
+
+
+class JsonStream:
+    """Incrementally read a JSON text file, without loading the whole document.
+
+    Only one value (and one buffer chunk) is held in memory at a time."""
+    def __init__(self, f:TextIO, chunk_size:int=1 << 16) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        f : TextIO
+            An opened (text mode) file to read from
+        chunk_size : int, optional
+            The amount of characters to read from the file at once. Default is 65536"""
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+
+    def _fill(self, size:int=0) -> bool:
+        """Drop the consumed part of the buffer and read more text to it
+
+        Parameters
+        ----------
+        size : int, optional
+            The minimum amount of characters to read. Default is `chunk_size`
+
+        Returns
+        -------
+        bool
+            Whether any text was read"""
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+        chunk = self.f.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buf += chunk
+        return True
+
+
+    def _error(self, msg:str) -> json.JSONDecodeError:
+        """Create a decode error for the current position"""
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it
+
+        Returns
+        -------
+        str
+            The next character, or an empty string at the end of the file"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end() # type: ignore
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+
+    def next_char(self) -> str:
+        """Skip whitespace and consume the next character
+
+        Returns
+        -------
+        str
+            The consumed character, or an empty string at the end of the file"""
+        ch = self.peek()
+        if ch:
+            self.pos += 1
+        return ch
+
+
+    def expect(self, chars:str) -> str:
+        """Consume the next character, which has to be one of `chars`
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the next character is something else"""
+        ch = self.next_char()
+        if not ch or ch not in chars:
+            self.pos -= bool(ch)
+            raise self._error(f'Expecting one of {chars!r}')
+        return ch
+
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value
+
+        Returns
+        -------
+        Any
+            The decoded value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number cut by the buffer edge (like '1.' or '2e') would decode too early
+                if self.eof or (end < len(self.buf) and self.buf[end] not in _NUMBER_CHARS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+
+            # Grow geometrically, so huge values are not re-decoded too many times
+            self._fill(len(self.buf) - self.pos)
+
+
+    def _skip_string(self):
+        """Skip over a string, the position being at its opening quote"""
+        self.pos += 1
+        while True:
+            end = _STRING_BODY.match(self.buf, self.pos).end() # type: ignore
+            if end < len(self.buf) and self.buf[end] == '"':
+                self.pos = end + 1
+                return
+
+            # The body pattern never splits an escape, so a cut one stays in the buffer
+            self.pos = end
+            if not self._fill():
+                raise self._error('Unterminated string')
+
+
+    def skip_value(self):
+        """Skip over the next JSON value without building it"""
+        ch = self.peek()
+        if ch == '"':
+            self._skip_string()
+            return
+
+        if ch not in ('{', '['):
+            while True:
+                end = _SCALAR.match(self.buf, self.pos).end() # type: ignore
+                if end < len(self.buf) or self.eof:
+                    break
+                self._fill()
+
+            if end == self.pos:
+                raise self._error('Expecting value')
+            self.pos = end
+            return
+
+        # The run can't start at the opening bracket, or it would go on past the value
+        self.pos += 1
+        depth = 1
+        while True:
+            self.pos = _SKIP_RUN.match(self.buf, self.pos).end() # type: ignore
+            if self.pos == len(self.buf):
+                if not self._fill():
+                    raise self._error('Unexpected end of file')
+                continue
+
+            ch = self.buf[self.pos]
+            if ch == '"':
+                self._skip_string()
+                continue
+
+            self.pos += 1
+            if ch in ('{', '['):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+    def seek(self, parts:tuple) -> bool:
+        """Move to the value at the given keypath parts, skipping everything before it
+
+        Parameters
+        ----------
+        parts : tuple
+            The keys and list indexes to follow, see `split_keypath()`
+
+        Returns
+        -------
+        bool
+            Whether the value was found. Negative list indexes are never found"""
+        for part in parts:
+            if isinstance(part, int):
+                # Counting from the end would need the whole list
+                if part < 0 or self.next_char() != '[' or self.peek() == ']':
+                    return False
+                for _ in range(part):
+                    self.skip_value()
+                    if self.expect(',]') == ']':
+                        return False
+                continue
+
+            if self.next_char() != '{' or self.peek() == '}':
+                return False
+            while True:
+                key = self.read_value()
+                self.expect(':')
+                if key == part:
+                    break
+                self.skip_value()
+                if self.expect(',}') == '}':
+                    return False
+
+        return True
+
+
+    def extract(self, parts_lst:list[tuple]) -> dict[tuple, Any]:
+        """Get the values at the given keypath parts, building only those values.
+
+        Everything else is skipped without building it, and reading stops as soon as every value is found
+
+        Parameters
+        ----------
+        parts_lst : list[tuple]
+            The keys and list indexes of every keypath to get, see `split_keypath()`
+
+        Returns
+        -------
+        dict[tuple, Any]
+            The found values, by their keypath parts. Keypaths that weren't found are left out"""
+        # A tree of the wanted keys and indexes, None marks the end of a keypath
+        trie:dict[Any, Any] = {}
+        for parts in parts_lst:
+            node = trie
+            for part in parts:
+                node = node.setdefault(part, {})
+            node[None] = True
+
+        found:dict[tuple, Any] = {}
+        remaining = len(set(parts_lst))
+
+        def collect(value:Any, node:dict, prefix:tuple):
+            """Get the wanted values from an already built value"""
+            nonlocal remaining
+            for part, child in node.items():
+                if part is None:
+                    found[prefix] = value
+                    remaining -= 1
+                elif isinstance(part, int) and isinstance(value, list) and part < len(value):
+                    collect(value[part], child, prefix + (part,))
+                elif isinstance(part, str) and isinstance(value, dict) and part in value:
+                    collect(value[part], child, prefix + (part,))
+
+        def walk(node:dict, prefix:tuple):
+            """Go through the next value, building only the wanted parts"""
+            if None in node:
+                # Wanted as a whole (maybe along with some of its own values)
+                collect(self.read_value(), node, prefix)
+                return
+
+            ch = self.peek()
+            if ch not in ('{', '['):
+                self.skip_value()
+                return
+
+            self.pos += 1
+            close = '}' if ch == '{' else ']'
+            if self.peek() == close:
+                self.pos += 1
+                return
+
+            index = 0
+            while True:
+                if ch == '{':
+                    key = self.read_value()
+                    self.expect(':')
+                    child = node.get(key)
+                else:
+                    child = node.get(index)
+                    index += 1
+                    if child is None:
+                        match = _SKIP_ITEM.match(self.buf, self.pos)
+                        if match is not None:
+                            self.pos = match.end()
+                            continue
+
+                if child is None:
+                    self.skip_value()
+                else:
+                    walk(child, prefix + ((key,) if ch == '{' else (index - 1,)))
+                    if not remaining:
+                        return
+
+                if self.expect(',' + close) == close:
+                    return
+
+        if remaining:
+            walk(trie, ())
+        return found
+
+
+    def iter_container(self) -> Iterator[Any]:
+        """Yield the items of the next array, or the `(key, value)` pairs of the next object
+
+        Yields
+        ------
+        Any
+            An array element, or a `(key, value)` tuple for objects
+
+        Raises
+        ------
+        TypeError
+            If the next value is not an array or an object"""
+        ch = self.peek()
+        if ch not in ('[', '{'):
+            raise TypeError(f'Value is not an array or an object, but starts with {ch!r}')
+
+        self.pos += 1
+        close = ']' if ch == '[' else '}'
+        if self.peek() == close:
+            self.pos += 1
+            return
+
+        while True:
+            if ch == '[':
+                yield self.read_value()
+            else:
+                key = self.read_value()
+                self.expect(':')
+                yield key, self.read_value()
+
+            if self.expect(',' + close) == close:
+                return
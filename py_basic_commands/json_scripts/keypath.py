@@ -0,0 +1,126 @@
+import re
+
+from functools  import lru_cache
+from typing     import Any
+
+
+# The list index syntax benedict accepts at the end of a key, like [0], [-1] or ['2']
+_INDEX_RE = re.compile(r'\[[\'"]*(-?\d+)[\'"]*\]$')
+
+
+def split_keypath(keypath:str, separator:str='/') -> tuple:
+    """Split a keypath into its keys and list indexes, like benedict does.
+
+    Uses the same syntax as `JsonEditor`, so `'items[0]/id'` becomes `('items', 0, 'id')`.
+    Indexes are only recognized at the end of a key, and can be negative or quoted (`[-1]`, `['0']`).
+    Empty keys are kept (`'a//b'`), but not before an index, so `'[0]'` is the first item of a top-level list.
+    `''` is the whole document, `()`
+
+    Parameters
+    ----------
+    keypath : str
+        The keypath to split
+    separator : str, optional
+        The separator between keys. Default is '/'
+
+    Returns
+    -------
+    tuple
+        The keys (str) and list indexes (int) of the keypath, in order
+    """
+    if not keypath:
+        return ()
+
+    parts:list[Any] = []
+    for key in keypath.split(separator) if separator else [keypath]:
+        if '[' not in key or not key.endswith(']'):
+            parts.append(key)
+            continue
+
+        indexes = []
+        match = _INDEX_RE.search(key)
+        while match:
+            indexes.append(int(match.group(1)))
+            key = key[:match.start()]
+            match = _INDEX_RE.search(key)
+        if key or not indexes:
+            parts.append(key)
+        parts.extend(reversed(indexes))
+
+    return tuple(parts)
+
+
+def join_keypath(parts:Any, separator:str='/') -> str:
+    """Join keys and list indexes back into a keypath string.
+
+    Parameters
+    ----------
+    parts : Any
+        The keys and list indexes to join
+    separator : str, optional
+        The separator between keys. Default is '/'
+
+    Returns
+    -------
+    str
+        The keypath"""
+    keypath = ''
+    for part in parts:
+        if isinstance(part, int) and not isinstance(part, bool):
+            keypath += f'[{part}]'
+        elif keypath:
+            keypath += f'{separator}{part}'
+        else:
+            keypath = f'{part}'
+    return keypath
+
+
+@lru_cache(maxsize=4096)
+def compile_keypath(keypath:str, separator:str='/') -> tuple:
+    """Split a keypath with `split_keypath()`, and remember the result.
+    The last 4096 keypaths are cached, see `compile_keypath.cache_info()`
+
+    Parameters
+    ----------
+    keypath : str
+        The keypath to split
+    separator : str, optional
+        The separator between keys. Default is '/'
+
+    Returns
+    -------
+    tuple
+        The keys (str) and list indexes (int) of the keypath, in order"""
+    return split_keypath(keypath, separator)
+
+
+def get_keypath_value(data:Any, parts:tuple) -> Any:
+    """Get the value at the given keypath parts, walking plain dicts and lists
+
+    Parameters
+    ----------
+    data : Any
+        The data to get the value from
+    parts : tuple
+        The keys and list indexes to follow, see `compile_keypath()`
+
+    Returns
+    -------
+    Any
+        The value
+
+    Raises
+    ------
+    KeyError
+        If the keypath doesn't exist"""
+    try:
+        for part in parts:
+            if isinstance(data, dict):
+                data = data[part]
+            elif isinstance(data, (list, tuple)) and isinstance(part, int):
+                data = data[part]
+            else:
+                raise KeyError(part)
+    except IndexError:
+        raise KeyError(part) from None
+    return data
@@ -0,0 +1,242 @@
+import json
+import os
+import re
+
+from py_basic_commands.file_dir_scripts.compression     import compressed_open, detect_compression
+from py_basic_commands.json_scripts.json_backend    import JsonBackend, get_json_backend
+from collections        import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing     import Any, Callable, Iterator, Optional, Union
+
+
+# Where the next element probably starts: after the end of an object or array, a comma and the start of the next one.
+# Only a guess, as the same bytes can be in a string or a nested array, see `_parse_range()`
+_BOUNDARY = re.compile(rb'[}\]][ \t\r\n]*,[ \t\r\n]*(?=[{\[])')
+# The separator after an element, and the start of the next one up to its first key
+_SEPARATOR = re.compile(rb'[ \t\r\n]*,[ \t\r\n]*(?:\{[ \t\r\n]*"(?:[^"\\]|\\.)*"[ \t\r\n]*:|[{\[])')
+# How far from a split point to look for a boundary
+_SEARCH_SIZE = 1 << 20
+_WHITESPACE = b' \t\r\n'
+_BOM = b'\xef\xbb\xbf'
+
+
+def _array_content(f:Any, size:int) -> tuple[int, int]:
+    """Returns the byte range between the brackets of the top-level array of an opened json file
+
+    Raises
+    ------
+    ValueError
+        If the file is not a top-level array"""
+    head = f.read(min(size, 4096))
+    start = len(_BOM) if head.startswith(_BOM) else 0
+    while start < len(head) and head[start] in _WHITESPACE:
+        start += 1
+
+    f.seek(max(0, size - 4096))
+    tail = f.read()
+    end = len(tail)
+    while end > 0 and tail[end - 1] in _WHITESPACE:
+        end -= 1
+
+    if start >= len(head) or head[start:start + 1] != b'[' or end == 0 or tail[end - 1:end] != b']':
+        raise ValueError('Not a top-level JSON array')
+    return start + 1, size - len(tail) + end - 1
+
+
+def _learn_boundary(head:bytes) -> re.Pattern:
+    """Returns the boundary to search for, from the first two elements of the array.
+
+    The elements of an array are usually alike, so the bytes between them are too: with the indent of a
+    prettified file, or the first key of the records in a minified one. Nested values rarely match those"""
+    text = head.decode('utf-8', errors='replace')
+    stripped = text.lstrip()
+    try:
+        _, end = json.JSONDecoder().raw_decode(stripped)
+    except ValueError:
+        # The first element is longer than the head
+        return _BOUNDARY
+    end = len(text[:len(text) - len(stripped) + end].encode('utf-8'))
+    match = _SEPARATOR.match(head, end)
+    if match is None or head[end - 1:end] not in (b'}', b']'):
+        return _BOUNDARY
+    # The closing bracket and separator, then the start of the next element (not matched, so `match.end()` is the element)
+    element_start = match.end() - len(head[head.index(b',', end) + 1:match.end()].lstrip())
+    return re.compile(re.escape(head[end - 1:element_start]) + b'(?=' + re.escape(head[element_start:match.end()]) + b')')
+
+
+def split_json_array(file_path:str, parts:int) -> list[tuple[int, int]]:
+    """Split the top-level array of a json file into byte ranges of whole elements (probably, see `_parse_range()`)
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file
+    parts : int
+        The amount of ranges to split into. Less if there aren't that many boundaries
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The (start, end) byte offsets of the ranges, without the commas between them
+
+    Raises
+    ------
+    ValueError
+        If the file is not a top-level array"""
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        content_start, content_end = _array_content(f, size)
+
+        f.seek(content_start)
+        boundary = _learn_boundary(f.read(min(_SEARCH_SIZE, content_end - content_start)))
+
+        ranges = []
+        start = content_start
+        for i in range(1, parts):
+            split_at = content_start + (content_end - content_start) * i // parts
+            if split_at <= start:
+                continue
+            f.seek(split_at)
+            window = f.read(min(_SEARCH_SIZE, content_end - split_at))
+            match = boundary.search(window)
+            if match is None:
+                continue
+            comma = split_at + window.index(b',', match.start())
+            ranges.append((start, comma))
+            start = split_at + match.end()
+
+    ranges.append((start, content_end))
+    return ranges
+
+
+def _parse_range(file_path:str, start:int, end:int, backend:Optional[Union[str, JsonBackend]], func:Optional[Callable[[list], Any]]) -> tuple[bool, Any]:
+    """Parses a byte range of array elements in a worker process.
+
+    The range can start or end at a wrongly guessed boundary. A range that starts at a real boundary
+    and parses, also ended at a real one: text cut in a string or a nested value is not valid JSON.
+    So the first range is right if it parses, and with it the start of the next one, and so on
+
+    Returns
+    -------
+    tuple[bool, Any]
+        Whether the range parsed, and the elements (or what `func` returned for them)"""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    try:
+        items = get_json_backend(backend).loads(b'[' + data + b']')
+    except ValueError:
+        return False, None
+    return True, items if func is None else func(items)
+
+
+def iter_json_array(file_path:str, workers:Optional[int]=None, chunk_bytes:int=16 << 20, backend:Optional[Union[str, JsonBackend]]=None, func:Optional[Callable[[list], Any]]=None, compression:Optional[str]='infer') -> Iterator[Any]:
+    """Parse the top-level array of a big json file in a pool of processes, and yield the parsed chunks in order.
+
+    The array is split into byte ranges at (guessed) element boundaries, which are parsed by the workers.
+    The parsed elements have to be sent back to this process, which takes about as long as parsing them;
+    with `func`, each chunk is processed in the worker and only its result is sent back, which scales with the workers.
+    A wrongly guessed boundary is found when the range before it doesn't parse; that range is then parsed
+    again with the next one in this process, so the result is always right
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file
+    workers : Optional[int], optional
+        The amount of worker processes. Default is None, the amount of CPUs
+    chunk_bytes : int, optional
+        The size of the byte ranges. Default is 16 MB
+    backend : Optional[Union[str, JsonBackend]], optional
+        The JSON backend to parse with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one
+    func : Optional[Callable[[list], Any]], optional
+        A function to call in the worker with each chunk of elements (a module-level function, so it can be sent to the workers).
+        Default is None, yield the elements
+    compression : Optional[str], optional
+        The compression of the file: 'infer' (from the extension), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        A compressed file can't be split, so it's parsed in this process
+
+    Yields
+    ------
+    Any
+        Lists of elements, or the results of `func`, in the order of the array
+
+    Raises
+    ------
+    ValueError
+        If the file is not a top-level array, or not valid JSON"""
+    workers = workers or os.cpu_count() or 1
+    # More ranges than workers, so the workers finish at about the same time
+    parts = max(workers * 4, os.path.getsize(file_path) // chunk_bytes)
+
+    if detect_compression(file_path, compression) is not None or workers == 1:
+        ranges = []
+    else:
+        ranges = split_json_array(file_path, parts)
+
+    if len(ranges) < 2:
+        # One range is not worth a pool
+        with compressed_open(file_path, 'rb', compression=compression) as f:
+            items = get_json_backend(backend).loads(f.read())
+        if not isinstance(items, list):
+            raise ValueError(f'Not a top-level JSON array: {file_path}')
+        yield items if func is None else func(items)
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        # A few ranges per worker at a time, so parsed chunks don't pile up when they are used slowly
+        futures:deque[tuple[int, Future]] = deque()
+        next_range = 0
+        while futures or next_range < len(ranges):
+            while next_range < len(ranges) and len(futures) < workers * 2:
+                futures.append((next_range, executor.submit(_parse_range, file_path, *ranges[next_range], backend, func)))
+                next_range += 1
+
+            i, future = futures.popleft()
+            start = ranges[i][0]
+            parsed, result = future.result()
+            merged = 0
+            while not parsed:
+                # The ranges before parsed, so this one starts at a real boundary and ends at a wrong one:
+                # parse it here with the next range. The guesses of the ranges after don't depend on this one.
+                # After a few tries it's more likely invalid JSON, then the rest is parsed at once
+                if i == len(ranges) - 1:
+                    raise ValueError(f'Not valid JSON: {file_path}')
+                merged += 1
+                i = i + 1 if merged < 3 else len(ranges) - 1
+                while futures and futures[0][0] <= i:
+                    futures.popleft()[1].cancel()
+                next_range = max(next_range, i + 1)
+                parsed, result = _parse_range(file_path, start, ranges[i][1], backend, func)
+            yield result
+
+
+def read_json_array(file_path:str, workers:Optional[int]=None, chunk_bytes:int=16 << 20, backend:Optional[Union[str, JsonBackend]]=None, compression:Optional[str]='infer') -> list:
+    """Parse the top-level array of a big json file in a pool of processes, see `iter_json_array()`
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the json file
+    workers : Optional[int], optional
+        The amount of worker processes. Default is None, the amount of CPUs
+    chunk_bytes : int, optional
+        The size of the byte ranges the array is split into. Default is 16 MB
+    backend : Optional[Union[str, JsonBackend]], optional
+        The JSON backend to parse with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one
+    compression : Optional[str], optional
+        The compression of the file: 'infer' (from the extension), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'
+
+    Returns
+    -------
+    list
+        The elements of the array
+
+    Raises
+    ------
+    ValueError
+        If the file is not a top-level array, or not valid JSON"""
+    items = []
+    for chunk in iter_json_array(file_path, workers, chunk_bytes, backend, compression=compression):
+        items.extend(chunk)
+    return items
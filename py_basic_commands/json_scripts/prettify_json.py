@@ -1,39 +1,301 @@
+import json
+import os
+import re
 
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.file_dir_scripts.compression     import compressed_open, detect_compression
+from py_basic_commands.json_scripts.json_backend    import JsonBackend, get_json_backend, needs_ascii
+from py_basic_commands.fscripts     import Fprint
+from concurrent.futures import ProcessPoolExecutor
+from time       import perf_counter
+from traceback  import format_exc
+from typing     import Iterator, Optional, TextIO, Union
 
-from py_basic_commands.json_scripts.read_json       import read_json
-from py_basic_commands.json_scripts.write_json      import write_json
 
+fprint = Fprint()
 
+# A string, written so it can only match one way (a failed match doesn't try every way to split it)
+_STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+_SCALAR = r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null'
 
-def prettify_json(file_path:str, indent:int=4, do_print:bool=True, encoding:str='utf-8', **kwargs) -> bool:
+# One token per match, after optional whitespace: a string, a structural character, a number or a literal.
+# Anything else (or a token cut by the end of the buffer) doesn't match
+_TOKEN = re.compile(rf'[ \t\n\r]*(?:({_STRING})|([\[\]{{}},:])|({_SCALAR}))')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# What may follow a number or literal that was cut by the end of the buffer (like '1e' of '1e+20')
+_TOKEN_TAIL = re.compile(r'[0-9a-zA-Z.+\-]*')
+
+# What the re-indenter expects next
+_VALUE, _FIRST_KEY, _KEY, _COLON, _NEXT = range(5)
+
+# Files over this size are streamed by default, smaller ones are faster to load
+_STREAM_MIN_SIZE = 16 << 20
+
+
+def _reindent_stream(f:TextIO, indent:Optional[int], ensure_ascii:bool, chunk_size:int=1 << 20) -> Iterator[str]:
+    """Re-indent a JSON text without parsing it, in constant memory (besides single strings and numbers).
+
+    Strings and numbers are kept as they are, only the whitespace between them is changed.
+    The output has the same layout as `json.dumps(data, indent=indent)`, or compact with `indent=None`
+
+    Parameters
+    ----------
+    f : TextIO
+        The opened JSON file
+    indent : Optional[int]
+        The number of spaces to indent with, None for compact output
+    ensure_ascii : bool
+        Whether to escape the non-ASCII characters in strings
+    chunk_size : int, optional
+        The amount of characters to read at once. Default is 1 MB
+
+    Yields
+    ------
+    str
+        The re-indented text, a chunk at a time
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the file is not valid JSON"""
+    if indent is None:
+        item_sep, key_sep, newline = ',', ':', ''
+    else:
+        item_sep, key_sep, newline = ',', ': ', '\n'
+    indent_str = ' ' * indent if indent else ''
+    # The line breaks (with indentation) of every depth, made once
+    breaks = [newline]
+
+    buf = f.read(chunk_size)
+    eof = not buf
+    pos = 0
+    expect = _VALUE
+    stack:list[str] = []    # The open containers, '{' or '['
+    just_opened = False     # The last token opened a container, which may be empty
+    done = False            # The root value is complete
+    out:list[str] = []
+    match_token = _TOKEN.match
+
+    while True:
+        match = match_token(buf, pos)
+        # A token touching the end of the buffer may continue in the next chunk
+        if match is None or (not eof and (match.end() == len(buf) or (match.lastindex == 3 and _TOKEN_TAIL.match(buf, match.end()).end() == len(buf)))): # type: ignore
+            if not eof:
+                chunk = f.read(chunk_size)
+                if chunk:
+                    buf = buf[pos:] + chunk
+                    pos = 0
+                    continue
+                eof = True
+                continue
+
+            pos = _WHITESPACE.match(buf, pos).end() # type: ignore
+            if pos == len(buf) and done:
+                break
+            raise json.JSONDecodeError('Expecting value' if pos == len(buf) else 'Invalid token', buf, pos)
+
+        if done:
+            raise json.JSONDecodeError('Extra data', buf, match.start(match.lastindex)) # type: ignore
+
+        pos = match.end()
+        kind = match.lastindex
+        token = match.group(kind)
+
+        if kind == 2:
+            if token in '[{':
+                if expect != _VALUE:
+                    raise json.JSONDecodeError('Unexpected container', buf, pos - 1)
+                if just_opened:
+                    out.append(breaks[len(stack)])
+                out.append(token)
+                stack.append(token)
+                if len(breaks) <= len(stack):
+                    breaks.append(newline + indent_str * len(stack))
+                expect = _FIRST_KEY if token == '{' else _VALUE
+                just_opened = True
+                continue
+
+            if token in ']}':
+                if not stack or (stack[-1] == '{') != (token == '}') \
+                        or not (expect == _NEXT or (just_opened and expect in (_FIRST_KEY, _VALUE))):
+                    raise json.JSONDecodeError('Unexpected closing bracket', buf, pos - 1)
+                stack.pop()
+                if not just_opened:
+                    out.append(breaks[len(stack)])
+                out.append(token)
+                just_opened = False
+                expect = _NEXT
+                done = not stack
+
+            elif token == ',':
+                if expect != _NEXT or not stack:
+                    raise json.JSONDecodeError("Unexpected ','", buf, pos - 1)
+                out.append(item_sep)
+                out.append(breaks[len(stack)])
+                expect = _KEY if stack[-1] == '{' else _VALUE
+
+            else:
+                if expect != _COLON:
+                    raise json.JSONDecodeError("Unexpected ':'", buf, pos - 1)
+                out.append(key_sep)
+                expect = _VALUE
+
+        else:
+            if expect in (_FIRST_KEY, _KEY):
+                if kind != 1:
+                    raise json.JSONDecodeError('Expecting property name enclosed in double quotes', buf, match.start(kind))
+                expect = _COLON
+            elif expect == _VALUE:
+                expect = _NEXT
+                done = not stack
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, match.start(kind))
+
+            if just_opened:
+                out.append(breaks[len(stack)])
+                just_opened = False
+            if ensure_ascii and kind == 1 and not token.isascii():
+                token = json.dumps(json.loads(token))
+            out.append(token)
+
+        if len(out) > 8192:
+            yield ''.join(out)
+            out = []
+
+    yield ''.join(out)
+
+
+def prettify_json(file_path:str, indent:Optional[int]=4, do_print:bool=True, encoding:str='utf-8', stream:Optional[bool]=None, backend:Optional[Union[str, JsonBackend]]=None, durability:str='none', compression:Optional[str]='infer', compresslevel:Optional[int]=None) -> bool:
     """Prettify a JSON file.
-    
+
+    Big files are re-indented token by token without loading them, so memory use doesn't grow with the file size,
+    and strings and numbers are kept exactly as they are written. Smaller files are loaded and written again
+    with the JSON backend, which is faster. The file is replaced once the new text is written (see `atomic_open()`),
+    and is left as it is if it's not valid JSON.
+
     Parameters
     ----------
     file_path : str
         The path of the JSON file to prettify.
-    indent : int, optional
-        The number of spaces to use for indentation in the JSON file. Default is 4.
+    indent : Optional[int], optional
+        The number of spaces to use for indentation in the JSON file, or None for compact JSON. Default is 4.
     do_print : bool, optional
         Whether to print information about the data writing process. Default is True.
     encoding : str, optional
-        The encoding of the JSON file. Default is 'utf-8'.
-        
+        The encoding of the JSON file. Non-ASCII characters are escaped if the encoding can't represent them. Default is 'utf-8'.
+    stream : Optional[bool], optional
+        Whether to re-indent the file as a stream (True) or load it (False). Default is None, streaming files over 16 MB.
+    backend : Optional[Union[str, JsonBackend]], optional
+        The JSON backend to use when the file is loaded ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+    durability : str, optional
+        How sure to be that the data is on disk once written; 'none', 'file' or 'dir', see `atomic_open()`. Default is 'none'.
+    compression : Optional[str], optional
+        The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        The prettified file is compressed the same way
+    compresslevel : Optional[int], optional
+        The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2).
+
     Returns
     -------
     bool
         Whether the file was prettified.
     """
-    return write_json(
-        read_json(
-            file_path,
-            do_print=do_print,
-            encoding=encoding,
-            **kwargs
-        ),
-        file_path,
-        indent=indent,
-        do_print=do_print,
-        encoding=encoding,
-        **kwargs
-    )
\ No newline at end of file
+    fprint.config(do_print=do_print)
+    compression = detect_compression(file_path, compression)
+    ensure_ascii = needs_ascii(encoding)
+
+    try:
+        if stream is None:
+            stream = os.path.getsize(file_path) > _STREAM_MIN_SIZE
+
+        # The file is closed before it's replaced, which Windows doesn't allow for open files
+        if stream:
+            with atomic_open(file_path, 'w', encoding=encoding, durability=durability, compression=compression, compresslevel=compresslevel) as f_out:
+                with compressed_open(file_path, 'r', encoding, compression) as f_in:
+                    for text in _reindent_stream(f_in, indent, ensure_ascii):
+                        f_out.write(text)
+        else:
+            backend = get_json_backend(backend)
+            with compressed_open(file_path, 'r', encoding, compression) as f_in:
+                data = backend.load(f_in)
+            text = backend.dumps(data, indent, ensure_ascii)
+            del data
+            with atomic_open(file_path, 'w', encoding=encoding, durability=durability, compression=compression, compresslevel=compresslevel) as f_out:
+                f_out.write(text)
+
+    except FileNotFoundError:
+        fprint(f'File not found: {file_path}')
+        return False
+
+    except (json.JSONDecodeError, UnicodeDecodeError) as err:
+        fprint(f'Not valid JSON, not prettifying: {file_path} ({err})')
+        return False
+
+    except Exception:
+        fprint(format_exc())
+        return False
+
+    fprint(f'Prettified JSON file: {file_path}')
+    return True
+
+
+def _prettify_worker(file_path:str, indent:Optional[int], encoding:str, stream:Optional[bool], backend:Optional[Union[str, JsonBackend]], compression:Optional[str]) -> bool:
+    """Prettify a single file in a worker process, see `prettify_json_tree()`"""
+    return prettify_json(file_path, indent, do_print=False, encoding=encoding, stream=stream, backend=backend, compression=compression)
+
+
+def prettify_json_tree(root:str, indent:Optional[int]=4, workers:Optional[int]=None, do_print:bool=True, encoding:str='utf-8', suffix:str='.json', stream:Optional[bool]=None, backend:Optional[Union[str, JsonBackend]]=None, compression:Optional[str]='infer') -> dict[str, float]:
+    """Prettify every JSON file under a directory, with a pool of processes.
+
+    Parameters
+    ----------
+    root : str
+        The directory to go through, with all its subdirectories.
+    indent : Optional[int], optional
+        The number of spaces to use for indentation, or None for compact JSON. Default is 4.
+    workers : Optional[int], optional
+        The amount of worker processes. Default is None, the amount of CPUs. 1 prettifies the files in this process.
+    do_print : bool, optional
+        Whether to print the summary. Default is True.
+    encoding : str, optional
+        The encoding of the JSON files. Default is 'utf-8'.
+    suffix : str, optional
+        The file name ending of the files to prettify. Default is '.json'.
+    stream : Optional[bool], optional
+        Whether to re-indent the files as a stream, see `prettify_json()`. Default is None, streaming files over 16 MB.
+    backend : Optional[Union[str, JsonBackend]], optional
+        The JSON backend to use when a file is loaded ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        Pass the backend by name when the files are prettified in worker processes.
+    compression : Optional[str], optional
+        The compression of the JSON files: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+
+    Returns
+    -------
+    dict[str, float]
+        The amount of found, prettified and failed files, the time it took and the files per second.
+    """
+    fprint.config(do_print=do_print)
+
+    file_paths = [os.path.join(dir_path, file_name)
+                  for dir_path, _, file_names in os.walk(root)
+                  for file_name in file_names if file_name.endswith(suffix)]
+
+    time_start = perf_counter()
+    if workers == 1 or len(file_paths) < 2:
+        results = [_prettify_worker(file_path, indent, encoding, stream, backend, compression) for file_path in file_paths]
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(workers) as executor:
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            results = list(executor.map(_prettify_worker, file_paths, *([arg] * len(file_paths) for arg in (indent, encoding, stream, backend, compression)), chunksize=chunksize))
+    seconds = perf_counter() - time_start
+
+    stats = {
+        'files': len(file_paths),
+        'prettified': sum(results),
+        'failed': len(results) - sum(results),
+        'seconds': seconds,
+        'files_per_s': len(file_paths) / seconds if seconds else 0.0,
+    }
+    fprint(f'Prettified {stats["prettified"]}/{stats["files"]} JSON files in {seconds:.2f} s ({stats["files_per_s"]:,.0f} files/s): {root}')
+    return stats
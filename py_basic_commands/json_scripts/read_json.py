@@ -1,17 +1,21 @@
 import json
 
+from py_basic_commands.json_scripts.json_backend  import JsonBackend, get_json_backend
+from py_basic_commands.json_scripts.json_cache    import json_cache
+from py_basic_commands.json_scripts.json_compact  import compact_load
+from py_basic_commands.json_scripts.json_stream   import JsonStream
+from py_basic_commands.json_scripts.keypath       import split_keypath
+from py_basic_commands.json_scripts.parallel_json import read_json_array
+from py_basic_commands.file_dir_scripts.compression  import compressed_open
 from py_basic_commands.fscripts     import Fprint
 from py_basic_commands.base         import Base
 from traceback  import format_exc
-from typing     import Any
-
-
-fprint = Fprint()
+from typing     import Any, Iterator, Optional, Union
 
 
 class ReadJson(Base):
     """Read data from a JSON file"""
-    def __init__(self, do_print:bool=True, create:bool=True, encoding:str='utf-8') -> None:
+    def __init__(self, do_print:bool=True, create:bool=True, encoding:str='utf-8', backend:Optional[Union[str, JsonBackend]]=None, cache:Union[bool, str]=False, compact:Union[bool, str]=False, compression:Optional[str]='infer', workers:Optional[int]=None) -> None:
         """Initialize the class
 
         Parameters
@@ -20,10 +24,32 @@ class ReadJson(Base):
             Whether to get feedback printed to terminal or not. Default is True.
         create : bool, optional
             Whether to create the file if it doesn't exist. Default is True.
+        encoding : str, optional
+            The encoding of the JSON file. Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to parse with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        cache : bool | str, optional
+            Whether to use the process-wide `json_cache` if the file hasn't changed since it was last read. Default is False.
+            True returns a copy of the cached data, 'frozen' returns the shared data as read-only (see `freeze()`).
+        compact : bool | str, optional
+            Whether to load the data so it takes less memory (see `compact_load()`), for large arrays of records. Default is False.
+            True interns the keys and shares equal strings, 'arrays' also stores lists of numbers as `array.array`s,
+            'rows' also stores objects as read-only `Row`s that share their keys. Parsed with `json`, and not cached.
+        compression : Optional[str], optional
+            The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        workers : Optional[int], optional
+            The amount of processes to parse a big top-level JSON array (UTF-8) with, see `read_json_array()`. Default is None, parsed in this process.
+            Other files are parsed in this process.
+            The parsed elements are sent back to this process, so the speedup is limited; `iter_json_array()` with `func` scales better. Not cached.
         """
         super().__init__(do_print)
         self.create = create
         self.encoding = encoding
+        self.backend = backend
+        self.cache = cache
+        self.compact = compact
+        self.compression = compression
+        self.workers = workers
 
 
     def __call__(self, file_path:str, **kwargs) -> dict:
@@ -37,32 +63,82 @@ class ReadJson(Base):
             Whether to get feedback printed to terminal or not. Default is True.
         create : bool, optional
             Whether to create the file if it doesn't exist. Default is True.
-        
+        encoding : str, optional
+            The encoding of the JSON file. Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to parse with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        cache : bool | str, optional
+            Whether to use the process-wide `json_cache` if the file hasn't changed since it was last read. Default is False.
+            True returns a copy of the cached data, 'frozen' returns the shared data as read-only (see `freeze()`).
+        compact : bool | str, optional
+            Whether to load the data so it takes less memory (see `compact_load()`), for large arrays of records. Default is False.
+            True interns the keys and shares equal strings, 'arrays' also stores lists of numbers as `array.array`s,
+            'rows' also stores objects as read-only `Row`s that share their keys. Parsed with `json`, and not cached.
+        compression : Optional[str], optional
+            The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        workers : Optional[int], optional
+            The amount of processes to parse a big top-level JSON array (UTF-8) with, see `read_json_array()`. Default is None, parsed in this process.
+            Other files are parsed in this process.
+            The parsed elements are sent back to this process, so the speedup is limited; `iter_json_array()` with `func` scales better. Not cached.
+        keypaths : Optional[list[str]], optional
+            Only get the values at these keypaths (like in `JsonEditor`, such as `'items[0]/id'`). Default is None, the whole document.
+            The file is streamed: everything else is skipped without building it, and reading stops once every value is found.
+        chunk_size : int, optional
+            The amount of characters to read from the file at once, with `keypaths`. Default is 65536.
         
         Returns
         -------
         Any
             The data from the JSON file, as a dictionary or list.
+            With `keypaths`, a dictionary of the found values by their keypath (keypaths that weren't found are left out).
         """
 
         # Check input values
         do_print = kwargs.get('do_print', self.do_print)
         create = kwargs.get('create', self.create)
         encoding = kwargs.get('encoding', self.encoding)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
+        cache = kwargs.get('cache', self.cache)
+        compact = kwargs.get('compact', self.compact)
+        compression = kwargs.get('compression', self.compression)
+        workers = kwargs.get('workers', self.workers)
+        keypaths = kwargs.get('keypaths')
+        chunk_size = kwargs.get('chunk_size', 1 << 16)
 
-        fprint.config(do_print=do_print)
+        fprint = Fprint(do_print=do_print)
 
         file_data = {}
 
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                file_data = json.load(f)
+            if keypaths is not None:
+                parts_lst = [split_keypath(keypath) for keypath in keypaths]
+                with compressed_open(file_path, 'r', encoding, compression) as f:
+                    found = JsonStream(f, chunk_size).extract(parts_lst)
+                file_data = {keypath: found[parts] for keypath, parts in zip(keypaths, parts_lst) if parts in found}
+                if len(file_data) < len(set(keypaths)):
+                    fprint.error(f'Keypaths not found in JSON: {[keypath for keypath in keypaths if keypath not in file_data]}')
+            elif compact:
+                with compressed_open(file_path, 'r', encoding, compression) as f:
+                    file_data = compact_load(f, compact)
+            elif workers:
+                try:
+                    file_data = read_json_array(file_path, workers, backend=kwargs.get('backend', self.backend), compression=compression)
+                except ValueError:
+                    # Not a top-level array, or not valid JSON (reported by the parse below)
+                    with compressed_open(file_path, 'r', encoding, compression) as f:
+                        file_data = backend.load(f)
+            elif cache:
+                file_data = json_cache.load(file_path, backend.load, encoding, frozen=cache == 'frozen', compression=compression)
+            else:
+                with compressed_open(file_path, 'r', encoding, compression) as f:
+                    file_data = backend.load(f)
         
         except FileNotFoundError:
             fprint.error(f'File not found: {file_path!r}')
             if create:
                 # Create empty json file
-                json.dump({}, open(file_path, 'w', encoding=encoding))
+                with compressed_open(file_path, 'w', encoding, compression) as f:
+                    json.dump({}, f)
                 fprint(f'Created file: {file_path!r}')
 
         except json.decoder.JSONDecodeError:
@@ -75,6 +151,67 @@ class ReadJson(Base):
             return file_data
 
 
+    def iter(self, file_path:str, keypath:str='', **kwargs) -> Iterator[Any]:
+        """Stream the items of a JSON array or object, one at a time.
+
+        The file is tokenized incrementally, so memory use stays bounded by the size of a single item.
+        
+        Parameters
+        ----------
+        file_path : str
+            The path of the JSON file to read from.
+        keypath : str, optional
+            The keypath (like in `JsonEditor`) of the array or object to stream. Default is '', the whole document.
+        chunk_size : int, optional
+            The amount of characters to read from the file at once. Default is 65536.
+        do_print : bool, optional
+            Whether to get feedback printed to terminal or not. Default is True.
+        create : bool, optional
+            Whether to create the file if it doesn't exist. Default is True.
+        encoding : str, optional
+            The encoding of the JSON file. Default is 'utf-8'.
+        compression : Optional[str], optional
+            The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+
+        Yields
+        ------
+        Any
+            The array elements, or `(key, value)` tuples for an object.
+        """
+
+        # Check input values
+        do_print = kwargs.get('do_print', self.do_print)
+        create = kwargs.get('create', self.create)
+        encoding = kwargs.get('encoding', self.encoding)
+        chunk_size = kwargs.get('chunk_size', 1 << 16)
+        compression = kwargs.get('compression', self.compression)
+
+        fprint = Fprint(do_print=do_print)
+
+        try:
+            with compressed_open(file_path, 'r', encoding, compression) as f:
+                stream = JsonStream(f, chunk_size)
+                if not stream.seek(split_keypath(keypath)):
+                    fprint.error(f'Keypath not found in JSON: {keypath!r}')
+                    return
+
+                yield from stream.iter_container()
+
+        except FileNotFoundError:
+            fprint.error(f'File not found: {file_path!r}')
+            if create:
+                # Create empty json file
+                with compressed_open(file_path, 'w', encoding, compression) as f:
+                    json.dump({}, f)
+                fprint(f'Created file: {file_path!r}')
+
+        except json.decoder.JSONDecodeError:
+            fprint.error(f'File cannot be read as a JSON: {file_path}')
+
+        except TypeError:
+            fprint.error(f'Value is not an array or an object: {file_path} {keypath!r}')
+
+
 read_json = ReadJson()
 
 
@@ -0,0 +1,95 @@
+import json
+
+from py_basic_commands.json_scripts.json_backend  import JsonBackend, get_json_backend
+from py_basic_commands.fscripts     import Fprint
+from py_basic_commands.base         import Base
+from codecs     import lookup
+from typing     import Any, Iterator, Optional, Union
+
+
+fprint = Fprint()
+
+
+class ReadJsonl(Base):
+    """Read records from a JSON Lines (NDJSON) file"""
+    def __init__(self, do_print:bool=True, ret_offset:bool=False, encoding:str='utf-8', backend:Optional[Union[str, JsonBackend]]=None) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        do_print : bool, optional
+            Whether to get feedback printed to terminal or not. Default is True.
+        ret_offset : bool, optional
+            Whether to yield `(offset, record)` tuples, where `offset` is the byte offset after the record. Default is False.
+        encoding : str, optional
+            The encoding of the file, one that writes a newline as the byte `b'\n'` (like UTF-8, not UTF-16). Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to parse with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        """
+        super().__init__(do_print)
+        self.ret_offset = ret_offset
+        self.encoding = encoding
+        self.backend = backend
+
+
+    def __call__(self, file_path:str, offset:int=0, **kwargs) -> Iterator[Any]:
+        """Read records from a JSON Lines file, one at a time.
+
+        Empty lines are skipped, and invalid lines are reported and skipped.
+        
+        Parameters
+        ----------
+        file_path : str
+            The path of the JSON Lines file to read from.
+        offset : int, optional
+            The byte offset to start reading from, like one given with `ret_offset`. Default is 0.
+        do_print : bool, optional
+            Whether to get feedback printed to terminal or not. Default is True.
+        ret_offset : bool, optional
+            Whether to yield `(offset, record)` tuples, where `offset` is the byte offset after the record. Default is False.
+        encoding : str, optional
+            The encoding of the file, one that writes a newline as the byte `b'\n'` (like UTF-8, not UTF-16). Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to parse with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        
+        Yields
+        ------
+        Any
+            The records, or `(offset, record)` tuples if `ret_offset` is True.
+        """
+
+        # Check input values
+        do_print = kwargs.get('do_print', self.do_print)
+        ret_offset = kwargs.get('ret_offset', self.ret_offset)
+        encoding = kwargs.get('encoding', self.encoding)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
+
+        fprint.config(do_print=do_print)
+
+        # The backends parse UTF-8 bytes directly
+        decode = lookup(encoding).name != 'utf-8'
+
+        try:
+            with open(file_path, 'rb') as f:
+                f.seek(offset)
+                for line_num, line in enumerate(f, 1):
+                    offset += len(line)
+                    if line.isspace():
+                        continue
+
+                    try:
+                        record = backend.loads(line.decode(encoding) if decode else line)
+                    except (json.decoder.JSONDecodeError, UnicodeDecodeError):
+                        fprint.error(f'Line {line_num} cannot be read as a JSON, skipping it: {file_path}')
+                        continue
+
+                    if ret_offset:
+                        yield offset, record
+                    else:
+                        yield record
+
+        except FileNotFoundError:
+            fprint.error(f'File not found: {file_path!r}')
+
+
+read_jsonl = ReadJsonl()
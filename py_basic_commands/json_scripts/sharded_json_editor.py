@@ -0,0 +1,288 @@
+import json
+import os
+
+from py_basic_commands.json_scripts.json_editor import JsonEditor
+from py_basic_commands.json_scripts.json_snapshot import snapshot_path
+from py_basic_commands.json_scripts.keypath import compile_keypath
+from py_basic_commands.file_dir_scripts.atomic_write import atomic_open
+from py_basic_commands.base import EditorBase
+from py_basic_commands.fscripts import Fprint
+
+from typing import Any, Iterator, Optional
+from urllib.parse import quote, unquote
+from zlib import crc32
+
+
+fprint = Fprint()
+
+# Doesn't end with '.json', so it can't be the shard file of a key
+_META_FILE = '_shards.meta'
+
+
+class ShardedJsonEditor(EditorBase):
+    """A json store split over the files of a directory, used like a `JsonEditor`.
+
+    Each top-level key lives in its own file (`<key>.json`), or with `shards` in one of that many
+    hash buckets (`shard-0003.json`). A shard is only read when a key in it is first used, and
+    only the changed shards are written, so opening the store and using one key reads one file"""
+    def __init__(self, dir_path:str, shards:Optional[int]=None, exit_write:bool=True, do_print:bool=False, **kwargs) -> None:
+        """Initialize the class
+
+        Parameters
+        ----------
+        dir_path : str
+            The path to the directory of the store. Created if it doesn't exist
+        shards : Optional[int], optional
+            The amount of hash buckets to split the top-level keys into, by default None (a file per top-level key).
+            An existing store keeps the layout it was made with
+        exit_write : bool, optional
+            If True, the changed shards are written when the class is exited, by default True
+        do_print : bool, optional
+            If True, print statements will be printed, by default False
+        **kwargs : Any
+            Options for the `JsonEditor` of each shard, like `backend`, `journal`, `lock` or `snapshot`
+
+        Raises
+        ------
+        ValueError
+            If `shards` is not the amount of shards of the existing store"""
+        super().__init__(dir_path, do_print)
+        self.exit_write = exit_write
+        self.editor_kwargs = kwargs
+        # Shard file path: the editor of the shard, for the shards read so far
+        self._loaded:dict[str, JsonEditor] = {}
+
+        fprint.config(do_print=do_print)
+
+        os.makedirs(dir_path, exist_ok=True)
+        meta_path = os.path.join(dir_path, _META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                stored_shards = json.load(f)['shards']
+            if shards is not None and shards != stored_shards:
+                raise ValueError(f'The store at {dir_path!r} has {stored_shards} shards, not {shards} (resharding is not supported)')
+            shards = stored_shards
+        else:
+            if shards is not None and shards < 1:
+                raise ValueError(f'shards has to be at least 1, not {shards}')
+            with atomic_open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'shards': shards}, f)
+        self.shards = shards
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the changed shards"""
+        if self.exit_write:
+            self.save_file()
+
+
+    def _top_key(self, keypath:str) -> str:
+        """Returns the top-level key of a keypath, which selects the shard"""
+        parts = compile_keypath(keypath)
+        if not parts or not isinstance(parts[0], str):
+            raise KeyError(f'Keypath does not start with a top-level key: {keypath!r}')
+        return parts[0]
+
+
+    def shard_path(self, key:str) -> str:
+        """Returns the path of the shard file of a top-level key
+
+        Parameters
+        ----------
+        key : str
+            The top-level key
+
+        Returns
+        -------
+        str
+            The path of the shard file"""
+        if self.shards is None:
+            # Keys that only differ in case share a file on case-insensitive file systems, use `shards` there
+            file_name = f'{quote(key, safe="")}.json'
+        else:
+            file_name = f'shard-{crc32(key.encode()) % self.shards:04d}.json'
+        return os.path.join(self.file_path, file_name)
+
+
+    def _shard(self, key:str, create:bool=False) -> Optional[JsonEditor]:
+        """Returns the editor of the shard of a top-level key, reading it on first use.
+        None if the shard doesn't exist and isn't created"""
+        path = self.shard_path(key)
+        shard = self._loaded.get(path)
+        if shard is None:
+            if not os.path.exists(path):
+                if not create:
+                    return None
+                with atomic_open(path, 'w', encoding='utf-8', compression=self.editor_kwargs.get('compression', 'infer')) as f:
+                    f.write('{}')
+            shard = JsonEditor(path, exit_write=False, do_print=self.do_print, **self.editor_kwargs)
+            self._loaded[path] = shard
+        return shard
+
+
+    def _shard_paths(self) -> list[str]:
+        """Returns the paths of every shard file, read or not"""
+        paths = {os.path.join(self.file_path, file_name) for file_name in os.listdir(self.file_path) if file_name.endswith('.json')}
+        return sorted(paths.union(self._loaded))
+
+
+    def _all_shards(self) -> Iterator[JsonEditor]:
+        """Reads every shard, and yields their editors"""
+        for path in self._shard_paths():
+            shard = self._loaded.get(path)
+            if shard is None:
+                shard = self._loaded[path] = JsonEditor(path, exit_write=False, do_print=self.do_print, **self.editor_kwargs)
+            yield shard
+
+
+    def __setitem__(self, keypath:str, data:Any):
+        """Adds data to the store. If the data already exists, it will be overwritten
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath to add the data to, like in `JsonEditor`
+        data : Any
+            The data to add"""
+        self._shard(self._top_key(keypath), create=True)[keypath] = data # type: ignore
+
+
+    def __getitem__(self, keypath:str) -> Any:
+        """Returns the data at a keypath, None if it doesn't exist
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath, like in `JsonEditor`
+
+        Returns
+        -------
+        Any
+            The data"""
+        shard = self._shard(self._top_key(keypath))
+        return None if shard is None else shard[keypath]
+
+
+    def __delitem__(self, keypath:str):
+        """Deletes the data at a keypath
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath to delete
+
+        Raises
+        ------
+        KeyError
+            If the keypath doesn't exist"""
+        shard = self._shard(self._top_key(keypath))
+        if shard is None or keypath not in shard:
+            raise KeyError(keypath)
+        del shard[keypath]
+
+
+    def __contains__(self, keypath:str) -> bool:
+        """Checks if a keypath is in the store
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath to check for
+
+        Returns
+        -------
+        bool
+            True if the keypath is in the store"""
+        try:
+            shard = self._shard(self._top_key(keypath))
+        except KeyError:
+            return False
+        return shard is not None and keypath in shard
+
+
+    def __len__(self) -> int:
+        """Returns the amount of top-level keys. Reads every shard in hash bucket mode
+
+        Returns
+        -------
+        int
+            The amount of top-level keys"""
+        return len(self.keys())
+
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        """Returns an iterator of the top-level keys and values, like `JsonEditor`. Reads every shard"""
+        for shard in self._all_shards():
+            yield from shard
+
+
+    def keys(self) -> list[str]:
+        """Returns the top-level keys. In the file per key mode, only the changed shards are read
+
+        Returns
+        -------
+        list[str]
+            The top-level keys"""
+        if self.shards is not None:
+            return [key for shard in self._all_shards() for key in shard.keys()]
+
+        keys = []
+        for path in self._shard_paths():
+            shard = self._loaded.get(path)
+            if shard is None:
+                keys.append(unquote(os.path.basename(path)[:-len('.json')]))
+            else:
+                # Deleted keys keep their file until the store is saved
+                keys.extend(shard.keys())
+        return keys
+
+
+    def append(self, keypath:str, data:Any) -> str:
+        """Appends data to the list at a keypath, see `JsonEditor.append()`
+
+        Parameters
+        ----------
+        keypath : str
+            The keypath of the list
+        data : Any
+            The data to append
+
+        Returns
+        -------
+        str
+            The keypath of the appended data"""
+        return self._shard(self._top_key(keypath), create=True).append(keypath, data) # type: ignore
+
+
+    @property
+    def loaded_shards(self) -> int:
+        """The amount of shards read so far"""
+        return len(self._loaded)
+
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether any read shard has unsaved changes"""
+        return any(shard.is_dirty for shard in self._loaded.values())
+
+
+    def save_file(self) -> int:
+        """Writes the changed shards. Shards left without keys are removed
+
+        Returns
+        -------
+        int
+            The amount of shards written (or removed)"""
+        write_amnt = 0
+        for path, shard in list(self._loaded.items()):
+            if len(shard) == 0:
+                # An empty shard is the same as a missing one, and would keep a deleted key in `keys()`
+                for file_path in (path, shard.journal_path, snapshot_path(path)):
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                del self._loaded[path]
+                write_amnt += 1
+            elif shard.save_file(only_if_dirty=True):
+                write_amnt += 1
+        fprint(f'Wrote {write_amnt} shards: {self.file_path}')
+        return write_amnt
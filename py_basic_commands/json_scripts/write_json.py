@@ -1,27 +1,124 @@
-import json
-
-from py_basic_commands.json_scripts.read_json       import read_json
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.file_dir_scripts.create_dirs     import create_dirs
+from py_basic_commands.file_dir_scripts.compression     import compressed_open, detect_compression
+from py_basic_commands.json_scripts.json_backend    import JsonBackend, get_json_backend, needs_ascii
 from py_basic_commands.fscripts                     import Fprint
 from py_basic_commands.base                         import Base
 
 from traceback      import format_exc
-from typing         import Any
-from os             import makedirs
-
-fprint = Fprint()
+from typing         import IO, Any, Optional, Union
+from os.path        import getsize
+
+import codecs
+import os
+
+# Files up to this size are parsed to check for data, bigger ones are only looked at from the start and end
+_PARSE_SIZE = 64 * 1024
+_EDGE_SIZE = 256
+_WHITESPACE = b' \t\r\n'
+
+
+def _edge_bytes(f:IO[bytes], head:bytes, compression:Optional[str]) -> bytes:
+    """Returns the last bytes of a file, after `head` was read from it
+
+    Uncompressed files are seeked to the end, compressed ones have to be read through"""
+    if compression is None:
+        f.seek(-_EDGE_SIZE, os.SEEK_END)
+        return f.read()
+
+    tail = head[-_EDGE_SIZE:]
+    while True:
+        chunk = f.read(1024 * 1024)
+        if not chunk:
+            return tail
+        tail = (tail + chunk)[-_EDGE_SIZE:]
+
+
+def _looks_like_data(head:bytes, tail:bytes) -> Optional[bool]:
+    """Checks if a big JSON text has data, from its first and last bytes
+
+    Returns
+    -------
+    Optional[bool]
+        True for a non-empty object, array or string that is closed at the end, None if it can't be told this way"""
+    head = head.lstrip(_WHITESPACE)
+    tail = tail.rstrip(_WHITESPACE)
+    first, last = head[:1], tail[-1:]
+    after_first = head[1:].lstrip(_WHITESPACE)[:1]
+    if first == b'{' and after_first == b'"' and last == b'}':
+        return True
+    if first == b'[' and after_first not in (b']', b'') and last == b']':
+        return True
+    if first == b'"' and after_first not in (b'"', b'') and last == b'"':
+        return True
+    return None
+
+
+def _has_data(file_path:str, encoding:str, compression:Optional[str]='infer', backend:Optional[Union[str, JsonBackend]]=None) -> bool:
+    """Check if a JSON file has any data in it, like `read_json()` would return it.
+
+    Missing, empty and unreadable files, files that aren't valid JSON, and files with an empty or false value
+    (like `{}`, `[]`, `0` or `null`) have no data.
+
+    Only small files are parsed. A bigger file is looked at from its first and last bytes: a non-empty object, array or string
+    that is closed at the end has data (so a big file broken in the middle is kept, rather than overwritten).
+    Anything else is parsed
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the JSON file
+    encoding : str
+        The encoding of the JSON file
+    compression : Optional[str], optional
+        The compression of the JSON file, see `compressed_open()`. Default is 'infer'
+    backend : Optional[Union[str, JsonBackend]], optional
+        The JSON backend to parse the file with. Default is None, the fastest installed one
+
+    Returns
+    -------
+    bool
+        Whether the file has data"""
+    try:
+        if getsize(file_path) == 0:
+            return False
+
+        compression = detect_compression(file_path, compression)
+        # The structural characters are single bytes in the other encodings
+        if not codecs.lookup(encoding).name.startswith(('utf-16', 'utf-32')):
+            with compressed_open(file_path, 'rb', compression=compression) as f:
+                head = f.read(_PARSE_SIZE + 1)
+                if len(head) <= _PARSE_SIZE:
+                    return bool(get_json_backend(backend).loads(head.decode(encoding)))
+                if head.startswith(codecs.BOM_UTF8):
+                    head = head[len(codecs.BOM_UTF8):]
+                if _looks_like_data(head, _edge_bytes(f, head, compression)):
+                    return True
+
+        with compressed_open(file_path, 'r', encoding, compression) as f:
+            return bool(get_json_backend(backend).load(f))
+    except (OSError, EOFError, ValueError):
+        return False
 
 
 class WriteJson(Base):
-    def __init__(self, force:bool=False, indent:int=4, do_print:bool=True, encoding:str='utf-8'):
+    def __init__(self, force:bool=False, indent:int=4, do_print:bool=True, encoding:str='utf-8', backend:Optional[Union[str, JsonBackend]]=None, durability:str='none', compression:Optional[str]='infer', compresslevel:Optional[int]=None):
         super().__init__(do_print)
 
         self.force = force
         self.indent = indent
         self.encoding = encoding
+        self.backend = backend
+        self.durability = durability
+        self.compression = compression
+        self.compresslevel = compresslevel
                 
 
     def __call__(self, data:Any, file_path:str, **kwargs) -> bool:
         """Write data to a JSON file.
+
+        The data is written to a temporary file, which then replaces the JSON file.
+        So the JSON file is never left half written, even if the writing fails.
         
         Parameters
         ----------
@@ -35,6 +132,16 @@ class WriteJson(Base):
             Whether to overwrite any existing data in the JSON file. Default is False.
         do_print : bool, optional
             Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the JSON file. Non-ASCII characters are escaped if the encoding can't represent them. Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            How sure to be that the data is on disk once written; 'none', 'file' (fsync the file) or 'dir' (also fsync the directory). Default is 'none'.
+        compression : Optional[str], optional
+            The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        compresslevel : Optional[int], optional
+            The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2).
         
         Returns
         -------
@@ -47,23 +154,26 @@ class WriteJson(Base):
         force = kwargs.get('force', self.force)
         do_print = kwargs.get('do_print', self.do_print)
         encoding = kwargs.get('encoding', self.encoding)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
+        durability = kwargs.get('durability', self.durability)
+        compression = kwargs.get('compression', self.compression)
+        compresslevel = kwargs.get('compresslevel', self.compresslevel)
 
-        fprint.config(do_print=do_print)
+        fprint = Fprint(do_print=do_print)
         
         data_type = data.__class__.__name__
 
         try:
             if data_type == ('str'):
-                data = json.loads(data)
+                data = backend.loads(data)
 
-            d = read_json(file_path, do_print=do_print, encoding=encoding)
-            
-            if d and not force:
+            if not force and _has_data(file_path, encoding, compression, backend):
                 fprint(f'Data found in JSON file, not writing new data: {file_path}')
                 return False
 
-            with open(file_path, 'w', encoding=encoding) as f:
-                json.dump(data, f, indent=indent)
+            text = backend.dumps(data, indent, needs_ascii(encoding))
+            with atomic_open(file_path, 'w', encoding=encoding, durability=durability, compression=compression, compresslevel=compresslevel) as f:
+                f.write(text)
 
             fprint(f'Wrote data to JSON file: {file_path}')
             return True
@@ -74,8 +184,8 @@ class WriteJson(Base):
         except FileNotFoundError:
             if force:
                 fprint('Force is True, creating file path')
-                makedirs(file_path)
-                self(data, file_path, indent=indent, force=force, do_print=do_print)
+                if create_dirs(file_path, do_print=do_print):
+                    return self(data, file_path, indent=indent, force=force, do_print=do_print, encoding=encoding, backend=backend, durability=durability, compression=compression, compresslevel=compresslevel)
 
         except Exception:
             fprint(format_exc())
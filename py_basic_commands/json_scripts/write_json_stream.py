@@ -0,0 +1,152 @@
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.file_dir_scripts.create_dirs     import create_dirs
+from py_basic_commands.json_scripts.json_backend    import JsonBackend, get_json_backend, needs_ascii
+from py_basic_commands.json_scripts.write_json      import _has_data
+from py_basic_commands.fscripts                     import Fprint
+from py_basic_commands.base                         import Base
+
+from traceback      import format_exc
+from typing         import Any, Iterable, Optional, Union
+
+
+class WriteJsonStream(Base):
+    """Write the items of any iterable to a JSON file as an array, without holding them in memory"""
+    def __init__(self, force:bool=False, indent:Optional[int]=4, batch_size:int=1000, do_print:bool=True, encoding:str='utf-8', backend:Optional[Union[str, JsonBackend]]=None, durability:str='none', compression:Optional[str]='infer', compresslevel:Optional[int]=None):
+        """Initialize the class
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to overwrite any existing data in the JSON file. Default is False.
+        indent : Optional[int], optional
+            The number of spaces to use for indentation in the JSON file, None for no newlines. Default is 4.
+        batch_size : int, optional
+            The amount of items to write to the file at once. Default is 1000.
+        do_print : bool, optional
+            Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the JSON file. Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            'none', 'file' (fsync the file) or 'dir' (also fsync the directory). Default is 'none'.
+        compression : Optional[str], optional
+            The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        compresslevel : Optional[int], optional
+            The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2).
+        """
+        super().__init__(do_print)
+
+        self.force = force
+        self.indent = indent
+        self.batch_size = batch_size
+        self.encoding = encoding
+        self.backend = backend
+        self.durability = durability
+        self.compression = compression
+        self.compresslevel = compresslevel
+
+
+    def __call__(self, items:Iterable[Any], file_path:str, **kwargs) -> int:
+        """Write the items of an iterable (like a generator) to a JSON file as an array.
+
+        `[` is written first, then each item as it is made, then `]`, so memory use doesn't grow with the amount of items.
+        The file is the same as `write_json(list(items), file_path)` would write.
+        Like `WriteJson()`, the items are written to a temporary file, which replaces the JSON file once all of them are written.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+            The items of the array.
+        file_path : str
+            The path of the JSON file to write to.
+        force : bool, optional
+            Whether to overwrite any existing data in the JSON file. Default is False.
+        indent : Optional[int], optional
+            The number of spaces to use for indentation in the JSON file, None for no newlines. Default is 4.
+        batch_size : int, optional
+            The amount of items to write to the file at once. Default is 1000.
+        do_print : bool, optional
+            Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the JSON file. Non-ASCII characters are escaped if the encoding can't represent them. Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            'none', 'file' (fsync the file) or 'dir' (also fsync the directory). Default is 'none'.
+        compression : Optional[str], optional
+            The compression of the JSON file: 'infer' (from the extension, like `.json.gz`), None, 'gzip', 'bz2' or 'xz'. Default is 'infer'.
+        compresslevel : Optional[int], optional
+            The compression level (the preset for xz). Default is None (6 for gzip and xz, 9 for bz2).
+
+        Returns
+        -------
+        int
+            The amount of items written.
+        """
+
+        # Check input values
+        force = kwargs.get('force', self.force)
+        indent = kwargs.get('indent', self.indent)
+        batch_size = kwargs.get('batch_size', self.batch_size)
+        do_print = kwargs.get('do_print', self.do_print)
+        encoding = kwargs.get('encoding', self.encoding)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
+        durability = kwargs.get('durability', self.durability)
+        compression = kwargs.get('compression', self.compression)
+        compresslevel = kwargs.get('compresslevel', self.compresslevel)
+
+        fprint = Fprint(do_print=do_print)
+
+        if not force and _has_data(file_path, encoding, compression, backend):
+            fprint(f'Data found in JSON file, not writing new data: {file_path}')
+            return 0
+
+        ensure_ascii = needs_ascii(encoding)
+        if indent is None:
+            opening, separator, closing = '[', ',', ']'
+        else:
+            # The items are one level in, like in the array `backend.dumps()` would make
+            pad = '\n' + ' ' * indent
+            opening, separator, closing = '[' + pad, ',' + pad, '\n]'
+        item_amnt = 0
+
+        try:
+            with atomic_open(file_path, 'w', encoding=encoding, durability=durability, compression=compression, compresslevel=compresslevel) as f:
+                batch = []
+                for item in items:
+                    text = backend.dumps(item, indent, ensure_ascii)
+                    if indent is not None:
+                        # Strings in JSON text can't have newlines, so every newline is between values
+                        text = text.replace('\n', pad)
+                    batch.append(text)
+                    if len(batch) >= batch_size:
+                        f.write((separator if item_amnt else opening) + separator.join(batch))
+                        item_amnt += len(batch)
+                        batch.clear()
+
+                if batch:
+                    f.write((separator if item_amnt else opening) + separator.join(batch))
+                    item_amnt += len(batch)
+                f.write(closing if item_amnt else '[]')
+
+            fprint(f'Wrote {item_amnt} items to JSON file: {file_path}')
+            return item_amnt
+
+        except TypeError:
+            fprint(f'An item can\'t be written to JSON, nothing was written: {file_path}')
+
+        except FileNotFoundError:
+            if force:
+                # Nothing was taken from the items yet, the temporary file couldn't be made
+                fprint('Force is True, creating file path')
+                if create_dirs(file_path, do_print=do_print):
+                    return self(items, file_path, **kwargs)
+
+        except Exception:
+            fprint(format_exc())
+
+        return 0
+
+
+write_json_stream = WriteJsonStream()
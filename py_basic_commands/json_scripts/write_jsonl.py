@@ -0,0 +1,122 @@
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.json_scripts.json_backend    import JsonBackend, get_json_backend, needs_ascii
+from py_basic_commands.fscripts                     import Fprint
+from py_basic_commands.base                         import Base
+
+from traceback      import format_exc
+from typing         import Any, Iterable, Optional, Union
+from os.path        import getsize
+
+fprint = Fprint()
+
+
+class WriteJsonl(Base):
+    """Write records to a JSON Lines (NDJSON) file"""
+    def __init__(self, force:bool=False, batch_size:int=1000, do_print:bool=True, encoding:str='utf-8', backend:Optional[Union[str, JsonBackend]]=None, durability:str='none'):
+        """Initialize the class
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to overwrite an existing file that has data. Default is False.
+        batch_size : int, optional
+            The amount of records to write to the file at once. Default is 1000.
+        do_print : bool, optional
+            Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the file, one that writes a newline as the byte `b'\n'` (like UTF-8, not UTF-16). Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            'none', 'file' (fsync the file) or 'dir' (also fsync the directory). Default is 'none'.
+        """
+        super().__init__(do_print)
+
+        self.force = force
+        self.batch_size = batch_size
+        self.encoding = encoding
+        self.backend = backend
+        self.durability = durability
+
+
+    def __call__(self, records:Iterable[Any], file_path:str, **kwargs) -> int:
+        """Write records to a JSON Lines file, one record per line.
+
+        The records are streamed to a temporary file, which replaces the file once all of them are written.
+        So any iterable (like a generator) can be written without holding it in memory.
+        
+        Parameters
+        ----------
+        records : Iterable[Any]
+            The records to write.
+        file_path : str
+            The path of the JSON Lines file to write to.
+        force : bool, optional
+            Whether to overwrite an existing file that has data. Default is False.
+        batch_size : int, optional
+            The amount of records to write to the file at once. Default is 1000.
+        do_print : bool, optional
+            Whether to print information about the data writing process. Default is True.
+        encoding : str, optional
+            The encoding of the file, one that writes a newline as the byte `b'\n'` (like UTF-8, not UTF-16). Default is 'utf-8'.
+        backend : Optional[Union[str, JsonBackend]], optional
+            The JSON backend to serialize with ('orjson', 'ujson', 'json'). Default is None, the fastest installed one.
+        durability : str, optional
+            'none', 'file' (fsync the file) or 'dir' (also fsync the directory). Default is 'none'.
+        
+        Returns
+        -------
+        int
+            The amount of records written.
+        """
+
+        # Check input values
+        force = kwargs.get('force', self.force)
+        batch_size = kwargs.get('batch_size', self.batch_size)
+        do_print = kwargs.get('do_print', self.do_print)
+        encoding = kwargs.get('encoding', self.encoding)
+        backend = get_json_backend(kwargs.get('backend', self.backend))
+        durability = kwargs.get('durability', self.durability)
+
+        fprint.config(do_print=do_print)
+
+        try:
+            if not force and getsize(file_path) > 0:
+                fprint(f'Data found in JSON Lines file, not writing new data: {file_path}')
+                return 0
+        except OSError:
+            pass
+
+        ensure_ascii = needs_ascii(encoding)
+        record_amnt = 0
+
+        try:
+            with atomic_open(file_path, 'w', encoding=encoding, durability=durability) as f:
+                batch = []
+                for record in records:
+                    batch.append(backend.dumps(record, None, ensure_ascii))
+                    if len(batch) >= batch_size:
+                        f.write('\n'.join(batch) + '\n')
+                        record_amnt += len(batch)
+                        batch.clear()
+
+                if batch:
+                    f.write('\n'.join(batch) + '\n')
+                    record_amnt += len(batch)
+
+            fprint(f'Wrote {record_amnt} records to JSON Lines file: {file_path}')
+            return record_amnt
+
+        except TypeError:
+            fprint(f'A record can\'t be written to JSON, nothing was written: {file_path}')
+
+        except FileNotFoundError:
+            fprint(f'Directory not found: {file_path}')
+
+        except Exception:
+            fprint(format_exc())
+
+        return 0
+
+
+write_jsonl = WriteJsonl()
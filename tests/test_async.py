@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+from py_basic_commands.async_scripts import AsyncJsonEditor, aread_file, aread_json, aread_many, awrite_file, awrite_json
+
+
+def test_json_round_trip(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+
+    async def run():
+        assert await awrite_json({'a': [1, 2]}, file_path, do_print=False)
+        return await aread_json(file_path, do_print=False)
+
+    assert asyncio.run(run()) == {'a': [1, 2]}
+
+
+def test_file_round_trip(tmp_path):
+    file_path = str(tmp_path / 'text.txt')
+
+    async def run():
+        await awrite_file(['a', 'b'], file_path, do_print=False)
+        return await aread_file(file_path, do_print=False)
+
+    assert asyncio.run(run()) == ['a', 'b']
+
+
+def test_read_many_keeps_order(tmp_path):
+    file_paths = []
+    for i in range(20):
+        file_path = tmp_path / f'{i}.json'
+        file_path.write_text(json.dumps({'id': i}))
+        file_paths.append(str(file_path))
+
+    results = asyncio.run(aread_many(file_paths, max_concurrency=3, do_print=False))
+    assert [result['id'] for result in results] == list(range(20))
+
+
+def test_concurrent_calls_keep_their_print_settings(tmp_path, capsys):
+    # Calls in other threads used to change the print settings of each other
+    file_paths = [str(tmp_path / f'missing_{i}.json') for i in range(40)]
+
+    async def run():
+        await asyncio.gather(*(aread_json(file_path, do_print=i % 2 == 0, create=False) for i, file_path in enumerate(file_paths)))
+
+    asyncio.run(run())
+    out = capsys.readouterr().out
+    assert [file_path for file_path in file_paths if file_path in out] == file_paths[::2]
+
+
+def test_async_json_editor(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('{"a": 1}')
+
+    async def run():
+        async with AsyncJsonEditor(str(file_path)) as json_editor:
+            json_editor['b'] = 2
+        return json_editor
+
+    json_editor = asyncio.run(run())
+    assert json_editor.write_stats['written'] == 1
+    assert json.loads(file_path.read_text()) == {'a': 1, 'b': 2}
@@ -0,0 +1,114 @@
+import bz2
+import gzip
+import io
+import lzma
+
+import pytest
+
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.file_dir_scripts.compression     import compressed_open, detect_compression, wrap_compressed
+from py_basic_commands.file_dir_scripts.read_file       import read_file
+from py_basic_commands.file_dir_scripts.write_file      import write_file
+from py_basic_commands.json_scripts.read_json           import read_json
+from py_basic_commands.json_scripts.write_json          import write_json
+
+
+CODECS = {'gzip': ('.gz', gzip.open), 'bz2': ('.bz2', bz2.open), 'xz': ('.xz', lzma.open)}
+TEXT = 'line ä\n' * 1000
+
+
+@pytest.mark.parametrize('file_path, compression', [
+    ('data.json', None),
+    ('data.json.gz', 'gzip'),
+    ('DATA.JSON.GZ', 'gzip'),
+    ('data.bz2', 'bz2'),
+    ('data.xz', 'xz'),
+    ('data.lzma', 'xz'),
+    ('data.gz.json', None),
+])
+def test_detect_compression(file_path, compression):
+    assert detect_compression(file_path) == compression
+    assert detect_compression(file_path, None) is None
+    assert detect_compression(file_path, 'bz2') == 'bz2'
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        detect_compression('data.json', 'zip')
+
+
+@pytest.mark.parametrize('compression', list(CODECS))
+def test_round_trip(tmp_path, compression):
+    extension, codec_open = CODECS[compression]
+    file_path = str(tmp_path / f'data.txt{extension}')
+
+    with compressed_open(file_path, 'w') as f:
+        f.write(TEXT)
+    # Written with the codec, readable with the standard library
+    with codec_open(file_path, 'rt', encoding='utf-8') as f:
+        assert f.read() == TEXT
+    with compressed_open(file_path) as f:
+        assert f.read() == TEXT
+
+    # Appending adds a stream, which is read back as one file
+    with compressed_open(file_path, 'a') as f:
+        f.write('more\n')
+    with compressed_open(file_path) as f:
+        assert f.read() == TEXT + 'more\n'
+
+    with compressed_open(file_path, 'wb', compresslevel=1) as f:
+        f.write(b'\x00\xff')
+    with compressed_open(file_path, 'rb') as f:
+        assert f.read() == b'\x00\xff'
+
+    # Given instead of inferred from the extension
+    other_path = str(tmp_path / 'data.txt')
+    with compressed_open(other_path, 'w', compression=compression) as f:
+        f.write(TEXT)
+    with codec_open(other_path, 'rt', encoding='utf-8') as f:
+        assert f.read() == TEXT
+
+
+@pytest.mark.parametrize('compression', list(CODECS))
+def test_empty_file_reads_empty(tmp_path, compression):
+    file_path = tmp_path / f'data.txt{CODECS[compression][0]}'
+    file_path.touch()
+    with compressed_open(str(file_path)) as f:
+        assert f.read() == ''
+
+
+@pytest.mark.parametrize('compression', list(CODECS))
+def test_atomic_and_wrapped(tmp_path, compression):
+    extension, codec_open = CODECS[compression]
+    file_path = str(tmp_path / f'data.txt{extension}')
+    with atomic_open(file_path, 'w', compression='infer') as f:
+        f.write(TEXT)
+    with codec_open(file_path, 'rt', encoding='utf-8') as f:
+        assert f.read() == TEXT
+    # Only compressed when asked
+    with atomic_open(file_path, 'w') as f:
+        f.write(TEXT)
+    with open(file_path, encoding='utf-8') as f:
+        assert f.read() == TEXT
+
+    raw = io.BytesIO()
+    with wrap_compressed(raw, compression, 'w') as f:
+        f.write(TEXT)
+    assert not raw.closed
+    raw.seek(0)
+    with wrap_compressed(raw, compression) as f:
+        assert f.read() == TEXT
+
+
+@pytest.mark.parametrize('compression', list(CODECS))
+def test_file_and_json_functions(tmp_path, compression):
+    extension = CODECS[compression][0]
+    file_path = str(tmp_path / f'data.txt{extension}')
+    assert write_file(['a', 'b'], file_path, do_print=False)
+    assert read_file(file_path, do_print=False) == ['a', 'b']
+
+    json_path = str(tmp_path / f'data.json{extension}')
+    assert write_json({'a': [1, 'ä']}, json_path, do_print=False)
+    assert read_json(json_path, do_print=False) == {'a': [1, 'ä']}
+    assert read_json(json_path, keypaths=['a[1]'], do_print=False) == {'a[1]': 'ä'}
+    assert list(read_json.iter(json_path, 'a', do_print=False)) == [1, 'ä']
@@ -0,0 +1,37 @@
+import os
+
+from py_basic_commands.file_dir_scripts.file_editor import FileEditor
+
+
+def test_exit_writes_only_changes(tmp_path):
+    file_path = tmp_path / 'text.txt'
+    file_path.write_text('a\nb')
+    mtime = file_path.stat().st_mtime_ns
+
+    with FileEditor(str(file_path), do_print=False) as file_editor:
+        assert file_editor[0] == 'a'
+        assert not file_editor.is_dirty
+    assert file_editor.write_stats == {'written': 0, 'skipped': 1}
+    assert file_path.stat().st_mtime_ns == mtime
+
+    with FileEditor(str(file_path), do_print=False) as file_editor:
+        file_editor.append('c')
+        assert file_editor.is_dirty
+    assert file_editor.write_stats == {'written': 1, 'skipped': 0}
+    assert file_path.read_text().splitlines() == ['a', 'b', 'c']
+
+
+def test_dirty_after_changing_back(tmp_path):
+    file_path = tmp_path / 'text.txt'
+    file_path.write_text('a\nb')
+    file_editor = FileEditor(str(file_path), exit_write=False, do_print=False)
+    file_editor[1] = 'x'
+    assert file_editor.is_dirty
+    file_editor[1] = 'b'
+    assert not file_editor.is_dirty
+
+    file_editor.overwrite('new')
+    file_editor.update_write()
+    assert not file_editor.is_dirty
+    assert file_editor.write_stats['written'] == 1
+    assert os.listdir(tmp_path) == ['text.txt']
@@ -0,0 +1,109 @@
+import json
+import threading
+
+import pytest
+
+from py_basic_commands.file_dir_scripts.file_lock   import file_lock
+from py_basic_commands.json_scripts.json_editor     import JsonEditor, JsonConflictError
+from multiprocessing    import Pool
+
+
+def append_worker(file_path:str, worker_id:int, round_amnt:int, on_conflict:str, journal:bool):
+    for i in range(round_amnt):
+        while True:
+            try:
+                with JsonEditor(file_path, lock=True, on_conflict=on_conflict, journal=journal) as json_editor:
+                    json_editor.append('items', f'{worker_id}-{i}')
+                break
+            except JsonConflictError:
+                pass
+
+
+def test_lock_timeout(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    with file_lock(file_path):
+        got_lock = []
+
+        def try_lock():
+            try:
+                with file_lock(file_path, timeout=0.05):
+                    got_lock.append(True)
+            except TimeoutError:
+                got_lock.append(False)
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+    assert got_lock == [False]
+
+    with file_lock(file_path, timeout=0.05) as lock_path:
+        assert lock_path == f'{file_path}.lock'
+
+
+def make_file(tmp_path, data) -> str:
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps(data))
+    return str(file_path)
+
+
+def test_conflict_error(tmp_path):
+    file_path = make_file(tmp_path, {'a': 1})
+    json_editor = JsonEditor(file_path, lock=True, exit_write=False)
+    json_editor['b'] = 2
+    with JsonEditor(file_path, lock=True) as other_editor:
+        other_editor['c'] = 3
+
+    with pytest.raises(JsonConflictError):
+        json_editor.save_file()
+    assert json.loads(open(file_path).read()) == {'a': 1, 'c': 3}
+
+
+def test_unchanged_editor_has_no_conflict(tmp_path):
+    file_path = make_file(tmp_path, {'a': 1})
+    with JsonEditor(file_path, lock=True) as json_editor:
+        with JsonEditor(file_path, lock=True) as other_editor:
+            other_editor['c'] = 3
+    assert json_editor.write_stats['skipped'] == 1
+    assert json.loads(open(file_path).read()) == {'a': 1, 'c': 3}
+
+
+@pytest.mark.parametrize('journal', [False, True])
+def test_merge(tmp_path, journal):
+    file_path = make_file(tmp_path, {'items': [0]})
+    json_editor = JsonEditor(file_path, lock=True, on_conflict='merge', journal=journal, exit_write=False)
+    json_editor.append('items', 1)
+    json_editor['b'] = 2
+    with JsonEditor(file_path, lock=True, journal=journal) as other_editor:
+        other_editor.append('items', 'other')
+
+    assert json_editor.save_file()
+    assert json_editor.write_stats['merged'] == 1
+    expected = {'items': [0, 'other', 1], 'b': 2}
+    assert json_editor.b_json_data.dict() == expected
+    assert JsonEditor(file_path, journal=journal, exit_write=False).b_json_data.dict() == expected
+
+
+@pytest.mark.parametrize('journal', [False, True])
+def test_merge_refuses_direct_changes(tmp_path, journal):
+    file_path = make_file(tmp_path, {'a': {'b': 1}})
+    json_editor = JsonEditor(file_path, lock=True, on_conflict='merge', journal=journal, exit_write=False)
+    json_editor['c'] = 1
+    json_editor['a']['b'] = 2
+    with JsonEditor(file_path, lock=True, journal=journal) as other_editor:
+        other_editor['d'] = 3
+    with pytest.raises(JsonConflictError):
+        json_editor.save_file()
+    assert json_editor.write_stats['merged'] == 0
+    # Nothing of the other process is lost either
+    assert JsonEditor(file_path, journal=journal, exit_write=False).b_json_data.dict() == {'a': {'b': 1}, 'd': 3}
+
+
+@pytest.mark.parametrize('on_conflict, journal', [('error', False), ('merge', False), ('merge', True)])
+def test_processes_keep_every_append(tmp_path, on_conflict, journal):
+    file_path = make_file(tmp_path, {'items': []})
+    worker_amnt, round_amnt = 4, 10
+    with Pool(worker_amnt) as pool:
+        pool.starmap(append_worker, [(file_path, worker_id, round_amnt, on_conflict, journal) for worker_id in range(worker_amnt)])
+
+    items = JsonEditor(file_path, journal=journal, exit_write=False)['items']
+    assert sorted(items) == sorted(f'{worker_id}-{i}' for worker_id in range(worker_amnt) for i in range(round_amnt))
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from benedict import benedict
+
+from py_basic_commands.json_scripts.json_backend    import get_json_backend, json_backends, JsonBackend
+from py_basic_commands.json_scripts.json_editor     import JsonEditor
+from py_basic_commands.json_scripts.write_json      import WriteJson
+
+
+DATA = {'name': 'Äö €', 'items': [{'id': 1, 'tags': ['a', 'b']}, {'id': 2, 'tags': []}], 'empty': {}, 'none': None, 'float': 0.5}
+
+
+@pytest.mark.parametrize('backend', json_backends())
+def test_json_editor_save_round_trip(tmp_path, backend):
+    # orjson used to write the benedict object from its (empty) storage, so saving wrote `{}`
+    file_path = str(tmp_path / 'data.json')
+    with JsonEditor(file_path, backend=backend) as json_editor:
+        json_editor.new_dict(DATA)
+        json_editor['items[0]/id'] = 10
+        assert json_editor.save_file()
+
+    expected = json.loads(json.dumps(DATA))
+    expected['items'][0]['id'] = 10
+    with open(file_path, encoding='utf-8') as f:
+        assert json.load(f) == expected
+    assert JsonEditor(file_path, backend=backend, exit_write=False)().dict() == expected
+
+
+@pytest.mark.parametrize('backend', json_backends())
+@pytest.mark.parametrize('indent', [None, 2, 4])
+def test_same_layout_as_json(backend, indent):
+    text = get_json_backend(backend).dumps(benedict(DATA), indent)
+    if indent is None:
+        assert text == json.dumps(DATA, ensure_ascii=False, separators=(',', ':'))
+    else:
+        assert text == json.dumps(DATA, ensure_ascii=False, indent=indent)
+    assert get_json_backend(backend).dumps(DATA, indent, ensure_ascii=True) == json.dumps(DATA, indent=indent, separators=(',', ':') if indent is None else None)
+
+
+@pytest.mark.parametrize('backend', json_backends())
+def test_write_json_escapes_for_ascii_encodings(tmp_path, backend):
+    file_path = tmp_path / 'data.json'
+    assert WriteJson(do_print=False)(DATA, str(file_path), force=True, encoding='latin-1', backend=backend)
+    assert file_path.read_bytes().isascii()
+    assert json.loads(file_path.read_bytes()) == DATA
+
+
+def test_backend_objects_and_unknown_names():
+    backend = get_json_backend('json')
+    assert isinstance(backend, JsonBackend)
+    assert get_json_backend(backend) is backend
+    with pytest.raises(ValueError):
+        get_json_backend('nope')
+
+
+@pytest.mark.parametrize('backend', json_backends())
+def test_non_finite_floats_are_kept(tmp_path, backend):
+    # orjson writes NaN and Infinity as null, so those are written by json instead
+    data = {'nan': float('nan'), 'items': [1.5, float('inf'), None], 'big': 1e16}
+    for indent in (None, 2):
+        text = get_json_backend(backend).dumps(data, indent)
+        assert text == get_json_backend('json').dumps(data, indent)
+
+    file_path = tmp_path / 'data.json'
+    assert WriteJson(do_print=False)(data, str(file_path), force=True, backend=backend)
+    loaded = json.loads(file_path.read_text())
+    assert loaded['nan'] != loaded['nan'] and loaded['items'] == [1.5, float('inf'), None] and loaded['big'] == 1e16
+
+
+@pytest.mark.parametrize('backend', json_backends())
+def test_numbers_parse_to_the_same_values(backend):
+    data = [1e16, 1e-7, 0.1, 123456789012345678901234567890, -0.0, 2**63]
+    assert json.loads(get_json_backend(backend).dumps(data)) == data
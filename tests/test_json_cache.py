@@ -0,0 +1,91 @@
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from py_basic_commands.json_scripts.json_backend    import get_json_backend, json_backends
+from py_basic_commands.json_scripts.json_cache      import JsonCache, json_cache
+from py_basic_commands.json_scripts.json_editor     import JsonEditor
+from py_basic_commands.json_scripts.read_json       import ReadJson
+
+
+read_json = ReadJson(do_print=False)
+
+
+def write_old(file_path, text:str, compress:bool=False):
+    """Writes a file with a modification time old enough to be cached"""
+    with gzip.open(file_path, 'wt') if compress else open(file_path, 'w') as f:
+        f.write(text)
+    old_time = time.time() - 10
+    os.utime(file_path, (old_time, old_time))
+
+
+def test_copies_and_frozen_data(tmp_path):
+    file_path = tmp_path / 'data.json'
+    write_old(file_path, '{"a": {"b": [1]}}')
+    json_cache.clear()
+
+    data = read_json(str(file_path), cache=True)
+    data['a']['b'].append(2)
+    assert read_json(str(file_path), cache=True) == {'a': {'b': [1]}}
+    assert json_cache.stats()['hits'] == 1
+
+    frozen = read_json(str(file_path), cache='frozen')
+    assert frozen['a']['b'] == (1,)
+    assert read_json(str(file_path), cache='frozen') is frozen
+    with pytest.raises(TypeError):
+        frozen['a']['c'] = 1
+
+
+def test_changed_files_are_read_again(tmp_path):
+    file_path = tmp_path / 'data.json'
+    json_cache_ = JsonCache()
+    write_old(file_path, '{"a": 1}')
+    assert json_cache_.load(str(file_path), json.load) == {'a': 1}
+    write_old(file_path, '{"a": 22}')
+    assert json_cache_.load(str(file_path), json.load) == {'a': 22}
+    assert json_cache_.stats()['misses'] == 2
+
+    # Recently written files are not cached, as a change could keep the modification time
+    file_path.write_text('{"a": 3}')
+    json_cache_.load(str(file_path), json.load)
+    json_cache_.load(str(file_path), json.load)
+    assert json_cache_.stats()['hits'] == 0
+
+
+def test_key_has_backend_and_compression(tmp_path):
+    file_path = tmp_path / 'data.json.gz'
+    write_old(file_path, '{"a": 1}', compress=True)
+    json_cache_ = JsonCache()
+
+    for backend in json_backends():
+        assert json_cache_.load(str(file_path), get_json_backend(backend).load) == {'a': 1}
+    assert len(json_cache_) == len(json_backends())
+
+    # 'infer' and 'gzip' are the same for a .gz file, but None reads the compressed bytes
+    load_func = get_json_backend('json').load
+    assert json_cache_.load(str(file_path), load_func, compression='gzip') == {'a': 1}
+    assert json_cache_.stats()['hits'] == 1
+    with pytest.raises(ValueError):
+        json_cache_.load(str(file_path), load_func, compression=None)
+
+
+def test_eviction(tmp_path):
+    json_cache_ = JsonCache(max_entries=2)
+    for i in range(3):
+        write_old(tmp_path / f'{i}.json', f'[{i}]')
+        json_cache_.load(str(tmp_path / f'{i}.json'), json.load)
+    assert len(json_cache_) == 2 and json_cache_.stats()['evictions'] == 1
+
+
+def test_json_editor_cache(tmp_path):
+    file_path = tmp_path / 'data.json'
+    write_old(file_path, '{"a": 1}')
+    json_editor = JsonEditor(str(file_path), cache=True, exit_write=False)
+    json_editor['b'] = 2
+    assert JsonEditor(str(file_path), cache=True, exit_write=False)() == {'a': 1}
+
+    with pytest.raises(ValueError):
+        JsonEditor(str(file_path), cache='frozen')
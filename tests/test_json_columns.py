@@ -0,0 +1,72 @@
+import json
+
+from array import array
+
+import pytest
+
+from py_basic_commands.json_scripts.json_columns    import Column, from_columns, to_columns
+from py_basic_commands.json_scripts.json_editor     import JsonEditor
+
+
+RECORDS = [
+    {'id': 1, 'price': 2.5, 'paid': True, 'name': 'a', 'note': None, 'big': 1 << 70, 'tags': ['x']},
+    {'id': 2, 'price': 3, 'paid': False, 'name': 'b', 'big': 1},
+    {'id': 3, 'paid': None, 'note': 'late', 'tags': []},
+]
+
+
+def test_kinds_and_masks():
+    columns = to_columns(RECORDS, use_numpy=False)
+    assert list(columns) == ['id', 'price', 'paid', 'name', 'note', 'big', 'tags']
+    assert {field: column.kind for field, column in columns.items()} == {
+        'id': 'int', 'price': 'float', 'paid': 'bool', 'name': 'str', 'note': 'str', 'big': 'object', 'tags': 'object'}
+
+    assert columns['id'].values == array('q', [1, 2, 3]) and columns['id'].missing is None
+    assert columns['price'].values == array('d', [2.5, 3.0, 0.0])
+    assert list(columns['price'].mask) == [0, 0, 1] and list(columns['price'].missing) == [0, 0, 1]
+    # Null and missing are both in the mask, only missing is in `missing`
+    assert list(columns['note'].mask) == [1, 1, 0] and list(columns['note'].missing) == [0, 1, 0]
+    assert list(columns['paid'].mask) == [0, 0, 1] and columns['paid'].missing is None
+    assert columns['paid'].tolist() == [True, False, None]
+    assert len(columns['id']) == 3
+
+
+def test_round_trip():
+    records = from_columns(to_columns(RECORDS, use_numpy=False))
+    # Ints in a field with floats come back as floats
+    assert records[1]['price'] == 3.0 and type(records[1]['price']) is float
+    assert records == RECORDS
+    assert [list(record) for record in records][2] == ['id', 'paid', 'note', 'tags']
+
+    assert from_columns(to_columns(RECORDS, use_numpy=False), drop_nulls=True)[0] == {key: value for key, value in RECORDS[0].items() if value is not None}
+
+
+def test_plain_sequences():
+    records = from_columns({'a': array('q', [1, 2]), 'b': [None, 'x'], 'c': Column(['y', None], array('b', [0, 1]), 'str', array('b', [0, 1]))})
+    assert records == [{'a': 1, 'b': None, 'c': 'y'}, {'a': 2, 'b': 'x'}]
+
+    with pytest.raises(ValueError):
+        from_columns({'a': [1, 2], 'b': [1]})
+    with pytest.raises(TypeError):
+        to_columns([{'a': 1}, [1]]) # type: ignore
+
+
+def test_fields():
+    columns = to_columns(RECORDS, ['price', 'other'], use_numpy=False)
+    assert list(columns) == ['price', 'other']
+    assert columns['other'].kind == 'str' and list(columns['other'].missing) == [1, 1, 1]
+
+
+def test_editor_columns(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps({'records': RECORDS}))
+    json_editor = JsonEditor(str(file_path), exit_write=False)
+
+    columns = json_editor.to_columns('records', ['id', 'note'], use_numpy=False)
+    json_editor.from_columns('records', {'id': array('q', [value * 10 for value in columns['id'].values]), 'note': columns['note']}, update=True)
+    assert json_editor.raw['records'] == [{**record, 'id': record['id'] * 10} for record in RECORDS]
+
+    json_editor.from_columns('copy', columns)
+    assert json_editor.raw['copy'] == [{'id': 1, 'note': None}, {'id': 2}, {'id': 3, 'note': 'late'}]
+    with pytest.raises(TypeError):
+        json_editor.to_columns('records[0]')
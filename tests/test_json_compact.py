@@ -0,0 +1,89 @@
+import io
+import json
+import pickle
+
+from array import array
+
+import pytest
+
+from py_basic_commands.json_scripts.json_backend    import get_json_backend, json_backends
+from py_basic_commands.json_scripts.json_compact    import COMPACT_LEVELS, Row, compact_load
+from py_basic_commands.json_scripts.json_editor     import JsonEditor
+from py_basic_commands.json_scripts.read_json       import read_json
+
+
+RECORDS = [
+    {'id': i, 'name': f'user {i}', 'status': ['active', 'banned'][i % 2], 'score': i / 7, 'ok': i % 3 == 0,
+     'history': list(range(i, i + 10)), 'flags': [True] * 8, 'mixed': [1, 2.5] * 4, 'big': [1 << 70] * 8,
+     'nested': {'tags': ['a', 'b'], 'none': None}}
+    for i in range(20)
+]
+TEXT = json.dumps({'records': RECORDS, 'empty': [], 'short': [1, 2, 3]})
+
+
+def load(level):
+    return compact_load(io.StringIO(TEXT), level)
+
+
+def plain(data):
+    """The data as dicts and lists, as written to JSON"""
+    return json.loads(get_json_backend('json').dumps(data))
+
+
+@pytest.mark.parametrize('level', COMPACT_LEVELS)
+@pytest.mark.parametrize('backend', json_backends())
+def test_round_trip(level, backend):
+    data = load(level)
+    assert plain(data) == json.loads(TEXT)
+    text = get_json_backend(backend).dumps(data, 4)
+    assert json.loads(text) == json.loads(TEXT)
+
+
+def test_plain_level_keeps_dicts_and_lists():
+    data = load(True)
+    record = data['records'][0]
+    assert type(record) is dict and type(record['history']) is list
+    # Equal short strings are stored once
+    assert data['records'][0]['status'] is data['records'][2]['status']
+
+
+def test_arrays():
+    data = load('arrays')
+    record = data['records'][1]
+    assert record['history'] == array('q', range(1, 11))
+    assert record['score'] == 1 / 7
+    # Bools, mixed ints and floats, ints over 64 bits and short lists stay lists
+    for key in ('flags', 'mixed', 'big'):
+        assert type(record[key]) is list
+    assert type(data['short']) is list and type(data['empty']) is list
+
+
+def test_rows():
+    data = load('rows')
+    first, second = data['records'][:2]
+    assert type(first) is Row and first._index is second._index
+    assert first['name'] == 'user 0' and 'id' in first and len(first) == len(RECORDS[0])
+    assert list(first) == list(RECORDS[0])
+    with pytest.raises(TypeError):
+        first['name'] = 'x' # type: ignore
+    assert plain(pickle.loads(pickle.dumps(first))) == RECORDS[0]
+
+    # The last value of a duplicate key counts, like for dicts
+    assert compact_load(io.StringIO('[{"a": 1, "a": 2}]'), 'rows') == [{'a': 2}]
+
+
+def test_unknown_level():
+    with pytest.raises(ValueError):
+        compact_load(io.StringIO('{}'), 'frozen')
+
+
+def test_read_and_edit_compact(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(TEXT)
+    assert plain(read_json(str(file_path), compact='rows', do_print=False)) == json.loads(TEXT)
+
+    with pytest.raises(ValueError):
+        JsonEditor(str(file_path), compact='rows') # type: ignore
+    with JsonEditor(str(file_path), compact=True) as json_editor:
+        json_editor['records[0]/name'] = 'changed'
+    assert json.loads(file_path.read_text())['records'][0]['name'] == 'changed'
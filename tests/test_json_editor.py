@@ -0,0 +1,319 @@
+import json
+
+import pytest
+
+from py_basic_commands.json_scripts.json_backend import StdlibBackend
+from py_basic_commands.json_scripts.json_editor import JsonEditor
+
+
+def make_editor(tmp_path, data=None, **kwargs) -> JsonEditor:
+    file_path = tmp_path / 'data.json'
+    if data is not None:
+        file_path.write_text(json.dumps(data))
+    return JsonEditor(str(file_path), exit_write=False, **kwargs)
+
+
+def test_append(tmp_path):
+    json_editor = make_editor(tmp_path, {'list': [1]})
+    assert json_editor.append('list', 2) == 'list[1]'
+    assert json_editor.append('b', {'id': 1}) == 'b[0]'
+    assert json_editor.append('b', {'id': 2}) == 'b[1]'
+    assert json_editor.b_json_data.dict() == {'list': [1, 2], 'b': [{'id': 1}, {'id': 2}]}
+
+
+def test_contains_agrees_with_getitem(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': 1}, 'c': [0, 1, {'d': 2}], 'e': None})
+    for keypath in ['a/b', 'c[2]/d', 'e', 'c[1]']:
+        assert keypath in json_editor
+        assert json_editor[keypath] is not None or keypath == 'e'
+    for keypath in ['', 'c/[2]', 'c/[2]/d', 'a/x', 'c[5]']:
+        assert keypath not in json_editor
+        assert json_editor[keypath] is None
+
+    # Keypaths benedict normalizes are found the way benedict finds them
+    assert "c['1']" in json_editor
+    assert json_editor["c['1']"] == 1
+
+def test_key_index_follows_editor_changes(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': 1}})
+    assert json_editor.does_key_exists('b')
+    json_editor['c/d'] = {'e': 1}
+    assert json_editor.does_key_exists('d') and json_editor.does_key_exists('e')
+    del json_editor['c']
+    assert not json_editor.does_key_exists('d') and not json_editor.does_key_exists('e')
+    json_editor.remove_path('a/b')
+    assert not json_editor.does_key_exists('b')
+
+
+def test_key_index_after_direct_changes(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': 1}})
+    assert not json_editor.does_key_exists('new')
+
+    # Handing out a dict forgets the index
+    json_editor['a']['new'] = 1
+    assert json_editor.does_key_exists('new')
+    json_editor.raw['a']['other'] = 1
+    assert json_editor.does_key_exists('other')
+    json_editor()['top'] = {}
+    assert json_editor.does_key_exists('top')
+
+    # A removed key isn't found, even through a reference kept from before
+    a_dict = json_editor['a']
+    assert json_editor.does_key_exists('b')
+    del a_dict['b']
+    assert not json_editor.does_key_exists('b')
+
+    # Added through a kept reference, known after invalidate_indexes()
+    a_dict['late'] = 1
+    json_editor.invalidate_indexes()
+    assert json_editor.does_key_exists('late')
+
+
+
+def test_diff_and_subtree_hash(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': 1, 'c': [1, 2]}, 'd': {'e': 1}})
+    other = {'a': {'b': 1, 'c': [1, 2]}, 'd': {'e': 1}}
+    assert json_editor.diff(other) == {'added': [], 'removed': [], 'changed': []}
+    d_hash = json_editor.subtree_hash('d')
+
+    json_editor['a/b'] = 2
+    json_editor['d/f'] = 1
+    json_editor.remove_path('a/c[0]')
+    assert json_editor.diff(other) == {'added': ['a/c[1]'], 'removed': ['d/f'], 'changed': ['a/b', 'a/c[0]']}
+    assert json_editor.subtree_hash('d') != d_hash
+    assert json_editor.subtree_hash('a/b') is None
+
+
+def test_subtree_hash_after_direct_changes(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': 1}, 'c': {'d': 1}})
+    (tmp_path / 'other').mkdir()
+    other = make_editor(tmp_path / 'other', {'a': {'b': 1}, 'c': {'d': 1}})
+    assert json_editor.diff(other) == {'added': [], 'removed': [], 'changed': []}
+    a_hash, c_hash = json_editor.subtree_hash('a'), json_editor.subtree_hash('c')
+
+    # Handing out a dict forgets its hash
+    json_editor['a']['b'] = 2
+    assert json_editor.diff(other) == {'added': [], 'removed': [], 'changed': ['a/b']}
+    assert json_editor.subtree_hash('a') != a_hash
+    assert json_editor.subtree_hash('c') == c_hash
+    json_editor.raw['c']['d'] = 2
+    assert json_editor.subtree_hash('c') != c_hash
+    other()['a']['b'] = 2
+    assert json_editor.diff(other) == {'added': [], 'removed': [], 'changed': ['c/d']}
+
+    # Added through a kept reference, known after invalidate_indexes()
+    a_dict = json_editor['a']
+    a_hash = json_editor.subtree_hash('a')
+    a_dict['new'] = 1
+    json_editor.invalidate_indexes()
+    assert json_editor.subtree_hash('a') != a_hash
+
+
+def test_key_index_keeps_hashes(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': [1, 2]}, 'c': {}})
+    json_editor.subtree_hash()
+    hash_tree = json_editor._hash_tree
+    json_editor.rebuild_key_index()
+    json_editor.append('a/b', 3)
+    assert json_editor.does_key_exists('b')
+    assert json_editor._hash_tree is hash_tree
+
+
+@pytest.mark.parametrize('value_index', [True, False])
+def test_find_value_paths(tmp_path, value_index):
+    json_editor = make_editor(tmp_path, {'b': [1, {'x': True}], 'a': {'c': 1, 'd': 'one', 'e': None}}, value_index=value_index)
+    # Sorted lexically like keypaths(), 1 and True are equal
+    assert json_editor.find_value_path_all(1) == ['a/c', 'b[0]', 'b[1]/x']
+    assert json_editor.find_value_path_all([None, 'one']) == ['a/d', 'a/e']
+    assert json_editor.find_value_path_all(1, key='b') == ['b[0]', 'b[1]/x']
+    assert json_editor.find_value_path('one', remove_last_key=True) == 'a'
+    assert json_editor.does_value_exists('one') and not json_editor.does_value_exists('two')
+
+
+def test_value_index_after_direct_changes(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': {'b': 1}})
+    assert json_editor.find_value_path_all(1) == ['a/b']
+
+    json_editor['a']['b'] = 2
+    assert json_editor.find_value_path_all(1) == []
+    assert json_editor.find_value_path_all(2) == ['a/b']
+
+    json_editor['a/c'] = 2
+    assert json_editor.find_value_path_all(2) == ['a/b', 'a/c']
+    assert json_editor.remove_all_occurance(2) == 2
+    assert json_editor.find_value_path_all(2) == []
+
+    a_dict = json_editor['a']
+    assert json_editor.find_value_path_all(3) == []
+    a_dict['d'] = 3
+    json_editor.invalidate_indexes()
+    assert json_editor.find_value_path_all(3) == ['a/d']
+
+
+def assert_key_index_is_current(json_editor:JsonEditor):
+    key_index = {key: keypaths for key, keypaths in json_editor._key_index.items() if keypaths}
+    json_editor.rebuild_key_index()
+    assert key_index == json_editor._key_index
+
+
+def test_remove_paths(tmp_path):
+    json_editor = make_editor(tmp_path, {'list': [0, 1, 2, 3, 4, 5], 'a': {'b': {'c': 1}, 'd': 2}, 'e': [{'f': 1}, {'g': 2}]})
+    json_editor.rebuild_key_index()
+    # The indexes refer to the list before anything is removed, list[5] and list[-1] are the same item.
+    # a/b/c is removed with a/b, the paths that don't exist are skipped
+    paths = ['list[1]', 'list[3]', 'list[5]', 'list[-1]', 'a/b', 'a/b/c', 'e[0]/f', 'a/x', 'x/y', 'list[10]']
+    assert json_editor.remove_paths(paths) == 5
+    assert json_editor.b_json_data.dict() == {'list': [0, 2, 4], 'a': {'d': 2}, 'e': [{}, {'g': 2}]}
+    assert not json_editor.does_key_exists('b') and not json_editor.does_key_exists('c')
+    assert json_editor.does_key_exists('d')
+    assert_key_index_is_current(json_editor)
+
+    assert json_editor.remove_paths(['a/x', 'list[10]']) == 0
+    assert json_editor.b_json_data.dict()['list'] == [0, 2, 4]
+
+
+def test_remove_duplicates(tmp_path):
+    data = {'a': {'x': 'dup', 'y': 'dup'}, 'l': ['dup', 'keep', 'dup']}
+    json_editor = make_editor(tmp_path, data)
+    json_editor.rebuild_key_index()
+    # The first one is kept, both duplicates in the list are removed at once
+    assert json_editor.remove_duplicates('dup') == 3
+    assert json_editor.b_json_data.dict() == {'a': {'x': 'dup'}, 'l': ['keep']}
+    assert not json_editor.does_key_exists('y')
+    assert_key_index_is_current(json_editor)
+    assert json_editor.remove_duplicates('dup') == 0
+
+    json_editor = make_editor(tmp_path, data)
+    assert json_editor.remove_duplicates('dup', master_keypath='l[2]') == 3
+    assert json_editor.b_json_data.dict() == {'a': {}, 'l': ['keep', 'dup']}
+
+    json_editor = make_editor(tmp_path, data)
+    assert json_editor.remove_duplicates('dup', only_in_key='l') == 1
+    assert json_editor.b_json_data.dict() == {'a': {'x': 'dup', 'y': 'dup'}, 'l': ['dup', 'keep']}
+    with pytest.raises(Exception):
+        json_editor.remove_duplicates('dup', master_keypath='a/z')
+
+def test_remove_empty_values(tmp_path):
+    data = {'a': {'b': {'c': None}, 'd': 1}, 'l': [None, [], 1, {}, None, 2], 'm': [[None], [1, None]], 'k': {'e': {}}, 'keep': 0}
+    json_editor = make_editor(tmp_path, data)
+    # Dicts and lists that become empty are removed too, from dicts and lists
+    assert json_editor.remove_empty_values() == 11
+    assert json_editor.b_json_data.dict() == {'a': {'d': 1}, 'l': [1, 2], 'm': [[1]], 'keep': 0}
+    assert not json_editor.does_key_exists('b') and not json_editor.does_key_exists('k')
+    assert json_editor.remove_empty_values() == 0
+
+    # Only in the master keypath, which itself is kept
+    json_editor = make_editor(tmp_path, data)
+    assert json_editor.remove_empty_values('k') == 1
+    assert json_editor.b_json_data.dict() == {**data, 'k': {}}
+
+
+def test_remove_custom_empty_values(tmp_path):
+    json_editor = make_editor(tmp_path, {'a': '', 'b': 0, 'c': None, 'd': {'e': ''}, 'l': ['', 'x', '']})
+    # None and the dict that becomes empty are not in the empty values
+    assert json_editor.remove_empty_values(empty_values=['', 0]) == 5
+    assert json_editor.b_json_data.dict() == {'c': None, 'd': {}, 'l': ['x']}
+
+def test_dirty_tracking(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps({'a': {'b': 1}}))
+    # Writing on exit hashes the loaded data, so any change can be told apart
+    json_editor = JsonEditor(str(file_path))
+    assert not json_editor.is_dirty
+    assert not json_editor.save_file(only_if_dirty=True)
+    assert json_editor.write_stats['skipped'] == 1 and json_editor.write_stats['written'] == 0
+
+    # Direct changes are noticed too, and setting the old value back is not a change
+    json_editor['a']['b'] = 2
+    assert json_editor.is_dirty
+    json_editor['a/b'] = 1
+    assert not json_editor.is_dirty
+
+    json_editor['a/c'] = 3
+    assert json_editor.save_file(only_if_dirty=True)
+    assert not json_editor.is_dirty
+    assert json_editor.write_stats['written'] == 1
+    assert json.loads((tmp_path / 'data.json').read_text()) == {'a': {'b': 1, 'c': 3}}
+
+
+def test_exit_writes_only_changes(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('{"a": 1}')
+    mtime = file_path.stat().st_mtime_ns
+    with JsonEditor(str(file_path)) as json_editor:
+        json_editor['a']
+    assert file_path.read_text() == '{"a": 1}' and file_path.stat().st_mtime_ns == mtime
+
+    with JsonEditor(str(file_path)) as json_editor:
+        json_editor['b'] = 2
+    assert json.loads(file_path.read_text()) == {'a': 1, 'b': 2}
+
+
+class CountingBackend(StdlibBackend):
+    def __init__(self):
+        self.dumps_amnt = 0
+
+    def dumps(self, *args, **kwargs):
+        self.dumps_amnt += 1
+        return super().dumps(*args, **kwargs)
+
+
+def test_read_only_editor_does_not_serialize(tmp_path):
+    backend = CountingBackend()
+    json_editor = make_editor(tmp_path, {'a': {'b': 1}}, backend=backend)
+    assert json_editor['a/b'] == 1
+    assert not json_editor.is_dirty and not json_editor.save_file(only_if_dirty=True)
+    assert backend.dumps_amnt == 0
+
+    # Once a dict is handed out, it may have been changed
+    json_editor['a']['b'] = 1
+    assert json_editor.is_dirty
+    assert json_editor.save_file(only_if_dirty=True)
+    assert not json_editor.is_dirty
+
+
+def test_save_serializes_once(tmp_path):
+    backend = CountingBackend()
+    json_editor = make_editor(tmp_path, {'a': 1}, backend=backend)
+    json_editor['a'] = 2
+    backend.dumps_amnt = 0
+    assert json_editor.save_file()
+    assert backend.dumps_amnt == 1
+    assert json.loads((tmp_path / 'data.json').read_text()) == {'a': 2}
+
+
+def test_journal_round_trip_and_compaction(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps({'a': 1, 'list': [], 'pad': 'x' * 200}))
+    journal_path = tmp_path / 'data.json.journal'
+
+    with JsonEditor(str(file_path), journal=True) as json_editor:
+        json_editor['b/c'] = 2
+        json_editor.append('list', 3)
+        del json_editor['a']
+    assert json_editor.write_stats['journaled'] == 1 and json_editor.write_stats['written'] == 0
+    assert json.loads(file_path.read_text())['a'] == 1
+    assert journal_path.exists()
+
+    expected = {'list': [3], 'pad': 'x' * 200, 'b': {'c': 2}}
+    json_editor = JsonEditor(str(file_path), journal=True, journal_compact_size=10)
+    assert json_editor.b_json_data.dict() == expected
+
+    # The journal grows past its compact size, and is folded into the json file
+    json_editor['d'] = 4
+    assert json_editor.save_file()
+    assert not journal_path.exists()
+    assert json.loads(file_path.read_text()) == {**expected, 'd': 4}
+
+
+def test_journal_saves_direct_changes(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps({'a': {'b': 1}}))
+    with JsonEditor(str(file_path), journal=True) as json_editor:
+        assert not json_editor.is_dirty
+        json_editor['a']['b'] = 2
+        assert json_editor.is_dirty
+    assert json_editor.write_stats['written'] == 1
+    assert json.loads(file_path.read_text()) == {'a': {'b': 2}}
+    assert not (tmp_path / 'data.json.journal').exists()
+    assert JsonEditor(str(file_path), journal=True, exit_write=False)['a/b'] == 2
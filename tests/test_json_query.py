@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from py_basic_commands.json_scripts.json_editor import JsonEditor
+from py_basic_commands.json_scripts.json_query  import compile_query
+
+
+DATA = {
+    'users': {
+        'a': {'name': 'Ann', 'email': 'ann@example.com', 'age': 30, 'tags': ['x']},
+        'b': {'name': 'Bob', 'age': 'unknown'},
+        'c': {'name': 'Cid', 'email': None, 'age': 25, 'address': {'city': 'Oslo'}},
+    },
+    'items': [{'id': 1, 'price': 5}, {'id': 2, 'price': 15}, {'id': 3, 'price': 20.5}],
+    'numbers': [3, 1, 2],
+}
+
+
+@pytest.mark.parametrize('query, paths', [
+    ('', ['']),
+    ('users/a/name', ['users/a/name']),
+    ('users/x/name', []),
+    ('items[1]/id', ['items[1]/id']),
+    ('items[-1]/id', ['items[2]/id']),
+    ('items[3]', []),
+    ('users/*/email', ['users/a/email', 'users/c/email']),
+    ('items[*]/price', ['items[0]/price', 'items[1]/price', 'items[2]/price']),
+    ('*/c/name', ['users/c/name']),
+    ('**/city', ['users/c/address/city']),
+    ('users/**/tags[0]', ['users/a/tags[0]']),
+    ('items[?price>10]', ['items[1]', 'items[2]']),
+    ('items[?price<=5]/id', ['items[0]/id']),
+    ('items[?id!=2]', ['items[0]', 'items[2]']),
+    ("users[?name=='Bob']", ['users/b']),
+    ('users[?name=="Bob"]', ['users/b']),
+    ('users[?age>=26]', ['users/a']),
+    ('users[?email]', ['users/a', 'users/c']),
+    ('users[?email==null]', ['users/c']),
+    ('users[?address/city==\'Oslo\']', ['users/c']),
+    ('numbers[?@>1]', ['numbers[0]', 'numbers[2]']),
+    ('users[?name=="Ann"][?@==30]', ['users/a/age']),
+])
+def test_query_paths(query, paths):
+    assert compile_query(query).paths(DATA) == paths
+
+
+def test_values_and_items():
+    query = compile_query('items[?price>10]/id')
+    assert query.values(DATA) == [2, 3]
+    assert query.items(DATA) == [('items[1]/id', 2), ('items[2]/id', 3)]
+    assert compile_query('**/email').values(DATA) == ['ann@example.com', None]
+
+
+def test_projection():
+    assert compile_query('users/*/{name,email}').values(DATA) == [
+        {'name': 'Ann', 'email': 'ann@example.com'},
+        {'name': 'Bob'},
+        {'name': 'Cid', 'email': None},
+    ]
+    assert compile_query('users[?age<28]/{name, address/city}').values(DATA) == [{'name': 'Cid', 'address/city': 'Oslo'}]
+    # The projected values keep the keypaths of the dicts they come from
+    assert compile_query('items[?id==1]/{id}').paths(DATA) == ['items[0]']
+
+
+def test_compiled_once():
+    assert compile_query('users/*/email') is compile_query('users/*/email')
+
+
+@pytest.mark.parametrize('query', ['users[', 'users/{name', "users[?name=='x]", 'items[x]', 'a//b', 'users[?>1]', 'items[?price>x]', '{}'])
+def test_invalid_queries(query):
+    with pytest.raises(ValueError):
+        compile_query(query)
+
+
+def test_editor_query_hands_out_values(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps({'a': {'b': 1}, 'c': [{'d': 7}]}))
+    json_editor = JsonEditor(str(file_path), exit_write=False)
+    assert json_editor.query_paths('c[?d==7]') == ['c[0]']
+    assert not json_editor.does_key_exists('new')
+    assert json_editor.find_value_path_all(8) == []
+
+    # The results are the editor's data, changes to them are noticed
+    json_editor.query('a')[0]['new'] = 8
+    assert json_editor.does_key_exists('new')
+    assert json_editor.find_value_path_all(8) == ['a/new']
+    assert json_editor.is_dirty
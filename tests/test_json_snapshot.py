@@ -0,0 +1,69 @@
+import json
+import os
+
+from py_basic_commands.json_scripts.json_editor     import JsonEditor
+from py_basic_commands.json_scripts.json_snapshot   import load_snapshot, remove_snapshot, snapshot_path, write_snapshot
+
+
+def test_snapshot_round_trip(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    data = {'a': [1, 2.5, None, True, 'ä'], 'b': {}}
+    with open(file_path, 'w') as f:
+        json.dump(data, f)
+    assert write_snapshot(file_path, data)
+    assert load_snapshot(file_path) == (True, data)
+
+    remove_snapshot(file_path)
+    assert load_snapshot(file_path) == (False, None)
+    remove_snapshot(file_path)
+
+
+def test_changed_json_file_invalidates(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    with open(file_path, 'w') as f:
+        f.write('{"a": 1}')
+    write_snapshot(file_path, {'a': 1})
+
+    # Same size and modification time, other content
+    stat = os.stat(file_path)
+    with open(file_path, 'w') as f:
+        f.write('{"a": 2}')
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_snapshot(file_path) == (False, None)
+
+
+def test_broken_snapshots_are_ignored(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    with open(file_path, 'w') as f:
+        f.write('{"a": 1}')
+    write_snapshot(file_path, {'a': 1})
+    with open(snapshot_path(file_path), 'rb') as f:
+        blob = f.read()
+
+    for broken_blob in (b'', b'not a snapshot', blob[:-3]):
+        with open(snapshot_path(file_path), 'wb') as f:
+            f.write(broken_blob)
+        assert load_snapshot(file_path) == (False, None)
+
+    # Data that marshal can't write gets no snapshot
+    assert not write_snapshot(file_path, {'a': object()})
+
+
+def test_json_editor_snapshot(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    with open(file_path, 'w') as f:
+        f.write('{"a": 1}')
+
+    JsonEditor(file_path, snapshot=True, exit_write=False)
+    assert load_snapshot(file_path) == (True, (None, {'a': 1}))
+
+    with JsonEditor(file_path, snapshot=True) as json_editor:
+        assert json_editor['a'] == 1
+        json_editor['b'] = 2
+    found, (saved_hash, data) = load_snapshot(file_path)
+    assert found and saved_hash is not None and data == {'a': 1, 'b': 2}
+
+    # Another writer changes the json file, the snapshot doesn't match anymore
+    with open(file_path, 'w') as f:
+        f.write('{"c": 3}')
+    assert JsonEditor(file_path, snapshot=True, exit_write=False)() == {'c': 3}
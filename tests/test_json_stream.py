@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+from py_basic_commands.json_scripts.json_stream import JsonStream
+from py_basic_commands.json_scripts.read_json   import ReadJson
+
+
+DATA = {
+    'meta': {'version': 3, 'name': 'a "quoted" ] name'},
+    'records': [{'id': i, 'tags': ['a', {'b': [i]}], 'text': 'x\\yé'} for i in range(50)],
+    'empty': [],
+}
+
+read_json = ReadJson(do_print=False)
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps(DATA, indent=2), encoding='utf-8')
+    return str(file_path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_iter_array(json_file, chunk_size):
+    assert list(read_json.iter(json_file, keypath='records', chunk_size=chunk_size)) == DATA['records']
+
+
+def test_iter_object_and_nested_keypath(json_file):
+    assert list(read_json.iter(json_file)) == list(DATA.items())
+    assert list(read_json.iter(json_file, keypath='records[3]/tags')) == DATA['records'][3]['tags']
+    assert list(read_json.iter(json_file, keypath='empty')) == []
+
+
+def test_iter_missing_keypath_or_scalar_yields_nothing(json_file):
+    assert list(read_json.iter(json_file, keypath='nope')) == []
+    assert list(read_json.iter(json_file, keypath='meta/version')) == []
+
+
+def test_iter_creates_missing_file(tmp_path):
+    file_path = tmp_path / 'missing.json'
+    assert list(read_json.iter(str(file_path))) == []
+    assert json.loads(file_path.read_text()) == {}
+
+
+def test_keypaths(json_file):
+    found = read_json(json_file, keypaths=['meta/version', 'records[10]/tags[1]/b', 'nope'])
+    assert found == {'meta/version': 3, 'records[10]/tags[1]/b': [10]}
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1 << 16])
+def test_stream_read_and_skip(chunk_size):
+    text = json.dumps(DATA)
+    stream = JsonStream(io.StringIO(text), chunk_size)
+    assert stream.read_value() == DATA
+
+    stream = JsonStream(io.StringIO(text), chunk_size)
+    assert stream.seek(('records', 49, 'text'))
+    assert stream.read_value() == DATA['records'][49]['text']
+
+
+def test_stream_invalid_json():
+    stream = JsonStream(io.StringIO('[1, 2,'))
+    with pytest.raises(json.JSONDecodeError):
+        list(stream.iter_container())
@@ -0,0 +1,64 @@
+import pytest
+
+from py_basic_commands.json_scripts.append_jsonl    import AppendJsonl
+from py_basic_commands.json_scripts.json_backend    import json_backends
+from py_basic_commands.json_scripts.read_jsonl      import ReadJsonl
+from py_basic_commands.json_scripts.write_jsonl     import WriteJsonl
+
+
+append_jsonl = AppendJsonl(do_print=False)
+read_jsonl = ReadJsonl(do_print=False)
+write_jsonl = WriteJsonl(do_print=False)
+
+RECORDS = [{'id': i, 'name': f'ü {i}', 'tags': ['a'] * (i % 3)} for i in range(25)]
+
+
+@pytest.mark.parametrize('backend', json_backends())
+@pytest.mark.parametrize('batch_size', [1, 7, 1000])
+def test_write_and_read(tmp_path, backend, batch_size):
+    file_path = str(tmp_path / 'data.jsonl')
+    assert write_jsonl(iter(RECORDS), file_path, batch_size=batch_size, backend=backend) == len(RECORDS)
+    assert list(read_jsonl(file_path, backend=backend)) == RECORDS
+
+    # Existing data is kept without force
+    assert write_jsonl([{}], file_path) == 0
+    assert write_jsonl([{}], file_path, force=True) == 1
+    assert list(read_jsonl(file_path)) == [{}]
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'latin-1', 'cp1252'])
+def test_encodings(tmp_path, encoding):
+    file_path = str(tmp_path / 'data.jsonl')
+    assert append_jsonl(RECORDS, file_path, encoding=encoding) == len(RECORDS)
+    assert list(read_jsonl(file_path, encoding=encoding)) == RECORDS
+
+
+def test_append_to_unfinished_line(tmp_path):
+    file_path = tmp_path / 'data.jsonl'
+    file_path.write_bytes(b'{"id": -1}')
+    assert append_jsonl(RECORDS[0], str(file_path)) == 1
+    assert append_jsonl(RECORDS[1:], str(file_path), batch_size=2) == len(RECORDS) - 1
+    assert list(read_jsonl(str(file_path))) == [{'id': -1}] + RECORDS
+
+
+def test_offsets_and_bad_lines(tmp_path):
+    file_path = tmp_path / 'data.jsonl'
+    file_path.write_bytes(b'{"a": 1}\n\nnot json\n{"a": 2}\n')
+    pairs = list(read_jsonl(str(file_path), ret_offset=True))
+    assert [record for _, record in pairs] == [{'a': 1}, {'a': 2}]
+
+    # Reading can go on from an offset
+    assert list(read_jsonl(str(file_path), pairs[0][0])) == [{'a': 2}]
+    assert list(read_jsonl(str(file_path), pairs[-1][0])) == []
+
+
+def test_unserializable_record(tmp_path):
+    file_path = tmp_path / 'data.jsonl'
+    assert write_jsonl([{'a': 1}, {'a': object()}], str(file_path)) == 0
+    assert not file_path.exists()
+    assert append_jsonl([{'a': 1}, {'a': object()}], str(file_path), batch_size=1) == 1
+    assert list(read_jsonl(str(file_path))) == [{'a': 1}]
+
+
+def test_missing_file(tmp_path):
+    assert list(read_jsonl(str(tmp_path / 'missing.jsonl'))) == []
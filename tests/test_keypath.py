@@ -0,0 +1,34 @@
+import pytest
+
+from py_basic_commands.json_scripts.keypath import compile_keypath, get_keypath_value, join_keypath, split_keypath
+
+
+@pytest.mark.parametrize('keypath, parts', [
+    ('', ()),
+    ('a', ('a',)),
+    ('items[0]/id', ('items', 0, 'id')),
+    ('a[1][2]', ('a', 1, 2)),
+    ('a[-1]', ('a', -1)),
+    ("a['0']", ('a', 0)),
+    ('[0]/a', (0, 'a')),
+    ('a//b', ('a', '', 'b')),
+    ('a[x]', ('a[x]',)),
+    ('a[0]b', ('a[0]b',)),
+])
+def test_split_keypath(keypath, parts):
+    assert split_keypath(keypath) == parts
+    assert compile_keypath(keypath) == parts
+
+
+def test_separator_and_join():
+    assert split_keypath('a.b[0]', '.') == ('a', 'b', 0)
+    assert join_keypath(('items', 0, 'id')) == 'items[0]/id'
+    assert split_keypath(join_keypath(('a', 1, 'b', 2))) == ('a', 1, 'b', 2)
+
+
+def test_get_keypath_value():
+    data = {'a': [{'b': 1}, {'b': 2}]}
+    assert get_keypath_value(data, compile_keypath('a[-1]/b')) == 2
+    for keypath in ('a[2]', 'a/b', 'c'):
+        with pytest.raises(KeyError):
+            get_keypath_value(data, compile_keypath(keypath))
@@ -0,0 +1,70 @@
+import gzip
+import json
+
+import pytest
+
+from py_basic_commands.json_scripts.parallel_json   import _parse_range, iter_json_array, read_json_array, split_json_array
+from py_basic_commands.json_scripts.read_json       import read_json
+
+
+def write(file_path, data, **kwargs):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **kwargs)
+    return str(file_path)
+
+
+@pytest.mark.parametrize('indent', [None, 4])
+def test_split_and_read(tmp_path, indent):
+    data = [{'id': i, 'name': f'user {i}', 'tags': ['a', 'ä']} for i in range(2000)]
+    file_path = write(tmp_path / 'data.json', data, indent=indent)
+
+    ranges = split_json_array(file_path, 8)
+    assert len(ranges) == 8
+    items = []
+    for start, end in ranges:
+        parsed, chunk = _parse_range(file_path, start, end, 'json', None)
+        assert parsed
+        items.extend(chunk)
+    assert items == data
+
+    assert read_json_array(file_path, workers=2, chunk_bytes=1 << 12) == data
+    assert sum(iter_json_array(file_path, workers=2, chunk_bytes=1 << 12, func=len)) == len(data)
+
+
+def test_misguessed_boundary(tmp_path):
+    # The boundary is learned from the first two records (`},{"id":`), which is also between the items of `sub`
+    data = [{'id': i, 'sub': [{'id': k} for k in range(200)]} for i in range(40)]
+    file_path = write(tmp_path / 'data.json', data, separators=(',', ':'))
+
+    ranges = split_json_array(file_path, 16)
+    assert not all(_parse_range(file_path, start, end, 'json', None)[0] for start, end in ranges)
+    assert read_json_array(file_path, workers=2, chunk_bytes=1 << 10) == data
+    assert sum(iter_json_array(file_path, workers=2, chunk_bytes=1 << 10, func=len)) == len(data)
+
+
+def test_not_an_array(tmp_path):
+    file_path = write(tmp_path / 'data.json', {'a': [1, 2]})
+    with pytest.raises(ValueError):
+        split_json_array(file_path, 4)
+    with pytest.raises(ValueError):
+        read_json_array(file_path, workers=2)
+    # read_json() parses it in this process
+    assert read_json(file_path, workers=2, do_print=False) == {'a': [1, 2]}
+
+
+def test_invalid_json(tmp_path):
+    file_path = tmp_path / 'data.json'
+    text = json.dumps([{'id': i, 'name': f'user {i}'} for i in range(2000)])
+    comma = text.index('}, {', len(text) // 2) + 1
+    file_path.write_text(text[:comma] + '?' + text[comma:])
+    with pytest.raises(ValueError):
+        read_json_array(str(file_path), workers=2, chunk_bytes=1 << 12)
+
+
+def test_compressed_file(tmp_path):
+    data = [{'id': i} for i in range(100)]
+    file_path = str(tmp_path / 'data.json.gz')
+    with gzip.open(file_path, 'wt', encoding='utf-8') as f:
+        json.dump(data, f)
+    assert read_json_array(file_path, workers=2) == data
+    assert read_json(file_path, workers=2, do_print=False) == data
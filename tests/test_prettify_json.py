@@ -0,0 +1,60 @@
+import gzip
+import json
+
+import pytest
+
+from py_basic_commands.json_scripts.prettify_json   import prettify_json, prettify_json_tree
+
+
+DATA = {'a': [1, 2.5, {'b': 'ä', 'c': []}], 'd': {}, 'e': '1e+16'}
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_prettify_layout(tmp_path, stream):
+    file_path = str(tmp_path / 'data.json')
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(DATA, f, separators=(',', ':'), ensure_ascii=False)
+
+    assert prettify_json(file_path, do_print=False, stream=stream)
+    with open(file_path, encoding='utf-8') as f:
+        assert f.read() == json.dumps(DATA, indent=4, ensure_ascii=False)
+
+    assert prettify_json(file_path, indent=None, do_print=False, stream=stream)
+    with open(file_path, encoding='utf-8') as f:
+        assert json.load(f) == DATA
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_invalid_file_is_left_alone(tmp_path, stream):
+    file_path = str(tmp_path / 'data.json')
+    with open(file_path, 'w') as f:
+        f.write('{"a": [1, 2}')
+
+    assert not prettify_json(file_path, do_print=False, stream=stream)
+    with open(file_path) as f:
+        assert f.read() == '{"a": [1, 2}'
+    assert [path.name for path in tmp_path.iterdir()] == ['data.json']
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_compressed_file(tmp_path, stream):
+    file_path = str(tmp_path / 'data.json.gz')
+    with gzip.open(file_path, 'wt', encoding='utf-8') as f:
+        json.dump(DATA, f, ensure_ascii=False)
+
+    assert prettify_json(file_path, do_print=False, stream=stream)
+    with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+        assert f.read() == json.dumps(DATA, indent=4, ensure_ascii=False)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_tree_forwards_backend_and_compression(tmp_path, workers):
+    for i in range(3):
+        with gzip.open(tmp_path / f'file_{i}.json.gz', 'wt', encoding='utf-8') as f:
+            json.dump({'id': i}, f)
+    (tmp_path / 'other.txt').write_text('not json')
+
+    stats = prettify_json_tree(str(tmp_path), indent=2, workers=workers, do_print=False, suffix='.json.gz', backend='json', compression='gzip')
+    assert (stats['files'], stats['prettified'], stats['failed']) == (3, 3, 0)
+    with gzip.open(tmp_path / 'file_1.json.gz', 'rt', encoding='utf-8') as f:
+        assert f.read() == '{\n  "id": 1\n}'
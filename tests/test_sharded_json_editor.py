@@ -0,0 +1,76 @@
+import json
+import os
+
+from zlib import crc32
+
+import pytest
+
+from py_basic_commands.json_scripts.sharded_json_editor import ShardedJsonEditor
+
+
+KEYS = ['plain', 'with space', 'ä%?', '']
+
+
+def test_file_per_key(tmp_path):
+    dir_path = str(tmp_path / 'store')
+    with ShardedJsonEditor(dir_path) as store:
+        for i, key in enumerate(KEYS):
+            store[f'{key}/value'] = i
+        store.append('plain/list', 1)
+
+    # Keys are quoted into file names; the empty key is `.json`
+    assert sorted(os.listdir(dir_path)) == sorted(['_shards.meta', 'plain.json', 'with%20space.json', '%C3%A4%25%3F.json', '.json'])
+    with open(os.path.join(dir_path, '.json')) as f:
+        assert json.load(f) == {'': {'value': 3}}
+
+    store = ShardedJsonEditor(dir_path)
+    assert sorted(store.keys()) == sorted(KEYS)
+    assert store.loaded_shards == 0
+    assert [store[f'{key}/value'] for key in KEYS] == [0, 1, 2, 3]
+    assert store['plain/list'] == [1]
+    assert store.loaded_shards == len(KEYS)
+    assert store['missing/value'] is None and 'missing' not in store and '' not in store
+
+
+def test_hash_buckets(tmp_path):
+    dir_path = str(tmp_path / 'store')
+    with ShardedJsonEditor(dir_path, shards=4) as store:
+        for i in range(20):
+            store[f'key_{i}'] = i
+
+    for i in range(20):
+        with open(os.path.join(dir_path, f'shard-{crc32(f"key_{i}".encode()) % 4:04d}.json')) as f:
+            assert json.load(f)[f'key_{i}'] == i
+
+    # The layout is kept
+    store = ShardedJsonEditor(dir_path)
+    assert store.shards == 4 and store['key_3'] == 3 and store.loaded_shards == 1
+    assert len(store) == 20
+    with pytest.raises(ValueError):
+        ShardedJsonEditor(dir_path, shards=8)
+    with pytest.raises(ValueError):
+        ShardedJsonEditor(str(tmp_path / 'other'), shards=0)
+
+
+def test_only_changed_shards_are_written(tmp_path):
+    dir_path = str(tmp_path / 'store')
+    with ShardedJsonEditor(dir_path) as store:
+        store['a'] = {'b': 1}
+        store['c'] = {'d': 1}
+
+    store = ShardedJsonEditor(dir_path, exit_write=False)
+    assert store['a/b'] == 1 and store['c/d'] == 1
+    assert not store.is_dirty and store.save_file() == 0
+    store['a/b'] = 2
+    assert store.is_dirty and store.save_file() == 1
+
+    # A shard left without keys is removed
+    del store['c']
+    with pytest.raises(KeyError):
+        del store['c']
+    assert store.save_file() == 1
+    assert sorted(os.listdir(dir_path)) == ['_shards.meta', 'a.json']
+    assert ShardedJsonEditor(dir_path).keys() == ['a']
+
+    with pytest.raises(KeyError):
+        store[''] = 1
@@ -0,0 +1,92 @@
+import gzip
+import json
+import os
+import stat
+
+import pytest
+
+from py_basic_commands.file_dir_scripts.atomic_write    import atomic_open
+from py_basic_commands.json_scripts.write_json          import WriteJson
+
+
+write_json = WriteJson(do_print=False)
+
+
+@pytest.mark.parametrize('text', ['', '{}', ' [ ] ', 'null', '0', 'false', '""', 'not json', '{"a": 1', 'x' * 10_000])
+def test_overwrites_files_without_data(tmp_path, text):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(text)
+    assert write_json({'new': 1}, str(file_path))
+    assert json.loads(file_path.read_text()) == {'new': 1}
+
+
+@pytest.mark.parametrize('data', [{'a': 1}, [0], 1, 'text', {'big': 'x' * 10_000}])
+def test_keeps_files_with_data(tmp_path, data):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(json.dumps(data))
+    assert not write_json({'new': 1}, str(file_path))
+    assert json.loads(file_path.read_text()) == data
+    assert write_json({'new': 1}, str(file_path), force=True)
+    assert json.loads(file_path.read_text()) == {'new': 1}
+
+
+@pytest.mark.parametrize('file_name', ['data.json', 'data.json.gz'])
+@pytest.mark.parametrize('text, has_data', [
+    ('{"a": "' + 'x' * 100_000 + '"}', True),
+    ('[' + '1, ' * 50_000 + '1]', True),
+    ('"' + 'x' * 100_000 + '"', True),
+    ('[' + ' ' * 100_000 + ']', False),
+    ('x' * 100_000, False),
+    ('{"a": "' + 'x' * 100_000, False),
+])
+def test_big_files(tmp_path, file_name, text, has_data):
+    # Big files are checked from their start and end, and only parsed if that doesn't tell
+    file_path = tmp_path / file_name
+    with gzip.open(file_path, 'wt') if file_name.endswith('.gz') else open(file_path, 'w') as f:
+        f.write(text)
+    assert write_json({'new': 1}, str(file_path)) != has_data
+
+
+def test_missing_file_and_dirs(tmp_path):
+    file_path = tmp_path / 'a' / 'b' / 'data.json'
+    assert write_json([1, 2], str(file_path), force=True)
+    assert json.loads(file_path.read_text()) == [1, 2]
+
+
+def test_unserializable_data_leaves_file(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('{"a": 1}')
+    assert not write_json({'a': object()}, str(file_path), force=True)
+    assert file_path.read_text() == '{"a": 1}'
+    assert os.listdir(tmp_path) == ['data.json']
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX permissions')
+def test_atomic_open_permissions(tmp_path):
+    umask = os.umask(0o027)
+    try:
+        new_path = tmp_path / 'new.txt'
+        with atomic_open(str(new_path)) as f:
+            f.write('new')
+        assert stat.S_IMODE(os.stat(new_path).st_mode) == 0o640
+
+        old_path = tmp_path / 'old.txt'
+        old_path.write_text('old')
+        os.chmod(old_path, 0o604)
+        with atomic_open(str(old_path)) as f:
+            f.write('new')
+        assert stat.S_IMODE(os.stat(old_path).st_mode) == 0o604
+        assert old_path.read_text() == 'new'
+    finally:
+        os.umask(umask)
+
+
+def test_atomic_open_error_keeps_original(tmp_path):
+    file_path = tmp_path / 'data.txt'
+    file_path.write_text('old')
+    with pytest.raises(RuntimeError):
+        with atomic_open(str(file_path)) as f:
+            f.write('new')
+            raise RuntimeError
+    assert file_path.read_text() == 'old'
+    assert os.listdir(tmp_path) == ['data.txt']
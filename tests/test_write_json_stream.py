@@ -0,0 +1,79 @@
+import gzip
+import json
+
+import pytest
+
+from py_basic_commands.json_scripts.json_backend        import json_backends
+from py_basic_commands.json_scripts.write_json          import write_json
+from py_basic_commands.json_scripts.write_json_stream   import write_json_stream
+
+
+ITEMS = [{'id': 1, 'name': 'ä', 'tags': ['a', {'b': []}], 'empty': {}}, [1, [2, 3]], 'line\nbreak', None, 2.5]
+
+
+@pytest.mark.parametrize('backend', json_backends())
+@pytest.mark.parametrize('indent', [4, 2, None])
+@pytest.mark.parametrize('batch_size', [1, 2, 1000])
+def test_same_as_write_json(tmp_path, backend, indent, batch_size):
+    stream_path = str(tmp_path / 'stream.json')
+    list_path = str(tmp_path / 'list.json')
+    assert write_json_stream(iter(ITEMS), stream_path, indent=indent, batch_size=batch_size, backend=backend, do_print=False) == len(ITEMS)
+    write_json(ITEMS, list_path, indent=indent, backend=backend, do_print=False)
+    with open(stream_path, encoding='utf-8') as f_stream, open(list_path, encoding='utf-8') as f_list:
+        assert f_stream.read() == f_list.read()
+
+
+@pytest.mark.parametrize('indent', [4, None])
+def test_empty(tmp_path, indent):
+    file_path = tmp_path / 'data.json'
+    assert write_json_stream(iter([]), str(file_path), indent=indent, do_print=False) == 0
+    assert file_path.read_text() == '[]'
+
+
+def test_items_are_made_while_writing(tmp_path):
+    made = []
+
+    def make_items():
+        for i in range(10):
+            made.append(i)
+            yield {'id': i}
+
+    file_path = tmp_path / 'data.json'
+    assert write_json_stream(make_items(), str(file_path), batch_size=3, do_print=False) == 10
+    assert made == list(range(10))
+    assert json.loads(file_path.read_text()) == [{'id': i} for i in range(10)]
+
+
+def test_existing_data_and_force(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('{"a": 1}')
+    assert write_json_stream([1, 2], str(file_path), do_print=False) == 0
+    assert file_path.read_text() == '{"a": 1}'
+    assert write_json_stream([1, 2], str(file_path), force=True, do_print=False) == 2
+    assert json.loads(file_path.read_text()) == [1, 2]
+
+
+def test_unserializable_item_leaves_file(tmp_path):
+    file_path = tmp_path / 'data.json'
+    file_path.write_text('[1]')
+    assert write_json_stream([2, object()], str(file_path), force=True, batch_size=1, do_print=False) == 0
+    assert file_path.read_text() == '[1]'
+    assert [path.name for path in tmp_path.iterdir()] == ['data.json']
+
+
+def test_creates_dirs_with_force(tmp_path):
+    file_path = tmp_path / 'a' / 'b' / 'data.json'
+    assert write_json_stream((i for i in range(3)), str(file_path), force=True, do_print=False) == 3
+    assert json.loads(file_path.read_text()) == [0, 1, 2]
+
+
+def test_compression_and_encoding(tmp_path):
+    file_path = str(tmp_path / 'data.json.gz')
+    assert write_json_stream(ITEMS, file_path, do_print=False) == len(ITEMS)
+    with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+        assert json.load(f) == ITEMS
+
+    # Characters the encoding can't represent are escaped
+    ascii_path = tmp_path / 'ascii.json'
+    assert write_json_stream(['ä'], str(ascii_path), encoding='ascii', do_print=False) == 1
+    assert ascii_path.read_text(encoding='ascii') == '[\n    "\\u00e4"\n]'